@@ -0,0 +1,101 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.config import ClientConfig
+from thbase.hbase.ttypes import TIOError
+from thbase.thrift2.batch import BatchResult, OperationStatus
+from thbase.thrift2.client import Client
+from thbase.thrift2.operation import Delete, Get, Put
+from thbase.thrift2.server import MemoryHandler, LocalServer
+from thbase.util.executor import FixedRetryPolicy
+import pytest
+
+
+class _FailingHandler(MemoryHandler):
+    """
+    Fail the putMultiple requests carrying the bad row while failing is set.
+    """
+    def __init__(self, bad_row):
+        super(_FailingHandler, self).__init__()
+        self.bad_row = bad_row
+        self.failing = True
+
+    def putMultiple(self, table, tputs):
+        if self.failing and any(tput.row == self.bad_row for tput in tputs):
+            raise TIOError(message='Injected failure', canRetry=True)
+        return super(_FailingHandler, self).putMultiple(table, tputs)
+
+
+@pytest.fixture
+def server():
+    server = LocalServer(_FailingHandler(b'r15')).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def table(server):
+    client = Client(ClientConfig(thrift_host=server.host, port=server.port, batch_size=10,
+                                 retry_policy=FixedRetryPolicy(2, 0)))
+    client.open_connection()
+    yield client.get_table('t')
+    client.close_connection()
+
+
+def _puts(count):
+    return [Put(row='r%02d' % i, family='f', qualifier='q', value=str(i)) for i in range(count)]
+
+
+def test_batch_result_statuses():
+    batch = BatchResult(_puts(4))
+    assert batch.not_attempted == [0, 1, 2, 3] and not batch
+    error = TIOError(message='failed')
+    batch.set([0, 1], OperationStatus.SUCCESS)
+    batch.set([2], OperationStatus.FAILED, error)
+    assert (batch.succeeded, batch.failed, batch.not_attempted) == ([0, 1], [2], [3])
+    assert batch.errors == [None, None, error, None]
+    assert [op.row for op in batch.unfinished_operations()] == [b'r02', b'r03']
+    assert str(batch) == 'BatchResult of 4 operations: 2 succeeded, 1 failed, 1 not attempted'
+    with pytest.raises(RuntimeError):
+        batch.retry()
+    batch.set([2, 3], OperationStatus.SUCCESS)
+    assert batch.success and batch
+
+
+def test_partial_batch_failure(table):
+    batch = table.put_batch(_puts(30), detailed=True)
+    assert not batch
+    # the first request is applied, the second one fails and the third one is not sent.
+    assert batch.succeeded == list(range(10))
+    assert batch.failed == list(range(10, 20))
+    assert batch.not_attempted == list(range(20, 30))
+    assert all(isinstance(batch.errors[i], TIOError) for i in batch.failed)
+    assert table.get(Get(row='r05')) and not table.get(Get(row='r15')) and not table.get(Get(row='r25'))
+
+
+def test_retry_sends_unfinished_operations(server, table):
+    batch = table.put_batch(_puts(30), detailed=True)
+    server.handler.failing = False
+    retried = batch.retry()
+    assert retried.success
+    assert [op.row for op in retried.operations] == [b'r%02d' % i for i in range(10, 30)]
+    assert all(table.get(Get(row=op.row)) for op in _puts(30))
+
+
+def test_detailed_get_and_delete_batch(table):
+    assert table.put_batch(_puts(5))
+    batch = table.get_batch([Get(row='r01'), Get(row='zz')], detailed=True)
+    assert batch.success
+    assert [cell.value for cell in batch.results[0]] == [b'1'] and batch.results[1] == []
+    assert table.delete_batch([Delete(row='r01'), Delete(row='r02')], detailed=True).success
+    assert not table.get(Get(row='r01'))
@@ -0,0 +1,150 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.balancer import LoadBalancer
+from thbase.config import ClientConfig, LoadBalance
+from thbase.hbase.ttypes import TIOError
+from thbase.thrift2.client import Client
+from thbase.thrift2.operation import Put
+from thbase.thrift2.server import MemoryHandler, LocalServer
+from thbase.util.breaker import BreakerState, CircuitBreaker, CircuitOpenError
+from thrift.transport.TTransport import TTransportException
+import pytest
+import threading
+import time
+
+COOLDOWN = 0.05
+
+
+def _open_breaker():
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=COOLDOWN)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    return breaker
+
+
+def _check_from_other_thread(breaker):
+    errors = []
+
+    def check():
+        try:
+            breaker.check()
+        except CircuitOpenError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=check)
+    thread.start()
+    thread.join()
+    return errors
+
+
+def test_breaker_opens_at_failure_rate():
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=COOLDOWN)
+    breaker.record_success()
+    breaker.record_failure()
+    # the rate of failures is checked when a failure is recorded, and reaches 0.5 of the 2 outcomes.
+    assert breaker.state == BreakerState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_breaker_stays_closed_under_failure_rate():
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=COOLDOWN)
+    breaker.record_failure()
+    # a single outcome is less than min_calls.
+    assert breaker.state == BreakerState.CLOSED
+    for _ in range(10):
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED
+    breaker.check()
+
+
+def test_half_open_probe_closes_the_breaker():
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN * 2)
+    breaker.check()
+    assert breaker.state == BreakerState.HALF_OPEN
+    # only the probing thread is let through.
+    assert len(_check_from_other_thread(breaker)) == 1
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert _check_from_other_thread(breaker) == []
+
+
+def test_failed_probe_opens_the_breaker_again():
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN * 2)
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_record_error_counts_lost_requests_only():
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=COOLDOWN)
+    for _ in range(4):
+        # a closed local transport and an error answered by the server do not mean the server is down.
+        breaker.record_error(TTransportException(type=TTransportException.NOT_OPEN))
+        breaker.record_error(TIOError(message='failed'))
+    assert breaker.state == BreakerState.CLOSED
+    breaker.record_error(TTransportException(type=TTransportException.END_OF_FILE))
+    breaker.record_error(TTransportException(type=TTransportException.TIMED_OUT))
+    assert breaker.state == BreakerState.OPEN
+
+
+def test_clone_has_the_settings_but_not_the_state():
+    breaker = _open_breaker()
+    clone = breaker.clone()
+    assert clone.state == BreakerState.CLOSED
+    assert (clone.failure_rate, clone.window_size, clone.min_calls, clone.cooldown) == (0.5, 4, 2, COOLDOWN)
+
+
+def test_balancer_gives_each_endpoint_its_own_breaker():
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=60)
+    balancer = LoadBalancer([('a', 1), ('b', 1)], breaker=breaker)
+    added = balancer.add('c', 1)
+    breakers = [endpoint.breaker for endpoint in balancer.endpoints]
+    assert len(set(map(id, breakers + [breaker]))) == 4
+    assert added.breaker is breakers[2]
+    breakers[0].record_failure()
+    breakers[0].record_failure()
+    assert [b.state for b in breakers] == [BreakerState.OPEN, BreakerState.CLOSED, BreakerState.CLOSED]
+    assert breaker.state == BreakerState.CLOSED
+    assert LoadBalancer([('a', 1)]).endpoints[0].breaker is None
+
+
+def test_pooled_client_skips_server_with_open_breaker():
+    servers = [LocalServer(MemoryHandler()).start() for _ in range(2)]
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=2, cooldown=60)
+    client = Client(ClientConfig(endpoints=[(s.host, s.port) for s in servers], use_pool=True,
+                                 circuit_breaker=breaker, load_balance=LoadBalance.ROUND_ROBIN,
+                                 eject_failures=100, retry_timeout=1))
+    try:
+        table = client.get_table('t')
+        servers[0].stop()
+        client.pool.close()
+        assert all(table.put(Put(row='r%d' % i, family='f', qualifier='q', value='v')) for i in range(6))
+        down, up = client.balancer.endpoints
+        assert down.breaker.state == BreakerState.OPEN
+        assert up.breaker.state == BreakerState.CLOSED
+        assert breaker.state == BreakerState.CLOSED
+        assert servers[1].handler.calls['put'] == 6
+    finally:
+        client.close_connection()
+        for server in servers:
+            server.stop()
@@ -0,0 +1,38 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.config import ClientConfig
+import pytest
+
+
+def test_default_config_is_valid():
+    ClientConfig()
+    ClientConfig(endpoints=['a:9090', ('b', 9091)])
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(transport_type='bogus'),
+    dict(protocol_type=42),
+    dict(authentication='x'),
+    dict(pool_idle_timeout=-5),
+    dict(load_balance='random'),
+    dict(batch_strategy='size'),
+    dict(port=70000),
+    dict(endpoints=['host']),
+    dict(endpoints=[]),
+    dict(region_routing=True),
+    dict(value_views=True, direct_decode=False),
+])
+def test_invalid_parameters_raise(kwargs):
+    with pytest.raises(ValueError):
+        ClientConfig(**kwargs)
@@ -0,0 +1,139 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.config import ClientConfig, LoadBalance
+from thbase.hbase.ttypes import TIllegalArgument, TResult
+from thbase.thrift2.aio import AsyncClient
+from thbase.thrift2.client import Client
+from thbase.thrift2.decoder import Result
+from thbase.thrift2.operation import Get, Put, Scan
+from thbase.thrift2.server import MemoryHandler, LocalServer
+import asyncio
+import pytest
+import threading
+import time
+
+ROWS = 20
+
+
+@pytest.fixture
+def servers():
+    # each server has its own handler, so a scanner only exists at the server which opened it.
+    servers = []
+    for _ in range(2):
+        handler = MemoryHandler()
+        handler.create_table('t', ['f'])
+        for i in range(ROWS):
+            handler.put(b't', Put(row='r%03d' % i, family='f', qualifier='q', value=str(i)).core)
+        servers.append(LocalServer(handler).start())
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def test_pooled_scan_over_two_servers(servers):
+    conf = ClientConfig(endpoints=[(s.host, s.port) for s in servers], use_pool=True,
+                        load_balance=LoadBalance.ROUND_ROBIN)
+    client = Client(conf)
+    table = client.get_table('t')
+    for _ in range(4):
+        assert len(list(table.scan_iter(Scan(), page_size=3))) == ROWS
+    assert len(list(table.parallel_scan(Scan(), page_size=3))) == ROWS
+    for server in servers:
+        calls = server.handler.calls
+        assert calls['openScanner'] > 0
+        assert calls['closeScanner'] == calls['openScanner']
+    client.close_connection()
+
+
+def test_pooled_scan_over_one_server(servers):
+    client = Client(ClientConfig(thrift_host=servers[0].host, port=servers[0].port, use_pool=True))
+    table = client.get_table('t')
+    assert len(list(table.scan_iter(Scan(), page_size=3))) == ROWS
+    assert len(list(table.parallel_scan(Scan(), page_size=3))) == ROWS
+    calls = servers[0].handler.calls
+    assert calls['openScanner'] > 0
+    assert calls['closeScanner'] == calls['openScanner']
+    client.close_connection()
+
+
+def test_async_scan_over_two_servers(servers):
+    async def scan():
+        client = AsyncClient(ClientConfig(endpoints=[(s.host, s.port) for s in servers]), connections=4)
+        table = client.get_table('t')
+        counts = []
+        for _ in range(4):
+            count = 0
+            async for _ in table.scan_iter(Scan(), page_size=3):
+                count += 1
+            counts.append(count)
+        client.close_connection()
+        return counts
+
+    assert asyncio.run(scan()) == [ROWS] * 4
+
+
+@pytest.mark.parametrize('use_pool', [False, True])
+def test_request_fails_over_when_server_dies(use_pool):
+    servers = [LocalServer(MemoryHandler(latency=0.5)).start() for _ in range(2)]
+    stopped = []
+
+    def stop_busy_server():
+        # stop the server the request is in flight at.
+        deadline = time.time() + 5
+        while not stopped and time.time() < deadline:
+            for server in servers:
+                if server.handler.calls['put']:
+                    server.stop()
+                    stopped.append(server)
+                    break
+            time.sleep(0.01)
+
+    client = Client(ClientConfig(endpoints=[(s.host, s.port) for s in servers], use_pool=use_pool,
+                                 retry_timeout=1))
+    client.open_connection()
+    killer = threading.Thread(target=stop_busy_server)
+    killer.start()
+    try:
+        table = client.get_table('t')
+        assert table.put(Put(row='r', family='f', qualifier='q', value='v'))
+        killer.join()
+        alive = [s for s in servers if s not in stopped]
+        assert len(alive) == 1 and alive[0].handler.calls['put'] == 1
+        assert table.get(Get(row='r'))
+    finally:
+        client.close_connection()
+        for server in servers:
+            server.stop()
+
+
+@pytest.mark.parametrize('direct_decode, result_class', [(False, TResult), (True, Result)])
+def test_direct_decode_is_opt_in(servers, direct_decode, result_class):
+    # the default config must keep returning the generated structs.
+    kwargs = {'direct_decode': True} if direct_decode else {}
+    client = Client(ClientConfig(thrift_host=servers[0].host, port=servers[0].port, **kwargs))
+    client.open_connection()
+    result = client.client.get(b't', Get(row='r001').core)
+    assert type(result) is result_class
+    assert [cell.value for cell in client.get_table('t').get(Get(row='r001'))] == [b'1']
+    client.close_connection()
+
+
+@pytest.mark.parametrize('value_views', [False, True])
+def test_invalid_scanner_id_raises_illegal_argument(servers, value_views):
+    client = Client(ClientConfig(thrift_host=servers[0].host, port=servers[0].port, direct_decode=True,
+                                 value_views=value_views))
+    client.open_connection()
+    with pytest.raises(TIllegalArgument):
+        client.client.getScannerRows(12345, 1)
+    client.close_connection()
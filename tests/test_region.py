@@ -0,0 +1,99 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.hbase.ttypes import THRegionInfo, THRegionLocation, TIOError, TServerName
+from thbase.thrift2.region import RegionLocationCache, is_region_moved
+import time
+
+
+def _location(start, end, host):
+    return THRegionLocation(serverName=TServerName(hostName=host, port=16020),
+                            regionInfo=THRegionInfo(regionId=0, tableName=b't', startKey=start, endKey=end))
+
+
+def _host(cache, row):
+    location = cache.locate(b't', row)
+    return location.serverName.hostName if location is not None else None
+
+
+def _loaded_cache(ttl=None):
+    cache = RegionLocationCache(ttl=ttl)
+    # loaded out of order, the cache sorts them by start key.
+    cache.load(b't', [_location(b'm', b'', 'h3'), _location(b'', b'g', 'h1'), _location(b'g', b'm', 'h2')])
+    return cache
+
+
+def test_locate_hits_the_region_of_the_row():
+    cache = _loaded_cache()
+    assert [_host(cache, row) for row in (b'', b'a', b'g', b'lzz', b'm', b'zzz')] == \
+        ['h1', 'h1', 'h2', 'h2', 'h3', 'h3']
+    assert b't' in cache and cache.is_loaded(b't')
+    assert [loc.regionInfo.startKey for loc in cache.locations(b't')] == [b'', b'g', b'm']
+
+
+def test_locate_misses_unknown_table():
+    cache = _loaded_cache()
+    assert cache.locate(b'other', b'a') is None
+    assert b'other' not in cache
+    assert cache.locations(b'other') is None
+
+
+def test_invalidate_drops_only_the_region_of_the_row():
+    cache = _loaded_cache()
+    cache.invalidate(b't', b'h')
+    assert [_host(cache, row) for row in (b'a', b'h', b'z')] == ['h1', None, 'h3']
+    # the table is cached but no longer complete.
+    assert b't' in cache and not cache.is_loaded(b't')
+    assert cache.locations(b't') is None
+
+
+def test_add_replaces_overlapping_regions():
+    cache = _loaded_cache()
+    cache.invalidate(b't', b'h')
+    cache.add(b't', _location(b'g', b'm', 'h4'))
+    assert [_host(cache, row) for row in (b'a', b'h', b'z')] == ['h1', 'h4', 'h3']
+    # a split region replaces the cached one.
+    cache.add(b't', _location(b'g', b'j', 'h5'))
+    assert [_host(cache, row) for row in (b'h', b'k')] == ['h5', None]
+    assert len(cache) == 3
+
+
+def test_add_to_empty_cache_is_partial():
+    cache = RegionLocationCache()
+    cache.add(b't', _location(b'g', b'm', 'h2'))
+    assert [_host(cache, row) for row in (b'a', b'h', b'z')] == [None, 'h2', None]
+    assert not cache.is_loaded(b't')
+
+
+def test_invalidate_table_and_whole_cache():
+    cache = _loaded_cache()
+    cache.load(b'u', [_location(b'', b'', 'h9')])
+    cache.invalidate(b't')
+    assert b't' not in cache and b'u' in cache
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_regions_expire_after_ttl():
+    cache = _loaded_cache(ttl=0.05)
+    assert _host(cache, b'a') == 'h1'
+    time.sleep(0.1)
+    assert _host(cache, b'a') is None
+    assert b't' not in cache
+
+
+def test_is_region_moved():
+    assert is_region_moved(TIOError(message='org.apache.hadoop.hbase.NotServingRegionException: t,,1'))
+    assert is_region_moved(TIOError(message='RegionMovedException: moved to h2'))
+    assert not is_region_moved(TIOError(message='Table t does not exist'))
+    assert not is_region_moved(ValueError('NotServingRegionException'))
@@ -0,0 +1,37 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.hbase.ttypes import TColumnValue, TResult
+from thbase.thrift2.resultset import BytesColumn, ResultSet
+import pytest
+
+
+def test_missing_value_is_not_empty_value():
+    column = BytesColumn()
+    for value in (b'a', None, b'', b'bc'):
+        column.append(value)
+    assert list(column) == [b'a', None, b'', b'bc']
+    assert column[-3] is None
+    assert list(column.valid) == [1, 0, 1, 1]
+
+
+def test_result_set_keeps_missing_values():
+    result = TResult(row=b'r', columnValues=[TColumnValue(family=b'f', qualifier=b'a', value=None, timestamp=1),
+                                             TColumnValue(family=b'f', qualifier=b'b', value=b'', timestamp=2)])
+    result_set = ResultSet.from_results(b't', [result])
+    assert [cell.value for cell in result_set] == [None, b'']
+    numpy = pytest.importorskip('numpy')
+    arrays = result_set.to_numpy()
+    assert arrays['value_valid'].tolist() == [False, True]
+    assert arrays['value_offsets'].tolist() == [0, 0, 0]
+    assert numpy.array_equal(arrays['timestamps'], [1, 2])
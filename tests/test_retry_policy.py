@@ -0,0 +1,78 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from thbase.hbase.ttypes import TIOError
+from thbase.util.executor import Executor, ExponentialBackoffRetryPolicy, FixedRetryPolicy, Jitter
+import pytest
+
+
+def test_fixed_policy_stops_after_max_attempts():
+    policy = FixedRetryPolicy(3, 0.5)
+    assert policy.next_backoff(1, 0, 0) == 0.5
+    assert policy.next_backoff(2, 0, 0.5) == 0.5
+    assert policy.next_backoff(3, 0, 0.5) is None
+
+
+def test_exponential_backoff_without_jitter_is_capped():
+    policy = ExponentialBackoffRetryPolicy(10, base=0.1, cap=1, multiplier=2, jitter=Jitter.NONE)
+    backoffs = [policy.next_backoff(attempt, 0, 0) for attempt in range(1, 7)]
+    assert backoffs == pytest.approx([0.1, 0.2, 0.4, 0.8, 1, 1])
+
+
+def test_full_jitter_stays_under_the_exponential_backoff():
+    policy = ExponentialBackoffRetryPolicy(10, base=0.1, cap=1, multiplier=2, jitter=Jitter.FULL)
+    for attempt in range(1, 7):
+        for _ in range(50):
+            assert 0 <= policy.next_backoff(attempt, 0, 0) <= min(1, 0.1 * 2 ** (attempt - 1))
+
+
+def test_decorrelated_jitter_grows_from_the_last_backoff():
+    policy = ExponentialBackoffRetryPolicy(10, base=0.1, cap=1, jitter=Jitter.DECORRELATED)
+    for last in (0, 0.1, 0.2, 0.5, 2):
+        for _ in range(50):
+            assert 0.1 <= policy.next_backoff(2, 0, last) <= min(1, max(0.1, last) * 3)
+
+
+def test_deadline_limits_the_backoff_and_the_retries():
+    policy = FixedRetryPolicy(10, 4, deadline=10)
+    assert policy.next_backoff(1, 0, 0) == 4
+    # half of the remaining time is left for the retry to run.
+    assert policy.next_backoff(2, 6, 4) == 2
+    assert policy.next_backoff(3, 10, 2) is None
+    assert policy.next_backoff(3, 12, 2) is None
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(max_attempts=0),
+    dict(max_attempts=3, base=0),
+    dict(max_attempts=3, base=1, cap=0.5),
+    dict(max_attempts=3, multiplier=0.5),
+    dict(max_attempts=3, jitter='full'),
+    dict(max_attempts=3, deadline=0),
+])
+def test_invalid_policy_raises(kwargs):
+    with pytest.raises(ValueError):
+        ExponentialBackoffRetryPolicy(**kwargs)
+
+
+def test_executor_retries_by_the_policy():
+    attempts = []
+
+    def fail():
+        attempts.append(1)
+        raise TIOError(message='failed', canRetry=True)
+
+    executor = Executor(0, 0, master=None, policy=FixedRetryPolicy(3, 0))
+    assert executor.call(fail, name='fail') is False
+    assert len(attempts) == 3
+    assert executor.stats.snapshot()['fail'] == {'calls': 1, 'attempts': 3, 'failures': 1, 'max_attempts': 3}
@@ -0,0 +1,170 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from typing import Iterable, List, Tuple, Union
+from thbase.config import LoadBalance, LOAD_BALANCE_DEFAULT, EJECT_FAILURES_DEFAULT, EJECT_TIME_DEFAULT
+from thbase.util.breaker import CircuitBreaker
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# weight of the latest latency in the moving average.
+EWMA_ALPHA = 0.3
+
+
+class Endpoint(object):
+    """
+    A thrift server address with the statistics used for load balancing, and the circuit breaker of the server.
+    """
+    __slots__ = ('host', 'port', 'outstanding', 'ewma', 'failures', 'ejected_until', 'breaker')
+
+    def __init__(self, host, port, breaker=None):
+        # type: (str, int, Union[None, CircuitBreaker]) -> None
+        self.host = host
+        self.port = port
+        self.breaker = breaker
+        self.outstanding = 0
+        self.ewma = 0.0
+        self.failures = 0
+        self.ejected_until = 0
+
+    def __str__(self):
+        return '{}:{}'.format(self.host, self.port)
+
+
+class LoadBalancer(object):
+    """
+    Choose the thrift server each request is sent to.
+    LoadBalance.ROUND_ROBIN: use the servers in turn.
+    LoadBalance.LEAST_OUTSTANDING: use the server with the least requests in flight.
+    LoadBalance.EWMA: use the server with the lowest moving average latency weighted by its requests in flight.
+    A server failing eject_failures times in a row is ejected for eject_time seconds. If all the servers are
+    ejected, the one whose ejection expires first is still used.
+    If a circuit breaker is given, each server gets its own breaker with the same settings, so that one server
+    being down does not open the circuit of the others.
+    """
+    def __init__(self, endpoints,  # type: Iterable[Tuple[str, int]]
+                 policy=LOAD_BALANCE_DEFAULT,  # type: LoadBalance
+                 eject_failures=EJECT_FAILURES_DEFAULT,  # type: int
+                 eject_time=EJECT_TIME_DEFAULT,  # type: Union[int, float]
+                 breaker=None,  # type: Union[None, CircuitBreaker]
+                 ):
+        self._breaker = breaker
+        self.endpoints = [self._new_endpoint(host, port) for host, port in endpoints]  # type: List[Endpoint]
+        if not self.endpoints:
+            raise ValueError("At least one endpoint is needed.")
+        if not isinstance(policy, LoadBalance):
+            raise ValueError("Invalid load balance policy {}. Use one of the specific enum type {}."
+                             .format(policy, ', '.join([str(p) for p in LoadBalance])))
+        self.policy = policy
+        self.eject_failures = eject_failures
+        self.eject_time = eject_time
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def _new_endpoint(self, host, port):
+        return Endpoint(host, port, self._breaker.clone() if self._breaker is not None else None)
+
+    def choose(self, exclude=()):
+        # type: (Iterable[Endpoint]) -> Union[None, Endpoint]
+        """
+        Choose an endpoint for the next request.
+        Args:
+            exclude: the endpoints not to choose.
+
+        Returns: an Endpoint object, or None if all the endpoints are excluded.
+
+        """
+        with self._lock:
+            candidates = [ep for ep in self.endpoints if ep not in exclude]
+            if not candidates:
+                return None
+            now = time.time()
+            healthy = [ep for ep in candidates if ep.ejected_until <= now]
+            if not healthy:
+                return min(candidates, key=lambda ep: ep.ejected_until)
+            if self.policy == LoadBalance.LEAST_OUTSTANDING:
+                # start the scan from a rotating position so that the ties are spread.
+                self._next += 1
+                start = self._next % len(healthy)
+                return min(healthy[start:] + healthy[:start], key=lambda ep: ep.outstanding)
+            if self.policy == LoadBalance.EWMA:
+                return min(healthy, key=lambda ep: ep.ewma * (ep.outstanding + 1))
+            self._next += 1
+            return healthy[self._next % len(healthy)]
+
+    def add(self, host, port):
+        # type: (str, int) -> Endpoint
+        """
+        Get the endpoint of a server, adding it to the balanced servers if it is not one of them.
+        Returns: an Endpoint object.
+        """
+        with self._lock:
+            for endpoint in self.endpoints:
+                if endpoint.host == host and endpoint.port == port:
+                    return endpoint
+            endpoint = self._new_endpoint(host, port)
+            # copy on write, so that iterating the endpoints without the lock is safe.
+            self.endpoints = self.endpoints + [endpoint]
+            logger.info("Add thrift server {} to the balanced servers.".format(endpoint))
+            return endpoint
+
+    def begin(self, endpoint):
+        # type: (Endpoint) -> None
+        """
+        Record a request sent to the endpoint.
+        """
+        with self._lock:
+            endpoint.outstanding += 1
+
+    def end(self, endpoint, latency=None, failed=False):
+        # type: (Endpoint, Union[None, float], bool) -> None
+        """
+        Record a request sent to the endpoint is done.
+        Args:
+            endpoint: the Endpoint object given by begin().
+            latency: the seconds the request took, None if it is unknown.
+            failed: if the request failed because of the connection.
+
+        Returns: None
+
+        """
+        with self._lock:
+            endpoint.outstanding = max(endpoint.outstanding - 1, 0)
+            self._report(endpoint, latency, failed)
+
+    def report(self, endpoint, failed):
+        # type: (Endpoint, bool) -> None
+        """
+        Record the result of connecting to the endpoint.
+        """
+        with self._lock:
+            self._report(endpoint, None, failed)
+
+    def _report(self, endpoint, latency, failed):
+        if failed:
+            endpoint.failures += 1
+            if endpoint.failures >= self.eject_failures:
+                logger.warning("Thrift server {} failed {} times in a row and is ejected for {} seconds."
+                               .format(endpoint, endpoint.failures, self.eject_time))
+                endpoint.ejected_until = time.time() + self.eject_time
+                # a single failure ejects the endpoint again after it comes back.
+                endpoint.failures = self.eject_failures - 1
+            return
+        endpoint.failures = 0
+        endpoint.ejected_until = 0
+        if latency is not None:
+            endpoint.ewma = latency if endpoint.ewma == 0 else \
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * endpoint.ewma
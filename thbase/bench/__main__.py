@@ -0,0 +1,133 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Run the benchmarks of the client, e.g.
+    python -m thbase.bench --local --workload put get short_scan --threads 4 --duration 10 --json result.json
+"""
+from thbase.config import ClientConfig, TransportType, ProtocolType, TRANSPORT_DEFAULT, PROTOCOL_DEFAULT
+from thbase.config import HOST_DEFAULT, PORT_DEFAULT, RETRY_TIMES_DEFAULT, RETRY_TIMEOUT_DEFAULT
+from thbase.thrift2.client import Client
+from thbase.bench import workloads
+from thbase.bench.runner import run_workload, report, format_results
+import argparse
+import json
+import logging
+import sys
+
+TABLE_DEFAULT = 'thbase_bench'
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python -m thbase.bench',
+                                     description="Measure the throughput and latency of the thbase client.")
+    target = parser.add_argument_group('target')
+    target.add_argument('--host', default=HOST_DEFAULT)
+    target.add_argument('--port', type=int, default=PORT_DEFAULT)
+    target.add_argument('--local', action='store_true',
+                        help="run against an in-memory server started in this process instead of --host:--port")
+    target.add_argument('--local-latency', type=float, nargs='+', default=[0], metavar='SECONDS',
+                        help="latency of the in-memory server, or the min and max of a uniform latency")
+    target.add_argument('--local-failure-rate', type=float, default=0, metavar='RATE',
+                        help="probability for a request to the in-memory server to fail")
+    target.add_argument('--transport', choices=[t.name.lower() for t in TransportType],
+                        default=TRANSPORT_DEFAULT.name.lower())
+    target.add_argument('--protocol', choices=[p.name.lower() for p in ProtocolType],
+                        default=PROTOCOL_DEFAULT.name.lower())
+    target.add_argument('--use-pool', action='store_true',
+                        help="share a pooled client between the threads instead of one client per thread")
+    target.add_argument('--retry-times', type=int, default=RETRY_TIMES_DEFAULT)
+    target.add_argument('--retry-timeout', type=int, default=RETRY_TIMEOUT_DEFAULT, metavar='SECONDS')
+    target.add_argument('--table', default=TABLE_DEFAULT,
+                        help="the table to run on, it must have the column family f unless --local is set")
+
+    run = parser.add_argument_group('run')
+    run.add_argument('--workload', nargs='+', choices=workloads.names(), default=workloads.names(),
+                     help="the workloads to run in order, all of them by default")
+    run.add_argument('--threads', type=int, default=1)
+    run.add_argument('--duration', type=float, default=10, help="seconds each workload is measured for")
+    run.add_argument('--requests', type=int, default=None,
+                     help="send this number of requests per workload instead of running for --duration")
+    run.add_argument('--warmup', type=float, default=1, help="seconds each workload runs before being measured")
+    run.add_argument('--seed', type=int, default=None)
+    run.add_argument('--no-load', action='store_true', help="do not write the key space before the read workloads")
+
+    data = parser.add_argument_group('data')
+    data.add_argument('--rows', type=int, default=workloads.ROWS_DEFAULT, help="rows of the key space")
+    data.add_argument('--value-size', type=int, default=workloads.VALUE_SIZE_DEFAULT)
+    data.add_argument('--batch-size', type=int, default=workloads.BATCH_SIZE_DEFAULT)
+    data.add_argument('--short-scan-rows', type=int, default=workloads.SHORT_SCAN_ROWS_DEFAULT)
+    data.add_argument('--long-scan-rows', type=int, default=workloads.LONG_SCAN_ROWS_DEFAULT)
+    data.add_argument('--read-ratio', type=float, default=workloads.READ_RATIO_DEFAULT,
+                      help="rate of gets of the mixed workload")
+
+    output = parser.add_argument_group('output')
+    output.add_argument('--json', default=None, metavar='PATH', help="write the JSON report to a file, - for stdout")
+    output.add_argument('--label', default=None, help="a name of the run kept in the report, e.g. a client version")
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    if len(args.local_latency) > 2:
+        _parser().error("--local-latency takes one or two values.")
+    logging.basicConfig(level=logging.CRITICAL)
+    server = None
+    host, port = args.host, args.port
+    transport, protocol = TransportType[args.transport.upper()], ProtocolType[args.protocol.upper()]
+    if args.local:
+        from thbase.thrift2.server import MemoryHandler, LocalServer
+        latency = tuple(args.local_latency) if len(args.local_latency) == 2 else args.local_latency[0]
+        server = LocalServer(MemoryHandler(latency=latency, failure_rate=args.local_failure_rate,
+                                           seed=args.seed), transport_type=transport,
+                             protocol_type=protocol).start()
+        host, port = server.host, server.port
+    conf = ClientConfig(thrift_host=host, port=port, transport_type=transport, protocol_type=protocol,
+                        retry_times=args.retry_times, retry_timeout=args.retry_timeout, use_pool=args.use_pool,
+                        pool_max_size=max(args.threads, 1))
+    options = dict(rows=args.rows, value_size=args.value_size, batch_size=args.batch_size,
+                   short_scan_rows=args.short_scan_rows, long_scan_rows=args.long_scan_rows,
+                   read_ratio=args.read_ratio)
+    results = []
+    try:
+        runs = [workloads.create_workload(name, **options) for name in args.workload]
+        if not args.no_load and any(w.needs_data for w in runs):
+            client = Client(conf)
+            client.open_connection()
+            try:
+                workloads.load(client.get_table(args.table), runs[0])
+            finally:
+                client.close_connection()
+        for workload in runs:
+            result = run_workload(conf, args.table, workload, threads=args.threads,
+                                  duration=None if args.requests else args.duration, requests=args.requests,
+                                  warmup=args.warmup, seed=args.seed)
+            results.append(result)
+            if args.json != '-':
+                print(format_results([result]).splitlines()[-1] if len(results) > 1 else format_results([result]))
+    finally:
+        if server is not None:
+            server.stop()
+    config = dict(vars(args), transport=args.transport, protocol=args.protocol)
+    config.update(options)
+    document = report(results, config, args.label)
+    if args.json == '-':
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+    return 1 if any(r.errors for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
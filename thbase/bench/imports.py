@@ -0,0 +1,115 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measure the time to import the modules of the client in fresh interpreters, e.g.
+    python -m thbase.bench.imports --repeat 20 --top 10
+"""
+from typing import Dict, List, Tuple
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES_DEFAULT = ['thbase.thrift2.client', 'thbase.thrift2.operation', 'thbase.hbase.ttypes',
+                   'thbase.hbase.THBaseService', 'thbase.hbase.THBaseClient']
+REPEAT_DEFAULT = 10
+
+_PROBE = """
+import sys, time
+before = set(sys.modules)
+begin = time.perf_counter() if hasattr(time, 'perf_counter') else time.time()
+import {module}
+end = time.perf_counter() if hasattr(time, 'perf_counter') else time.time()
+print('%f %d' % (end - begin, len(set(sys.modules) - before)))
+"""
+# tracing the allocations slows the import down, so the memory is measured in an interpreter of its own.
+_MEMORY_PROBE = """
+import tracemalloc
+tracemalloc.start()
+import {module}
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+
+def measure(module, repeat=REPEAT_DEFAULT):
+    # type: (str, int) -> Dict[str, object]
+    """
+    Import a module in repeat fresh interpreters.
+    Returns: a dict of module, min_ms, median_ms, max_ms: the import times, modules: the number of modules
+    the import loads, and memory_kb: the memory the import leaves allocated.
+
+    """
+    times, loaded = [], 0
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', _PROBE.format(module=module)])
+        seconds, loaded = output.split()
+        times.append(float(seconds) * 1000)
+    times.sort()
+    memory = int(subprocess.check_output([sys.executable, '-c', _MEMORY_PROBE.format(module=module)]))
+    return {'module': module, 'min_ms': times[0], 'median_ms': times[len(times) // 2], 'max_ms': times[-1],
+            'modules': int(loaded), 'memory_kb': memory // 1024}
+
+
+def slowest_imports(module, top=10):
+    # type: (str, int) -> List[Tuple[str, int]]
+    """
+    Find the modules taking the most time of their own to import, with python -X importtime.
+    Returns: a list of (module name, microseconds) sorted by time.
+
+    """
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = process.communicate()
+    costs = []
+    for line in err.decode('utf-8', 'replace').splitlines():
+        parts = line.split('|')
+        if len(parts) != 3 or not line.startswith('import time:') or 'self' in parts[0]:
+            continue
+        costs.append((parts[2].strip(), int(parts[0].split(':')[1])))
+    return sorted(costs, key=lambda c: -c[1])[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thbase.bench.imports',
+                                     description="Measure the time to import the modules of the client.")
+    parser.add_argument('--module', nargs='+', default=MODULES_DEFAULT)
+    parser.add_argument('--repeat', type=int, default=REPEAT_DEFAULT, help="fresh interpreters per module")
+    parser.add_argument('--top', type=int, default=0,
+                        help="also list this number of the slowest imports of the first module, python 3.7+")
+    parser.add_argument('--json', default=None, metavar='PATH', help="write the JSON report to a file, - for stdout")
+    args = parser.parse_args(argv)
+    results = [measure(module, args.repeat) for module in args.module]
+    document = {'python': sys.version.split()[0], 'repeat': args.repeat, 'results': results}
+    if args.top:
+        document['slowest'] = slowest_imports(args.module[0], args.top)
+    if args.json == '-':
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+        return 0
+    print('{:<32}{:>10}{:>12}{:>10}{:>10}{:>12}'.format('module', 'min ms', 'median ms', 'max ms', 'modules',
+                                                        'memory KB'))
+    for r in results:
+        print('{:<32}{:>10.2f}{:>12.2f}{:>10.2f}{:>10}{:>12}'.format(r['module'], r['min_ms'], r['median_ms'],
+                                                                      r['max_ms'], r['modules'], r['memory_kb']))
+    if args.top:
+        print('\nslowest imports of {} (self time):'.format(args.module[0]))
+        for name, us in document['slowest']:
+            print('{:<48}{:>10.2f} ms'.format(name, us / 1000.0))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
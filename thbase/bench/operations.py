@@ -0,0 +1,119 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measure the cost of building the operations with and without the column cache, e.g.
+    python -m thbase.bench.operations --columns 10 --number 20000
+"""
+from typing import Callable, Dict, List
+from thbase.thrift2 import operation
+from thbase.thrift2.operation import Put, Get, Delete, Scan
+import argparse
+import json
+import sys
+import time
+
+NUMBER_DEFAULT = 20000
+COLUMNS_DEFAULT = 10
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+def builders(columns=COLUMNS_DEFAULT):
+    # type: (int) -> Dict[str, Callable[[int], object]]
+    """
+    The operations to measure, built from str names like an application does.
+    Args:
+        columns: the qualifiers of the multi-column operations.
+
+    Returns: a dict of name to a function building an operation for the i-th row.
+
+    """
+    qualifiers = ['qualifier%04d' % i for i in range(columns)]
+    values = ['value%04d' % i for i in range(columns)]
+    return {
+        'put': lambda i: Put(row='row%010d' % i, family='f', qualifier='qualifier0000', value='value'),
+        'put_columns': lambda i: Put(row='row%010d' % i, family='f', qualifier=qualifiers, value=values),
+        'get': lambda i: Get(row='row%010d' % i, family='f', qualifier='qualifier0000'),
+        'get_columns': lambda i: Get(row='row%010d' % i, family='f', qualifier=qualifiers),
+        'delete': lambda i: Delete(row='row%010d' % i, family='f', qualifier='qualifier0000'),
+        'scan_columns': lambda i: Scan(start_row='row%010d' % i, family='f', qualifier=qualifiers),
+    }
+
+
+def measure(build, number=NUMBER_DEFAULT):
+    # type: (Callable[[int], object], int) -> float
+    """
+    Returns: the microseconds to build one operation.
+    """
+    begin = _clock()
+    for i in range(number):
+        build(i)
+    return (_clock() - begin) / number * 1e6
+
+
+def run(columns=COLUMNS_DEFAULT, number=NUMBER_DEFAULT):
+    # type: (int, int) -> List[Dict[str, object]]
+    """
+    Measure every operation without the column cache, then with it.
+    Returns: a list of dicts of operation, uncached_us, cached_us and speedup.
+
+    """
+    results = []
+    try:
+        for name, build in sorted(builders(columns).items()):
+            operation.set_column_cache_size(0)
+            uncached = measure(build, number)
+            operation.set_column_cache_size()
+            # the first operations fill the cache.
+            build(0)
+            cached = measure(build, number)
+            results.append({'operation': name, 'uncached_us': uncached, 'cached_us': cached,
+                            'speedup': uncached / cached if cached > 0 else 0.0})
+    finally:
+        operation.set_column_cache_size()
+    return results
+
+
+def format_results(results):
+    # type: (List[Dict[str, object]]) -> str
+    header = '{:<14}{:>14}{:>12}{:>10}'.format('operation', 'uncached us', 'cached us', 'speedup')
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append('{:<14}{:>14.2f}{:>12.2f}{:>9.2f}x'.format(r['operation'], r['uncached_us'], r['cached_us'],
+                                                               r['speedup']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thbase.bench.operations',
+                                     description="Measure building the operations with and without the column "
+                                                 "cache.")
+    parser.add_argument('--columns', type=int, default=COLUMNS_DEFAULT, help="qualifiers of the multi-column "
+                                                                              "operations")
+    parser.add_argument('--number', type=int, default=NUMBER_DEFAULT, help="operations built for each measure")
+    parser.add_argument('--json', default=None, metavar='PATH', help="write the JSON report to a file, - for stdout")
+    args = parser.parse_args(argv)
+    results = run(args.columns, args.number)
+    document = {'columns': args.columns, 'number': args.number, 'results': results}
+    if args.json == '-':
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+        return 0
+    print(format_results(results))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
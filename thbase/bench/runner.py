@@ -0,0 +1,228 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from random import Random
+from typing import Dict, List, Union
+from thbase.config import ClientConfig
+from thbase.thrift2.client import Client
+from thbase.bench.workloads import Workload
+import logging
+import math
+import platform
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (('p50', 50), ('p95', 95), ('p99', 99), ('p999', 99.9))
+# a monotonic clock with the best resolution to measure the latencies.
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+def percentile(samples, p):
+    # type: (List[float], float) -> float
+    """
+    The nearest-rank percentile of sorted samples, 0 if there is no sample.
+    """
+    if not samples:
+        return 0.0
+    rank = int(math.ceil(p / 100.0 * len(samples)))
+    return samples[min(max(rank, 1), len(samples)) - 1]
+
+
+class WorkloadResult(object):
+    """
+    The measures of a workload: the requests, the operations they did, the failed requests and the latency of
+    each request.
+    """
+    def __init__(self, workload, threads, requests, operations, errors, duration, latencies, first_error=None):
+        # type: (str, int, int, int, int, float, List[float], Union[None, str]) -> None
+        self.workload = workload
+        self.threads = threads
+        self.requests = requests
+        self.operations = operations
+        self.errors = errors
+        self.duration = duration
+        self.latencies = sorted(latencies)
+        self.first_error = first_error
+
+    @property
+    def ops_per_sec(self):
+        # type: () -> float
+        return self.operations / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def requests_per_sec(self):
+        # type: () -> float
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+    def latency_ms(self):
+        # type: () -> Dict[str, float]
+        """
+        Returns: the mean, percentiles and max of the request latencies in milliseconds.
+        """
+        latencies = self.latencies
+        stats = {'mean': sum(latencies) / len(latencies) * 1000 if latencies else 0.0}
+        for name, p in PERCENTILES:
+            stats[name] = percentile(latencies, p) * 1000
+        stats['max'] = latencies[-1] * 1000 if latencies else 0.0
+        return stats
+
+    def to_dict(self):
+        # type: () -> Dict[str, object]
+        return {'workload': self.workload, 'threads': self.threads, 'requests': self.requests,
+                'operations': self.operations, 'errors': self.errors, 'duration': self.duration,
+                'ops_per_sec': self.ops_per_sec, 'requests_per_sec': self.requests_per_sec,
+                'latency_ms': self.latency_ms(), 'first_error': self.first_error}
+
+
+class _Worker(object):
+    """
+    The measures of one benchmark thread, merged after the run.
+    """
+    def __init__(self, seed):
+        self.rng = Random(seed)
+        self.latencies = []  # type: List[float]
+        self.operations = 0
+        self.errors = 0
+        self.first_error = None
+        self.end = 0.0
+
+
+def run_workload(conf,  # type: ClientConfig
+                 table_name,  # type: str
+                 workload,  # type: Workload
+                 threads=1,  # type: int
+                 duration=10,  # type: Union[None, int, float]
+                 requests=None,  # type: Union[None, int]
+                 warmup=0,  # type: Union[int, float]
+                 seed=None,  # type: Union[None, int]
+                 ):
+    # type: (...) -> WorkloadResult
+    """
+    Run a workload from several threads and measure it.
+    With a connection pool in the configuration the threads share one client, otherwise each thread uses a client
+    of its own.
+    Args:
+        conf: the configuration of the clients.
+        table_name: the table the workload runs on.
+        workload: a Workload object.
+        threads: the number of threads sending requests.
+        duration: the seconds the workload is measured for, None to run until the requests are sent.
+        requests: the total number of requests to send, None to run for the duration.
+        warmup: the seconds the workload runs before being measured.
+        seed: the seed of the random rows, None for a random seed.
+
+    Returns: a WorkloadResult object.
+
+    """
+    if duration is None and requests is None:
+        raise ValueError("Either duration or requests must be given.")
+    if not isinstance(threads, int) or threads < 1:
+        raise ValueError("Threads must be a positive integer.")
+    shared = Client(conf) if conf.use_pool else None
+    if shared is not None:
+        shared.open_connection()
+    seeds = Random(seed)
+    workers = [_Worker(seeds.random()) for _ in range(threads)]
+    lock = threading.Lock()
+    budget = [requests]
+    start = _clock() + warmup
+    deadline = start + duration if duration is not None else None
+
+    def take():
+        if budget[0] is None:
+            return True
+        with lock:
+            if budget[0] <= 0:
+                return False
+            budget[0] -= 1
+            return True
+
+    def run(worker):
+        client = shared
+        if client is None:
+            client = Client(conf)
+            client.open_connection()
+        try:
+            table = client.get_table(table_name)
+            while True:
+                begin = _clock()
+                measured = begin >= start
+                if deadline is not None and begin >= deadline or measured and not take():
+                    break
+                operations, error = 0, None
+                try:
+                    operations = workload.run_once(table, worker.rng)
+                    error = client.last_error
+                except Exception as e:
+                    error = e
+                latency = _clock() - begin
+                if not measured:
+                    continue
+                worker.latencies.append(latency)
+                worker.operations += operations
+                if error is not None:
+                    worker.errors += 1
+                    if worker.first_error is None:
+                        worker.first_error = '{}: {}'.format(type(error).__name__, error)
+            worker.end = _clock()
+        finally:
+            if shared is None:
+                client.close_connection()
+
+    pool = [threading.Thread(target=run, args=(worker,)) for worker in workers]
+    for thread in pool:
+        thread.daemon = True
+        thread.start()
+    for thread in pool:
+        thread.join()
+    if shared is not None:
+        shared.close_connection()
+    latencies = [latency for worker in workers for latency in worker.latencies]
+    errors = [worker.first_error for worker in workers if worker.first_error is not None]
+    return WorkloadResult(workload.name, threads, len(latencies), sum(w.operations for w in workers),
+                          sum(w.errors for w in workers), max(max(w.end for w in workers) - start, 0.0), latencies,
+                          errors[0] if errors else None)
+
+
+def report(results, config=None, label=None):
+    # type: (List[WorkloadResult], Union[None, Dict[str, object]], Union[None, str]) -> Dict[str, object]
+    """
+    Build the machine-readable report of a benchmark run.
+    Args:
+        results: the WorkloadResult objects of the run.
+        config: the parameters of the run.
+        label: a name of the run, e.g. the version of the client, to compare runs.
+
+    Returns: a dict which can be dumped as JSON.
+
+    """
+    return {'label': label, 'timestamp': time.time(), 'python': platform.python_version(),
+            'platform': platform.platform(), 'config': config or {}, 'results': [r.to_dict() for r in results]}
+
+
+def format_results(results):
+    # type: (List[WorkloadResult]) -> str
+    """
+    Format the results as a text table.
+    """
+    header = '{:<12}{:>8}{:>10}{:>8}{:>12}{:>10}{:>10}{:>10}{:>10}{:>10}'.format(
+        'workload', 'threads', 'requests', 'errors', 'ops/sec', 'mean ms', 'p50 ms', 'p95 ms', 'p99 ms', 'p999 ms')
+    lines = [header, '-' * len(header)]
+    for r in results:
+        latency = r.latency_ms()
+        lines.append('{:<12}{:>8}{:>10}{:>8}{:>12.1f}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}'.format(
+            r.workload, r.threads, r.requests, r.errors, r.ops_per_sec, latency['mean'], latency['p50'],
+            latency['p95'], latency['p99'], latency['p999']))
+    return '\n'.join(lines)
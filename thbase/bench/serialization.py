@@ -0,0 +1,234 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measure the cost of encoding and decoding the thrift structs of the client, e.g.
+    python -m thbase.bench.serialization --columns 10 --value-size 100 --json result.json
+"""
+from typing import Callable, Dict, List
+from thbase.hbase.ttypes import TPut, TGet, TScan, TResult, TColumn, TColumnValue
+from thbase.hbase.THBaseService import getScannerResults_result
+from thbase.connection import has_fastbinary
+from thbase.thrift2.decoder import ResultsResponse, ViewResultsResponse
+from thbase.thrift2.table import _format_results
+from thrift.protocol import TBinaryProtocol, TCompactProtocol
+from thrift.transport.TTransport import TMemoryBuffer
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+NUMBER_DEFAULT = 2000
+COLUMNS_DEFAULT = 10
+ROWS_DEFAULT = 100
+VALUE_SIZE_DEFAULT = 100
+_clock = getattr(time, 'perf_counter', time.time)
+
+# protocol name -> (pure python protocol, accelerated protocol)
+PROTOCOLS = {
+    'binary': (TBinaryProtocol.TBinaryProtocol, TBinaryProtocol.TBinaryProtocolAccelerated),
+    'compact': (TCompactProtocol.TCompactProtocol, TCompactProtocol.TCompactProtocolAccelerated),
+}
+
+
+def sample_structs(columns=COLUMNS_DEFAULT, value_size=VALUE_SIZE_DEFAULT):
+    # type: (int, int) -> Dict[str, object]
+    """
+    Build a struct of each kind sent or received by the client.
+    Args:
+        columns: the columns of a put, get or result.
+        value_size: the bytes of a value.
+
+    Returns: a dict of struct name to struct.
+
+    """
+    value = os.urandom(value_size)
+    qualifiers = [b'qualifier%04d' % i for i in range(columns)]
+    return {
+        'TColumnValue': TColumnValue(family=b'f', qualifier=qualifiers[0], value=value, timestamp=1),
+        'TPut': TPut(row=b'row0000000001',
+                     columnValues=[TColumnValue(family=b'f', qualifier=q, value=value) for q in qualifiers]),
+        'TGet': TGet(row=b'row0000000001', columns=[TColumn(family=b'f', qualifier=q) for q in qualifiers]),
+        'TScan': TScan(startRow=b'row0000000001', stopRow=b'row0000001000', columns=[TColumn(family=b'f')],
+                       caching=100),
+        'TResult': TResult(row=b'row0000000001',
+                           columnValues=[TColumnValue(family=b'f', qualifier=q, value=value, timestamp=1)
+                                         for q in qualifiers]),
+    }
+
+
+def _timed(func, number):
+    # type: (Callable[[], object], int) -> float
+    begin = _clock()
+    for _ in range(number):
+        func()
+    return (_clock() - begin) / number
+
+
+def measure(struct, protocol_class, number=NUMBER_DEFAULT):
+    # type: (object, type, int) -> Dict[str, float]
+    """
+    Measure encoding and decoding a struct with a protocol, through memory buffers like the framed and buffered
+    transports.
+    Returns: a dict of encode_us, decode_us: the microseconds to encode and decode the struct once, and bytes.
+
+    """
+    def encode():
+        buf = TMemoryBuffer()
+        struct.write(protocol_class(buf))
+        return buf.getvalue()
+
+    data = encode()
+
+    def decode():
+        struct.__class__().read(protocol_class(TMemoryBuffer(data)))
+
+    return {'encode_us': _timed(encode, number) * 1e6, 'decode_us': _timed(decode, number) * 1e6,
+            'bytes': len(data)}
+
+
+def measure_rows(protocol_class, rows=ROWS_DEFAULT, columns=COLUMNS_DEFAULT, value_size=VALUE_SIZE_DEFAULT,
+                 number=NUMBER_DEFAULT):
+    # type: (type, int, int, int, int) -> List[Dict[str, object]]
+    """
+    Measure turning a getScannerResults response into Cells, decoded into the generated structs, by the decoder
+    module, and by the decoder module with memoryview values.
+    Returns: a list of dicts of decoder, us: the microseconds to decode a response and build its cells, blocks
+    and kb: the memory blocks and KB held by a decoded response before the cells are built.
+
+    """
+    result = sample_structs(columns, value_size)['TResult']
+    buf = TMemoryBuffer()
+    getScannerResults_result(success=[result] * rows).write(protocol_class(buf))
+    data = buf.getvalue()
+
+    def decoder(response_class):
+        def decode():
+            response = response_class()
+            response.read(protocol_class(TMemoryBuffer(data)))
+            return response
+        return decode
+
+    def held(decode):
+        gc.collect()
+        tracemalloc.start()
+        before = sys.getallocatedblocks()
+        response = decode()
+        blocks = sys.getallocatedblocks() - before
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del response
+        return blocks, memory // 1024
+
+    measures = []
+    for name, response_class in (('generated', getScannerResults_result), ('direct', ResultsResponse),
+                                 ('views', ViewResultsResponse)):
+        decode = decoder(response_class)
+        us = _timed(lambda: _format_results(b'table', decode().success), number) * 1e6
+        blocks, kb = held(decode)
+        measures.append({'decoder': name, 'us': us, 'blocks': blocks, 'kb': kb})
+    return measures
+
+
+def run(columns=COLUMNS_DEFAULT, value_size=VALUE_SIZE_DEFAULT, number=NUMBER_DEFAULT):
+    # type: (int, int, int) -> List[Dict[str, object]]
+    """
+    Measure every sample struct with every protocol, pure python and accelerated if the C extension is installed.
+    Returns: a list of dicts of struct, protocol, accelerated, encode_us, decode_us and bytes.
+
+    """
+    accelerated = [False, True] if has_fastbinary() else [False]
+    results = []
+    for name, struct in sorted(sample_structs(columns, value_size).items()):
+        for protocol in sorted(PROTOCOLS):
+            for fast in accelerated:
+                result = {'struct': name, 'protocol': protocol, 'accelerated': fast}
+                result.update(measure(struct, PROTOCOLS[protocol][fast], number))
+                results.append(result)
+    return results
+
+
+def format_results(results):
+    # type: (List[Dict[str, object]]) -> str
+    header = '{:<14}{:<10}{:>13}{:>12}{:>12}{:>8}'.format('struct', 'protocol', 'accelerated', 'encode us',
+                                                          'decode us', 'bytes')
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append('{:<14}{:<10}{:>13}{:>12.2f}{:>12.2f}{:>8}'.format(
+            r['struct'], r['protocol'], 'yes' if r['accelerated'] else 'no', r['encode_us'], r['decode_us'],
+            r['bytes']))
+    return '\n'.join(lines)
+
+
+def run_rows(rows=ROWS_DEFAULT, columns=COLUMNS_DEFAULT, value_size=VALUE_SIZE_DEFAULT, number=NUMBER_DEFAULT):
+    # type: (int, int, int, int) -> List[Dict[str, object]]
+    """
+    Measure decoding rows with every protocol, accelerated if the C extension is installed.
+    Returns: a list of dicts of protocol, accelerated and the measures of measure_rows().
+
+    """
+    results = []
+    fast = has_fastbinary()
+    for protocol in sorted(PROTOCOLS):
+        for measure in measure_rows(PROTOCOLS[protocol][fast], rows, columns, value_size, number):
+            result = {'protocol': protocol, 'accelerated': fast}
+            result.update(measure)
+            results.append(result)
+    return results
+
+
+def format_rows(results):
+    # type: (List[Dict[str, object]]) -> str
+    header = '{:<10}{:>13}{:>11}{:>12}{:>10}{:>10}'.format('protocol', 'accelerated', 'decoder', 'us', 'blocks',
+                                                           'KB')
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append('{:<10}{:>13}{:>11}{:>12.1f}{:>10}{:>10}'.format(
+            r['protocol'], 'yes' if r['accelerated'] else 'no', r['decoder'], r['us'], r['blocks'], r['kb']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thbase.bench.serialization',
+                                     description="Measure encoding and decoding the thrift structs of the client.")
+    parser.add_argument('--columns', type=int, default=COLUMNS_DEFAULT, help="columns of a put, get or result")
+    parser.add_argument('--value-size', type=int, default=VALUE_SIZE_DEFAULT)
+    parser.add_argument('--number', type=int, default=NUMBER_DEFAULT, help="repetitions of each measure")
+    parser.add_argument('--rows', type=int, default=ROWS_DEFAULT,
+                        help="rows of the scan response decoded into cells, 0 to skip this measure")
+    parser.add_argument('--json', default=None, metavar='PATH', help="write the JSON report to a file, - for stdout")
+    args = parser.parse_args(argv)
+    results = run(args.columns, args.value_size, args.number)
+    rows = run_rows(args.rows, args.columns, args.value_size, max(args.number // args.rows, 1)) if args.rows else []
+    document = {'extension': has_fastbinary(), 'columns': args.columns, 'value_size': args.value_size,
+                'number': args.number, 'results': results, 'rows': args.rows, 'row_results': rows}
+    if args.json == '-':
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+        return 0
+    if not document['extension']:
+        print("The C extension of thrift is not installed, only the pure python protocols are measured.")
+    print(format_results(results))
+    if rows:
+        print('\ndecoding a scan response of {} rows into cells:'.format(args.rows))
+        print(format_rows(rows))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
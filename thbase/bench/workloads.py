@@ -0,0 +1,220 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from random import Random
+from typing import Dict, List
+from thbase.thrift2.operation import Put, Get, Delete, Scan
+from thbase.thrift2.table import Table
+import os
+
+ROWS_DEFAULT = 10000
+VALUE_SIZE_DEFAULT = 100
+BATCH_SIZE_DEFAULT = 100
+SHORT_SCAN_ROWS_DEFAULT = 10
+LONG_SCAN_ROWS_DEFAULT = 1000
+READ_RATIO_DEFAULT = 0.5
+FAMILY = b'f'
+QUALIFIER = b'q'
+
+
+class WorkloadError(RuntimeError):
+    """
+    Raised by a workload when a request fails.
+    """
+    pass
+
+
+def row_key(i):
+    # type: (int) -> bytes
+    """
+    The row key of the i-th row of the key space, zero padded so that the rows sort by number.
+    """
+    return b'row%010d' % i
+
+
+class Workload(object):
+    """
+    A kind of request repeated by the benchmark.
+    run_once() sends one request on random rows of the key space and returns the number of operations it did,
+    e.g. the puts of a batch or the rows of a scan.
+    The workloads reading data need the key space to be loaded before running.
+    """
+    name = None  # type: str
+    needs_data = False
+
+    def __init__(self, rows=ROWS_DEFAULT,  # type: int
+                 value_size=VALUE_SIZE_DEFAULT,  # type: int
+                 batch_size=BATCH_SIZE_DEFAULT,  # type: int
+                 short_scan_rows=SHORT_SCAN_ROWS_DEFAULT,  # type: int
+                 long_scan_rows=LONG_SCAN_ROWS_DEFAULT,  # type: int
+                 read_ratio=READ_RATIO_DEFAULT,  # type: float
+                 ):
+        """
+        Args:
+            rows: the number of rows of the key space.
+            value_size: the bytes of the written values.
+            batch_size: the operations of a batch request.
+            short_scan_rows: the rows read by a short scan.
+            long_scan_rows: the rows read by a long scan.
+            read_ratio: the rate of gets of the mixed workload, the others are puts.
+        """
+        if rows < 1 or value_size < 0 or batch_size < 1 or short_scan_rows < 1 or long_scan_rows < 1:
+            raise ValueError("The rows, batch size and scan rows must be positive, the value size not negative.")
+        if not 0 <= read_ratio <= 1:
+            raise ValueError("Read ratio must be in [0, 1].")
+        self.rows = rows
+        self.batch_size = batch_size
+        self.short_scan_rows = short_scan_rows
+        self.long_scan_rows = long_scan_rows
+        self.read_ratio = read_ratio
+        # the values are generated once, so that the benchmark measures the client rather than the generation.
+        self.value = os.urandom(value_size)
+
+    def key(self, rng):
+        # type: (Random) -> bytes
+        return row_key(rng.randrange(self.rows))
+
+    def put(self, rng):
+        # type: (Random) -> Put
+        return Put(row=self.key(rng), family=FAMILY, qualifier=QUALIFIER, value=self.value)
+
+    def run_once(self, table, rng):
+        # type: (Table, Random) -> int
+        raise NotImplementedError
+
+    def to_dict(self):
+        # type: () -> Dict[str, object]
+        return {'rows': self.rows, 'value_size': len(self.value), 'batch_size': self.batch_size,
+                'short_scan_rows': self.short_scan_rows, 'long_scan_rows': self.long_scan_rows,
+                'read_ratio': self.read_ratio}
+
+
+def _check(result, name):
+    if result is False:
+        raise WorkloadError("The {} request failed.".format(name))
+    return result
+
+
+class PutWorkload(Workload):
+    name = 'put'
+
+    def run_once(self, table, rng):
+        _check(table.put(self.put(rng)), 'put')
+        return 1
+
+
+class BatchPutWorkload(Workload):
+    name = 'batch_put'
+
+    def run_once(self, table, rng):
+        _check(table.put_batch([self.put(rng) for _ in range(self.batch_size)]), 'put_batch')
+        return self.batch_size
+
+
+class GetWorkload(Workload):
+    name = 'get'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        table.get(Get(row=self.key(rng)))
+        return 1
+
+
+class BatchGetWorkload(Workload):
+    name = 'batch_get'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        _check(table.get_batch([Get(row=self.key(rng)) for _ in range(self.batch_size)]), 'get_batch')
+        return self.batch_size
+
+
+class ShortScanWorkload(Workload):
+    name = 'short_scan'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        cells = _check(table.scan(Scan(start_row=self.key(rng), num_rows=self.short_scan_rows)), 'scan')
+        return len(cells)
+
+
+class LongScanWorkload(Workload):
+    name = 'long_scan'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        rows = table.scan_iter(Scan(start_row=self.key(rng)), page_size=min(self.long_scan_rows, 1000))
+        count = 0
+        try:
+            for _ in rows:
+                count += 1
+                if count >= self.long_scan_rows:
+                    break
+        except RuntimeError as e:
+            raise WorkloadError(str(e))
+        finally:
+            rows.close()
+        return count
+
+
+class MixedWorkload(Workload):
+    name = 'mixed'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        if rng.random() < self.read_ratio:
+            table.get(Get(row=self.key(rng)))
+        else:
+            _check(table.put(self.put(rng)), 'put')
+        return 1
+
+
+class DeleteWorkload(Workload):
+    name = 'delete'
+    needs_data = True
+
+    def run_once(self, table, rng):
+        _check(table.delete(Delete(row=self.key(rng))), 'delete')
+        return 1
+
+
+# in the default order of running, the deletes last as they remove the rows read by the others.
+WORKLOAD_CLASSES = [PutWorkload, BatchPutWorkload, GetWorkload, BatchGetWorkload, ShortScanWorkload, LongScanWorkload,
+                    MixedWorkload, DeleteWorkload]
+WORKLOADS = dict((w.name, w) for w in WORKLOAD_CLASSES)
+
+
+def create_workload(name, **kwargs):
+    # type: (str, **object) -> Workload
+    """
+    Create a workload by its name, one of WORKLOADS.
+    """
+    if name not in WORKLOADS:
+        raise ValueError("Unknown workload {}. Use one of {}.".format(name, ', '.join(sorted(WORKLOADS))))
+    return WORKLOADS[name](**kwargs)
+
+
+def load(table, workload, batch_size=1000):
+    # type: (Table, Workload, int) -> None
+    """
+    Write every row of the key space of a workload.
+    """
+    for start in range(0, workload.rows, batch_size):
+        puts = [Put(row=row_key(i), family=FAMILY, qualifier=QUALIFIER, value=workload.value)
+                for i in range(start, min(start + batch_size, workload.rows))]
+        _check(table.put_batch(puts), 'put_batch')
+
+
+def names():
+    # type: () -> List[str]
+    return [w.name for w in WORKLOAD_CLASSES]
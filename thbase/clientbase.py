@@ -13,6 +13,8 @@ limitations under the License.
 """
 from thbase.config import ClientConfig
 from thbase.connection import Connection
+from thbase.pool import BalancedPool, ConnectionPool
+from thbase.balancer import LoadBalancer
 from thbase.util.handlers import ExceptionHandler, MessageType
 import abc
 import logging
@@ -37,20 +39,67 @@ class ClientBase(object):
             logger.error(ValueError(err_str))
             raise ValueError(err_str)
         self.conf = conf
-        self.connection = Connection(host=self.conf.host,
-                                     port=self.conf.port,
-                                     transport_type=self.conf.transport_type,
-                                     protocol_type=self.conf.protocol_type,
-                                     retry_timeout=self.conf.retry_timeout,
-                                     retry_times=self.conf.retry_times,
-                                     use_ssl=self.conf.use_ssl,
-                                     use_http=self.conf.use_http,
-                                     authentication=self.conf.authentication,
-                                     keep_alive=self.conf.keep_alive,
+        self.connection = None
+        self.pool = None
+        self.balancer = None
+        if len(self.conf.endpoints) > 1 or self.conf.region_routing:
+            self.balancer = LoadBalancer(self.conf.endpoints,
+                                         policy=self.conf.load_balance,
+                                         eject_failures=self.conf.eject_failures,
+                                         eject_time=self.conf.eject_time,
+                                         breaker=self.conf.circuit_breaker,
+                                         )
+        if self.conf.use_pool and self.balancer is not None:
+            self.pool = BalancedPool(balancer=self.balancer,
+                                     factory=self._new_connection,
+                                     min_size=self.conf.pool_min_size,
+                                     max_size=self.conf.pool_max_size,
+                                     timeout=self.conf.pool_timeout,
+                                     idle_timeout=self.conf.pool_idle_timeout,
+                                     route_port=self.conf.port if self.conf.region_routing else None,
                                      )
+        elif self.conf.use_pool:
+            self.pool = ConnectionPool(factory=self._new_connection,
+                                       min_size=self.conf.pool_min_size,
+                                       max_size=self.conf.pool_max_size,
+                                       timeout=self.conf.pool_timeout,
+                                       idle_timeout=self.conf.pool_idle_timeout,
+                                       )
+        else:
+            self.connection = self._new_connection()
+            # without a pool, the balancer only chooses the server to fail over to when reconnecting.
+            self.connection.balancer = self.balancer
         self._observers = set()
         self.attach(ExceptionHandler(self))
 
+    def _new_connection(self, host=None, port=None):
+        """
+        Create a new connection object from the configuration. The connection is not opened.
+        Args:
+            host: the thrift server address, the configured host by default.
+            port: the thrift server port, the configured port by default.
+
+        Returns:
+            a Connection object.
+        """
+        if host is None:
+            host, port = self.conf.host, self.conf.port
+        # with multiple thrift servers, each of them has its own circuit breaker.
+        breaker = self.balancer.add(host, port).breaker if self.balancer is not None else self.conf.circuit_breaker
+        return Connection(host=host,
+                          port=port,
+                          transport_type=self.conf.transport_type,
+                          protocol_type=self.conf.protocol_type,
+                          retry_timeout=self.conf.retry_timeout,
+                          retry_times=self.conf.retry_times,
+                          use_ssl=self.conf.use_ssl,
+                          use_http=self.conf.use_http,
+                          authentication=self.conf.authentication,
+                          keep_alive=self.conf.keep_alive,
+                          breaker=breaker,
+                          require_acceleration=self.conf.require_acceleration,
+                          )
+
     def attach(self, observer):
         """
         Add a new observer into the observer set.
@@ -90,10 +139,18 @@ class ClientBase(object):
     def open_connection(self):
         """
         This method open the connection with thrift server.
+        If the client uses a connection pool, the pool is filled with pool_min_size connections.
         Raise TTransport exception.
         Returns: True if success, else False.
 
         """
+        if self.pool is not None:
+            try:
+                self.pool.fill()
+                return True
+            except Exception as e:
+                self.notify(MessageType.ERROR, e)
+                return False
         try:
             if not self.connection.is_open():
                 self.connection.open()
@@ -106,9 +163,13 @@ class ClientBase(object):
     def close_connection(self):
         """
         This method close the current connection. The close() will not raise any exception and
-        will always success. Returns: None
+        will always success. If the client uses a connection pool, all the pooled connections are closed.
+        Returns: None
 
         """
+        if self.pool is not None:
+            self.pool.close()
+            return
         if self.connection.is_open():
             self.connection.close()
 
@@ -179,6 +240,72 @@ class ClientBase(object):
         """
         pass
 
+    @abc.abstractmethod
+    def _open_scanner(self, table_name, scan):
+        """
+        Open a scanner at thrift server. Only should be invoked by a Table object.
+        Args:
+            table_name: a str representation of Table name, including the namespace part.
+            scan: a Scan object.
+
+        Returns:
+            The id of the opened scanner if success, else False.
+            A client with a connection pool returns a ScannerHandle as the id.
+        """
+        pass
+
+    @abc.abstractmethod
+    def _get_scanner_rows(self, scanner_id, num_rows):
+        """
+        Fetch the next rows from an opened scanner. Only should be invoked by a Table object.
+        Args:
+            scanner_id: the id returned by _open_scanner.
+            num_rows: the max number of rows to fetch.
+
+        Returns:
+            A list of TResults if success. An empty list if the scanner is exhausted. False if the operation fails.
+        """
+        pass
+
+    @abc.abstractmethod
+    def _close_scanner(self, scanner_id):
+        """
+        Close an opened scanner and release its resources at thrift server.
+        Only should be invoked by a Table object.
+        Args:
+            scanner_id: the id returned by _open_scanner.
+
+        Returns:
+            True if successes, else False.
+        """
+        pass
+
+    @abc.abstractmethod
+    def _get_region_locations(self, table_name):
+        """
+        Get the locations of all the regions of a table. Only should be invoked by a Table object.
+        Args:
+            table_name: a str representation of Table name, including the namespace part.
+
+        Returns:
+            A list of THRegionLocations if success, else False.
+        """
+        pass
+
+    @abc.abstractmethod
+    def _get_region_location(self, table_name, row, reload):
+        """
+        Get the location of the region holding a row.
+        Args:
+            table_name: a str representation of Table name, including the namespace part.
+            row: the row key.
+            reload: if the thrift server should reload the location instead of using its cache.
+
+        Returns:
+            A THRegionLocation if success, else False.
+        """
+        pass
+
     @abc.abstractmethod
     def _delete_row(self, table_name, delete):
         """
@@ -206,6 +333,21 @@ class ClientBase(object):
         """
         pass
 
+    def _reconnect(self, lost=False):
+        """
+        Rebuild the connection used by the current request after a transport error.
+        Args:
+            lost: if True, the thrift server has closed the connection, so it is closed here and rebuilt to
+            another server if there is one.
+
+        Returns:
+            None
+        """
+        if lost:
+            self.connection.close()
+        self.connection._reconnect()
+        self._refresh_client()
+
     @abc.abstractmethod
     def _refresh_client(self):
         """
@@ -12,10 +12,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from enum import Enum
+from typing import List, Tuple, Union
 from thbase.util.login import LoginEntry
+from thbase.util.executor import RetryPolicy
+from thbase.util.breaker import CircuitBreaker
 
 TransportType = Enum('TransportType', ['FRAMED', 'BUFFERED'])
 ProtocolType = Enum('ProtocolType', ['BINARY', 'COMPACT'])
+LoadBalance = Enum('LoadBalance', ['ROUND_ROBIN', 'LEAST_OUTSTANDING', 'EWMA'])
+BatchStrategy = Enum('BatchStrategy', ['COUNT', 'REGION', 'ADAPTIVE'])
 
 HOST_DEFAULT = 'localhost'
 PORT_DEFAULT = 9090
@@ -24,6 +29,20 @@ PROTOCOL_DEFAULT = ProtocolType.BINARY
 RETRY_TIMEOUT_DEFAULT = 1
 RETRY_TIMES_DEFAULT = 10
 BATCH_SIZE_DEFAULT = 10
+BATCH_STRATEGY_DEFAULT = BatchStrategy.COUNT
+BATCH_BYTES_DEFAULT = 1024 * 1024
+BATCH_TARGET_LATENCY_DEFAULT = 0.1
+BATCH_CONCURRENCY_DEFAULT = 1
+SCAN_PAGE_SIZE_DEFAULT = 1000
+USE_POOL_DEFAULT = False
+POOL_MIN_SIZE_DEFAULT = 1
+POOL_MAX_SIZE_DEFAULT = 8
+POOL_TIMEOUT_DEFAULT = 10
+POOL_IDLE_TIMEOUT_DEFAULT = 300
+LOAD_BALANCE_DEFAULT = LoadBalance.ROUND_ROBIN
+EJECT_FAILURES_DEFAULT = 3
+EJECT_TIME_DEFAULT = 30
+REGION_CACHE_TTL_DEFAULT = 600
 USE_SSL_DEFAULT = False
 USE_HTTP_DEFAULT = False
 RECONNECTION_TIMES = 10
@@ -33,7 +52,7 @@ RECONNECTION_TIMEOUT = 10
 class ClientConfig(object):
     def __init__(self, thrift_host=HOST_DEFAULT,  # type: str
                  port=PORT_DEFAULT,  # type: int
-                 retry_timeout=RETRY_TIMES_DEFAULT,  # type: int
+                 retry_timeout=RETRY_TIMEOUT_DEFAULT,  # type: int
                  retry_times=RETRY_TIMES_DEFAULT,  # type: int
                  connection_retry_times=RECONNECTION_TIMES,  # type: int
                  connection_retry_timeout=RECONNECTION_TIMEOUT,  # type: int
@@ -44,6 +63,28 @@ class ClientConfig(object):
                  use_http=USE_HTTP_DEFAULT,  # type: bool
                  authentication=None,  # type: LoginEntry
                  keep_alive=False,
+                 scan_page_size=SCAN_PAGE_SIZE_DEFAULT,  # type: int
+                 use_pool=USE_POOL_DEFAULT,  # type: bool
+                 pool_min_size=POOL_MIN_SIZE_DEFAULT,  # type: int
+                 pool_max_size=POOL_MAX_SIZE_DEFAULT,  # type: int
+                 pool_timeout=POOL_TIMEOUT_DEFAULT,  # type: Union[None, int, float]
+                 pool_idle_timeout=POOL_IDLE_TIMEOUT_DEFAULT,  # type: Union[int, float]
+                 retry_policy=None,  # type: RetryPolicy
+                 circuit_breaker=None,  # type: CircuitBreaker
+                 endpoints=None,  # type: List[Union[str, Tuple[str, int]]]
+                 load_balance=LOAD_BALANCE_DEFAULT,  # type: LoadBalance
+                 eject_failures=EJECT_FAILURES_DEFAULT,  # type: int
+                 eject_time=EJECT_TIME_DEFAULT,  # type: Union[int, float]
+                 region_routing=False,  # type: bool
+                 region_cache_ttl=REGION_CACHE_TTL_DEFAULT,  # type: Union[None, int, float]
+                 batch_strategy=BATCH_STRATEGY_DEFAULT,  # type: BatchStrategy
+                 batch_bytes=BATCH_BYTES_DEFAULT,  # type: int
+                 batch_target_latency=BATCH_TARGET_LATENCY_DEFAULT,  # type: Union[int, float]
+                 batch_concurrency=BATCH_CONCURRENCY_DEFAULT,  # type: int
+                 require_acceleration=False,  # type: bool
+                 client_only_stubs=False,  # type: bool
+                 direct_decode=False,  # type: bool
+                 value_views=False,  # type: bool
                  ):
         """
         Basic client configuration.
@@ -63,6 +104,56 @@ class ClientConfig(object):
             Batch size can be customized with given setter method.
             use_http: if the client use http as the transport but not TCP.
             keep_alive: if the client keep the basic TCP socket alive.
+            scan_page_size: the number of rows fetched by one request when iterating a scanner with Table.scan_iter.
+            use_pool: if the client checks out a connection from a connection pool for each request.
+            A pooled client can be shared by multiple threads.
+            pool_min_size: the number of connections kept open in the pool even if they are idle.
+            pool_max_size: the max number of connections in the pool.
+            pool_timeout: seconds to wait for a free connection from the pool. None means wait forever.
+            pool_idle_timeout: seconds after which an idle connection beyond pool_min_size is closed.
+            retry_policy: a RetryPolicy object deciding the retries of operations, e.g.
+            ExponentialBackoffRetryPolicy. If it is None, operations are retried for retry_times times
+            with a fixed interval of retry_timeout seconds.
+            circuit_breaker: a CircuitBreaker object. If it is set, requests and reconnections fail fast with
+            CircuitOpenError while the thrift server is considered down. The breaker is shared by all the clients
+            created with this configuration. With multiple endpoints, each server gets its own breaker with the same
+            settings.
+            endpoints: a list of thrift servers as 'host:port' strings or (host, port) tuples. If it is set,
+            thrift_host and port are ignored. A pooled client balances the requests across the servers and sends
+            the retry of a request failed by a connection error to another server. A client without pool uses
+            a single server and switches to another one when reconnecting.
+            load_balance: the LoadBalance enum choosing the server of each request.
+            eject_failures: a server is ejected after this number of connection errors in a row.
+            eject_time: the seconds an ejected server is not chosen unless all the servers are ejected.
+            region_routing: if the client sends the requests on rows to the thrift server running on the host of the
+            region server holding the row. The thrift servers must listen on the same port as the configured server.
+            Only a pooled client supports it.
+            region_cache_ttl: the seconds the region locations of a table are cached by the client. None means
+            they are cached until they are invalidated.
+            batch_strategy: how the batch operations of a Table are split into requests.
+            BatchStrategy.COUNT sends batch_size operations per request in the input order.
+            BatchStrategy.REGION groups the operations by the region holding their rows and splits each group into
+            requests of about batch_bytes bytes, so each request is sent to a single region.
+            BatchStrategy.ADAPTIVE splits the operations in the input order into requests whose byte budget is tuned
+            online from the request latency and the requests rejected for their size.
+            batch_bytes: the estimated payload size of a request with BatchStrategy.REGION, and the initial one with
+            BatchStrategy.ADAPTIVE.
+            batch_target_latency: the seconds a batch request is expected to take with BatchStrategy.ADAPTIVE.
+            batch_concurrency: the max number of requests of a batch operation in flight at the same time.
+            More than one needs a connection pool.
+            require_acceleration: if True, creating a connection raises RuntimeError unless the thrift structs are
+            both encoded and decoded by the C extension of thrift. Otherwise a warning is logged once.
+            client_only_stubs: if True, send the requests with the generated module thbase.hbase.THBaseClient, which
+            only has the client side of the RPCs used by thbase, instead of the complete THBaseService. It is about 40%
+            of the size, so it takes less time to import and less memory.
+            direct_decode: if True, the rows returned by get, getMultiple, getScannerResults and getScannerRows are
+            decoded straight into light objects with only the fields the client uses, instead of the generated
+            TResult and TColumnValue structs. The Table methods return the same Cells either way, but the results
+            of the low level Client methods are no longer TResult objects.
+            value_views: if True, the values of the returned cells are memoryview slices of the response they come
+            in instead of bytes copies. The response is kept in memory as long as any of its values is. It saves
+            the copies of large values, e.g. blobs of tens of KB, but parsing in place is slower for small values.
+            It needs direct_decode.
         """
         self._host = thrift_host
         self._port = port
@@ -77,6 +168,31 @@ class ClientConfig(object):
         self._use_http = use_http
         self._authentication = authentication
         self._keep_alive = keep_alive
+        self._scan_page_size = scan_page_size
+        self._use_pool = use_pool
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+        self._pool_timeout = pool_timeout
+        self._pool_idle_timeout = pool_idle_timeout
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._endpoints = [(thrift_host, port)] if endpoints is None else \
+            [self._parse_endpoint(endpoint) for endpoint in endpoints]
+        if self._endpoints:
+            self._host, self._port = self._endpoints[0]
+        self._load_balance = load_balance
+        self._eject_failures = eject_failures
+        self._eject_time = eject_time
+        self._region_routing = region_routing
+        self._region_cache_ttl = region_cache_ttl
+        self._batch_strategy = batch_strategy
+        self._batch_bytes = batch_bytes
+        self._batch_target_latency = batch_target_latency
+        self._batch_concurrency = batch_concurrency
+        self._require_acceleration = require_acceleration
+        self._client_only_stubs = client_only_stubs
+        self._direct_decode = direct_decode
+        self._value_views = value_views
         self._parameter_check()
 
     def _parameter_check(self):
@@ -88,18 +204,86 @@ class ClientConfig(object):
             raise ValueError("Time interval for connection rebuild must be a positive integer.")
         if not isinstance(self.batch_size, int) or self.batch_size < 1:
             raise ValueError("Batch size must be a positive integer.")
+        if not isinstance(self.scan_page_size, int) or self.scan_page_size < 1:
+            raise ValueError("Scan page size must be a positive integer.")
         if not isinstance(self.use_ssl, bool):
             raise ValueError("Parameter use_ssl must be a bool value.")
         if not isinstance(self.use_http, bool):
             raise ValueError("Parameter use_http must be a bool value.")
+        if not isinstance(self.use_pool, bool):
+            raise ValueError("Parameter use_pool must be a bool value.")
+        if not isinstance(self.pool_max_size, int) or self.pool_max_size < 1:
+            raise ValueError("Pool max size must be a positive integer.")
+        if not isinstance(self.pool_min_size, int) or not 0 <= self.pool_min_size <= self.pool_max_size:
+            raise ValueError("Pool min size must be an integer in 0~pool_max_size.")
+        if self.pool_timeout is not None and (not isinstance(self.pool_timeout, (int, float)) or self.pool_timeout <= 0):
+            raise ValueError("Pool timeout must be a positive number or None.")
+        if not isinstance(self.pool_idle_timeout, (int, float)) or self.pool_idle_timeout < 0:
+            raise ValueError("Pool idle timeout must be a non-negative number.")
         if self._authentication is not None and not isinstance(self._authentication, LoginEntry):
             raise ValueError("Parameter authentication must be a LoginEntry object or None.")
-        if self._transport_type not in TransportType:
+        if not isinstance(self._transport_type, TransportType):
             raise ValueError("Invalid type of transport {}. Use one of the specific enum type {}."
                              .format(type(self._transport_type), ', '.join([str(a) for a in TransportType])))
-        if self._protocol_type not in ProtocolType:
+        if not isinstance(self._protocol_type, ProtocolType):
             raise ValueError("Invalid type of protocol {}. Use one of the specific enum type {}."
                              .format(type(self._protocol_type), ', '.join([str(a) for a in ProtocolType])))
+        if self.retry_policy is not None and not isinstance(self.retry_policy, RetryPolicy):
+            raise ValueError("Retry policy must be a RetryPolicy object or None.")
+        if self.circuit_breaker is not None and not isinstance(self.circuit_breaker, CircuitBreaker):
+            raise ValueError("Circuit breaker must be a CircuitBreaker object or None.")
+        if not self.endpoints:
+            raise ValueError("Endpoints must contain at least one server.")
+        for _, port in self.endpoints:
+            if not isinstance(port, int) or port not in range(65536):
+                raise ValueError("Port must be an integer in 0~65535.")
+        if not isinstance(self.load_balance, LoadBalance):
+            raise ValueError("Invalid load balance policy {}. Use one of the specific enum type {}."
+                             .format(self.load_balance, ', '.join([str(p) for p in LoadBalance])))
+        if not isinstance(self.eject_failures, int) or self.eject_failures < 1:
+            raise ValueError("Eject failures must be a positive integer.")
+        if not isinstance(self.eject_time, (int, float)) or self.eject_time < 0:
+            raise ValueError("Eject time must be a non-negative number.")
+        if not isinstance(self.region_routing, bool):
+            raise ValueError("Parameter region_routing must be a bool value.")
+        if self.region_routing and not self.use_pool:
+            raise ValueError("Region routing needs a connection pool, set use_pool to True.")
+        if self.region_cache_ttl is not None and \
+                (not isinstance(self.region_cache_ttl, (int, float)) or self.region_cache_ttl <= 0):
+            raise ValueError("Region cache TTL must be a positive number or None.")
+        if not isinstance(self.batch_strategy, BatchStrategy):
+            raise ValueError("Invalid batch strategy {}. Use one of the specific enum type {}."
+                             .format(self.batch_strategy, ', '.join([str(b) for b in BatchStrategy])))
+        if not isinstance(self.batch_bytes, int) or self.batch_bytes < 1:
+            raise ValueError("Batch bytes must be a positive integer.")
+        if not isinstance(self.batch_target_latency, (int, float)) or self.batch_target_latency <= 0:
+            raise ValueError("Batch target latency must be a positive number.")
+        if not isinstance(self.batch_concurrency, int) or self.batch_concurrency < 1:
+            raise ValueError("Batch concurrency must be a positive integer.")
+        if self.batch_concurrency > 1 and not self.use_pool:
+            raise ValueError("Concurrent batches need a connection pool, set use_pool to True.")
+        if not isinstance(self.require_acceleration, bool):
+            raise ValueError("Require acceleration must be a bool.")
+        if not isinstance(self.client_only_stubs, bool):
+            raise ValueError("Parameter client_only_stubs must be a bool value.")
+        if not isinstance(self.direct_decode, bool):
+            raise ValueError("Parameter direct_decode must be a bool value.")
+        if not isinstance(self.value_views, bool):
+            raise ValueError("Parameter value_views must be a bool value.")
+        if self.value_views and not self.direct_decode:
+            raise ValueError("Value views need direct decoding, set direct_decode to True.")
+
+    @staticmethod
+    def _parse_endpoint(endpoint):
+        if isinstance(endpoint, str):
+            host, sep, port = endpoint.rpartition(':')
+            if not sep or not port.isdigit():
+                raise ValueError("Invalid endpoint {}, it should be like 'host:port'.".format(endpoint))
+            return host, int(port)
+        if isinstance(endpoint, (tuple, list)) and len(endpoint) == 2:
+            return endpoint[0], endpoint[1]
+        raise ValueError("Invalid endpoint {}, it should be a 'host:port' string or a (host, port) tuple."
+                         .format(endpoint))
 
     @property
     def host(self):
@@ -152,3 +336,91 @@ class ClientConfig(object):
     @property
     def keep_alive(self):
         return self._keep_alive
+
+    @property
+    def scan_page_size(self):
+        return self._scan_page_size
+
+    @property
+    def use_pool(self):
+        return self._use_pool
+
+    @property
+    def pool_min_size(self):
+        return self._pool_min_size
+
+    @property
+    def pool_max_size(self):
+        return self._pool_max_size
+
+    @property
+    def pool_timeout(self):
+        return self._pool_timeout
+
+    @property
+    def pool_idle_timeout(self):
+        return self._pool_idle_timeout
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+    @property
+    def endpoints(self):
+        return self._endpoints
+
+    @property
+    def load_balance(self):
+        return self._load_balance
+
+    @property
+    def eject_failures(self):
+        return self._eject_failures
+
+    @property
+    def eject_time(self):
+        return self._eject_time
+
+    @property
+    def region_routing(self):
+        return self._region_routing
+
+    @property
+    def region_cache_ttl(self):
+        return self._region_cache_ttl
+
+    @property
+    def batch_strategy(self):
+        return self._batch_strategy
+
+    @property
+    def batch_bytes(self):
+        return self._batch_bytes
+
+    @property
+    def batch_target_latency(self):
+        return self._batch_target_latency
+
+    @property
+    def batch_concurrency(self):
+        return self._batch_concurrency
+
+    @property
+    def require_acceleration(self):
+        return self._require_acceleration
+
+    @property
+    def client_only_stubs(self):
+        return self._client_only_stubs
+
+    @property
+    def direct_decode(self):
+        return self._direct_decode
+
+    @property
+    def value_views(self):
+        return self._value_views
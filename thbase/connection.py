@@ -12,12 +12,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import logging
+import select
 import time
 
 from thrift.protocol import TBinaryProtocol, TCompactProtocol
 from thrift.transport.TSocket import TSocket
 from thrift.transport.TTransport import TBufferedTransport, TFramedTransport, TTransportException, TSaslClientTransport
-from thrift.transport.THttpClient import THttpClient
+from thrift.transport.TTransport import CReadableTransport
 
 from thbase.config import TransportType, ProtocolType
 
@@ -27,10 +28,44 @@ THRIFT_TRANSPORTS = {
     TransportType.BUFFERED: TBufferedTransport,
     TransportType.FRAMED: TFramedTransport,
 }
+# the accelerated protocols encode and decode the structs with the C extension of thrift if it is installed,
+# and fall back to the pure python protocols otherwise.
 THRIFT_PROTOCOLS = {
-    ProtocolType.BINARY: TBinaryProtocol.TBinaryProtocol,
-    ProtocolType.COMPACT: TCompactProtocol.TCompactProtocol,
+    ProtocolType.BINARY: TBinaryProtocol.TBinaryProtocolAccelerated,
+    ProtocolType.COMPACT: TCompactProtocol.TCompactProtocolAccelerated,
 }
+# the combinations of protocol and transport already warned as not accelerated.
+_slow_paths = set()
+
+
+def has_fastbinary():
+    # type: () -> bool
+    """
+    Check if the C extension of thrift, thrift.protocol.fastbinary, is installed.
+    """
+    try:
+        from thrift.protocol import fastbinary  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def protocol_acceleration(protocol):
+    """
+    Report whether the generated structs are encoded and decoded by the C extension through a protocol.
+    The generated code encodes with the extension if the protocol is an accelerated one, and decodes with it only if
+    the transport is also a CReadableTransport, e.g. a buffered or framed transport but not a http one.
+    Args:
+        protocol: a thrift protocol object.
+
+    Returns: a dict of protocol, transport: the class names, extension: if the C extension is installed,
+    encode, decode: if the structs are encoded and decoded by it.
+
+    """
+    encode = getattr(protocol, '_fast_encode', None) is not None
+    decode = getattr(protocol, '_fast_decode', None) is not None and isinstance(protocol.trans, CReadableTransport)
+    return {'protocol': type(protocol).__name__, 'transport': type(protocol.trans).__name__,
+            'extension': has_fastbinary(), 'encode': encode, 'decode': decode}
 
 
 class Connection(object):
@@ -49,7 +84,9 @@ class Connection(object):
                  use_ssl,
                  use_http,
                  authentication,
-                 keep_alive=False):
+                 keep_alive=False,
+                 breaker=None,
+                 require_acceleration=False):
 
         self.host = host
         self.port = port
@@ -57,12 +94,16 @@ class Connection(object):
         self.use_http = use_http
         self.authentication = authentication
         self.keep_alive = keep_alive
+        self.breaker = breaker
+        # a LoadBalancer choosing another thrift server when reconnecting, set by a client with multiple servers.
+        self.balancer = None
 
         self._transport_type = THRIFT_TRANSPORTS[transport_type]
         self._protocol_type = THRIFT_PROTOCOLS[protocol_type]
         self._retry_timeout = retry_timeout
         self._retry_times = retry_times
         self._rebuild_protocol()
+        self.check_acceleration(require_acceleration)
         self._initialized = True
 
     def _rebuild_protocol(self):
@@ -74,9 +115,12 @@ class Connection(object):
         """
         if self.use_http:
             # if use http transport,
+            # http.client, urllib and ssl are slow to import and only needed by the http transport.
+            from thrift.transport.THttpClient import THttpClient
             prefix = 'https://' if self.use_ssl else 'http://'
             self.transport = THttpClient(uri_or_host=prefix + self.host + ':' + str(self.port))
-            self.protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
+            self.protocol = TBinaryProtocol.TBinaryProtocolAccelerated(self.transport)
+            self.socket = None
             return
 
         if self.use_ssl:
@@ -84,6 +128,7 @@ class Connection(object):
             socket = TSSLSocket(host=self.host, port=self.port, validate=False, socket_keepalive=self.keep_alive)
         else:
             socket = TSocket(host=self.host, port=self.port, socket_keepalive=self.keep_alive)
+        self.socket = socket
 
         if self.authentication:
             socket = TSaslClientTransport(socket, host=self.host,
@@ -99,11 +144,81 @@ class Connection(object):
     def is_open(self):
         return self.transport.isOpen()
 
+    def acceleration(self):
+        """
+        Report whether the thrift structs sent and received through this connection are encoded and decoded by the
+        C extension of thrift. See protocol_acceleration().
+        Returns: a dict of protocol, transport, extension, encode and decode.
+
+        """
+        return protocol_acceleration(self.protocol)
+
+    def check_acceleration(self, strict=False):
+        """
+        Check if the structs are both encoded and decoded by the C extension on this connection.
+        If they are not, raise RuntimeError when strict is True, or log a warning once for each combination of
+        protocol and transport.
+        Returns: True if the accelerated path is active, else False.
+
+        """
+        report = self.acceleration()
+        if report['encode'] and report['decode']:
+            return True
+        if not report['extension']:
+            reason = "the C extension of thrift (thrift.protocol.fastbinary) is not installed"
+        else:
+            reason = "{} does not support the accelerated decoding".format(report['transport'])
+        message = "The thrift structs are {} in pure python through {} and {}, because {}.".format(
+            'encoded and decoded' if not report['encode'] else 'decoded', report['protocol'], report['transport'],
+            reason)
+        if strict:
+            raise RuntimeError(message)
+        key = (report['protocol'], report['transport'])
+        if key not in _slow_paths:
+            _slow_paths.add(key)
+            logger.warning(message)
+        return False
+
+    def is_healthy(self):
+        """
+        Check if the connection can be used to send a request.
+        An idle connection should never have data to read, so a readable socket means the server closed it
+        or the stream is out of sync.
+        Returns: True if the connection is open and healthy, else False.
+
+        """
+        if not self.is_open():
+            return False
+        handle = getattr(self.socket, 'handle', None)
+        if handle is None:
+            return True
+        try:
+            readable, _, _ = select.select([handle], [], [], 0)
+        except (ValueError, OSError, select.error):
+            return False
+        return not readable
+
     def open(self):
         if self.transport.isOpen():
             return
         logger.debug("Opening thrift transport throught TCP connection.")
-        self.transport.open()
+        self._open_transport()
+
+    def _open_transport(self):
+        """
+        Open the transport through the circuit breaker if there is one.
+        Raise CircuitOpenError without connecting if the breaker is open.
+        """
+        if self.breaker is None:
+            self.transport.open()
+            return
+        self.breaker.check()
+        try:
+            self.transport.open()
+        except TTransportException:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
 
     def close(self):
         if not self.transport.isOpen():
@@ -115,6 +230,8 @@ class Connection(object):
     def _reconnect(self):
         """
         Method to rebuild the connection with thrift server. Should not be used by the user directly.
+        If the circuit breaker opens while reconnecting, CircuitOpenError is raised at once instead of
+        retrying the rest times.
         Returns: None
 
         """
@@ -124,17 +241,48 @@ class Connection(object):
                 if self.transport.isOpen():
                     logger.info("Reconnection success after retrying {} times.".format(i))
                     return True
+                if self.balancer is not None:
+                    self._switch_endpoint()
                 self._rebuild_protocol()
                 try:
-                    logger.info("Starting reconnection to thrift server.")
-                    self.transport.open()
+                    logger.info("Starting reconnection to thrift server {}:{}.".format(self.host, self.port))
+                    self._open_transport()
+                    self._report_endpoint(failed=False)
                     logger.info("Reconnection success after retrying {} times.".format(i + 1))
                     return True
                 except TTransportException:
+                    self._report_endpoint(failed=True)
                     logger.error("Reconnected {} times but failed.".format(i + 1))
+                    if self.breaker is not None:
+                        # fail fast instead of sleeping if the failure has opened the breaker.
+                        self.breaker.check()
                     time.sleep(self._retry_timeout)
             if not self.transport.isOpen():
                 logger.error("Failed to rebuild connection with target thrift server.")
                 raise TTransportException(type=TTransportException.NOT_OPEN,
                                           message="Failed to rebuild connection with target thrift server.")
             return False
+
+    def _endpoint(self):
+        for endpoint in self.balancer.endpoints:
+            if endpoint.host == self.host and endpoint.port == self.port:
+                return endpoint
+        return None
+
+    def _switch_endpoint(self):
+        """
+        Switch to another thrift server chosen by the balancer, avoiding the current one if possible.
+        """
+        current = self._endpoint()
+        endpoint = self.balancer.choose(exclude=[current]) or current
+        if endpoint is not None and endpoint is not current:
+            logger.warning("Fail over from thrift server {}:{} to {}.".format(self.host, self.port, endpoint))
+            self.host, self.port = endpoint.host, endpoint.port
+            self.breaker = endpoint.breaker
+
+    def _report_endpoint(self, failed):
+        if self.balancer is None:
+            return
+        endpoint = self._endpoint()
+        if endpoint is not None:
+            self.balancer.report(endpoint, failed)
@@ -1 +1,22 @@
-__all__ = ['ttypes', 'constants', 'THBaseService']
+__all__ = ['ttypes', 'constants', 'THBaseService', 'THBaseClient']
+
+
+def __getattr__(name):
+    # the generated modules are large, load them on first access, e.g. thbase.hbase.THBaseService.
+    if name in __all__:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def service_module(client_only=False):
+    """
+    Import the generated service module the clients send their requests with.
+    Args:
+        client_only: if True, the client-only subset THBaseClient generated by thbase.util.stubgen, otherwise the
+        complete THBaseService.
+
+    Returns: the module.
+    """
+    import importlib
+    return importlib.import_module('.THBaseClient' if client_only else '.THBaseService', __name__)
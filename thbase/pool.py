@@ -0,0 +1,340 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from collections import deque
+from thrift.transport.TTransport import TTransportException
+from thbase.util.breaker import CircuitOpenError
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    """
+    Raised when no connection can be checked out from a ConnectionPool before the checkout timeout.
+    """
+    pass
+
+
+class ConnectionPool(object):
+    """
+    A thread-safe pool of Connection objects to the same thrift server.
+    Connections are created lazily up to max_size and reused in LIFO order, so the most recently used
+    connections stay warm while the others become idle and get evicted after idle_timeout.
+    A connection is checked before it is handed out, broken ones are dropped and replaced.
+    User should not use instances of this class directly. The instances should be managed by a Client object.
+    """
+    def __init__(self, factory, min_size, max_size, timeout, idle_timeout):
+        """
+        Args:
+            factory: a callable returning a new, not opened Connection object.
+            min_size: the number of connections kept open even if they are idle.
+            max_size: the max number of connections, including the checked out ones.
+            timeout: seconds to wait for a free connection. None means wait forever.
+            idle_timeout: seconds after which an idle connection beyond min_size is closed.
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool size must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._idle = deque()  # (connection, released_at), the right end is the most recently used.
+        self._size = 0
+        # connections opened since the last close(), the others are closed when they are released.
+        self._members = set()
+        self._cond = threading.Condition(threading.Lock())
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle_size(self):
+        return len(self._idle)
+
+    def fill(self):
+        """
+        Open connections until the pool holds min_size of them.
+        Raise TTransportException if a connection cannot be opened.
+        Returns: None
+        """
+        while True:
+            with self._cond:
+                if self._size >= self._min_size:
+                    return
+                self._size += 1
+            conn = self._open_new()
+            self.release(conn)
+
+    def acquire(self):
+        """
+        Check out a healthy, opened connection. The connection must be given back by release().
+        Raise PoolTimeoutError if there is no free connection before timeout,
+        or TTransportException if a new connection cannot be opened.
+        Returns: a Connection object.
+        """
+        deadline = None if self._timeout is None else time.time() + self._timeout
+        with self._cond:
+            while True:
+                self._evict_idle()
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    if conn.is_healthy():
+                        return conn
+                    logger.info("Drop a broken connection to {}:{} from the pool.".format(conn.host, conn.port))
+                    self._discard(conn)
+                if self._size < self._max_size:
+                    self._size += 1
+                    break
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutError("Timed out after {} seconds waiting for a free connection. "
+                                           "All {} connections are in use.".format(self._timeout, self._max_size))
+                self._cond.wait(remaining)
+        return self._open_new()
+
+    def release(self, conn):
+        """
+        Give back a checked out connection. Closed connections are dropped from the pool.
+        Args:
+            conn: a Connection object returned by acquire().
+
+        Returns: None
+        """
+        with self._cond:
+            if conn not in self._members or not conn.is_open():
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.time()))
+            self._cond.notify()
+
+    def close(self):
+        """
+        Close all the idle connections. Connections still checked out are closed when they are released.
+        The pool can still be used after closing, new connections will be opened on demand.
+        Returns: None
+        """
+        with self._cond:
+            self._members.clear()
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def _open_new(self):
+        """
+        Create and open a new connection for a slot which has already been counted in size.
+        """
+        try:
+            conn = self._factory()
+            conn.open()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._members.add(conn)
+        return conn
+
+    def _evict_idle(self):
+        """
+        Close the connections which stay idle longer than idle_timeout, keeping at least min_size connections.
+        Must be called with the lock held.
+        """
+        now = time.time()
+        # the least recently used connections are at the left end.
+        while self._idle and self._size > self._min_size and now - self._idle[0][1] > self._idle_timeout:
+            conn, _ = self._idle.popleft()
+            logger.debug("Close an idle connection to {}:{}.".format(conn.host, conn.port))
+            self._discard(conn)
+
+    def _discard(self, conn):
+        """
+        Close a connection and free its slot. Must be called with the lock held.
+        """
+        self._size -= 1
+        self._members.discard(conn)
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug("Failed to close a connection: {}".format(e))
+
+
+class BalancedPool(object):
+    """
+    A thread-safe set of ConnectionPool objects, one for each thrift server, which balances the checkouts
+    across the servers with a LoadBalancer.
+    A connection which is closed when it is released is counted as a failure of its server, and the next checkout
+    of the same thread goes to another server if there is one, so that the retry of a failed request fails over.
+    If a new connection cannot be opened, or the circuit breaker of a server is open, the other servers are tried
+    before raising the error.
+    User should not use instances of this class directly. The instances should be managed by a Client object.
+    """
+    def __init__(self, balancer, factory, min_size, max_size, timeout, idle_timeout, route_port=None):
+        """
+        Args:
+            balancer: a LoadBalancer object.
+            factory: a callable accepting a host and a port and returning a new, not opened Connection object.
+            min_size: the number of connections kept open for each server even if they are idle.
+            max_size: the max number of connections for each server, including the checked out ones.
+            timeout: seconds to wait for a free connection. None means wait forever.
+            idle_timeout: seconds after which an idle connection beyond min_size is closed.
+            route_port: the port of the thrift servers running on the hosts requested by acquire(host).
+        """
+        self.balancer = balancer
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._route_port = route_port
+        self._pools = {}
+        for endpoint in balancer.endpoints:
+            self._pools[endpoint] = self._new_pool(endpoint)
+        self._checked_out = {}  # connection -> (endpoint, checked out at)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _new_pool(self, endpoint):
+        host, port, factory = endpoint.host, endpoint.port, self._factory
+        return ConnectionPool(factory=lambda: factory(host, port),
+                              min_size=self._min_size,
+                              max_size=self._max_size,
+                              timeout=self._timeout,
+                              idle_timeout=self._idle_timeout,
+                              )
+
+    @property
+    def size(self):
+        return sum(pool.size for pool in list(self._pools.values()))
+
+    @property
+    def idle_size(self):
+        return sum(pool.idle_size for pool in list(self._pools.values()))
+
+    def fill(self):
+        """
+        Open min_size connections to each server.
+        Raise TTransportException only if no server can be connected.
+        Returns: None
+        """
+        error = None
+        for endpoint, pool in list(self._pools.items()):
+            try:
+                pool.fill()
+            except TTransportException as e:
+                logger.warning("Failed to open connections to thrift server {}: {}".format(endpoint, e))
+                self.balancer.report(endpoint, failed=True)
+                error = e
+        if error is not None and all(pool.size == 0 for pool in list(self._pools.values())):
+            raise error
+
+    def acquire(self, host=None, port=None):
+        """
+        Check out a connection to the thrift server running on the given host, or to the server chosen by the
+        load balancer if the host is not given, is ejected or cannot be connected.
+        If the port is given too, the connection is always to that server, e.g. the one holding an opened scanner,
+        and it is not failed over.
+        Raise PoolTimeoutError if there is no free connection before timeout,
+        or TTransportException or CircuitOpenError if no server can be connected.
+        Args:
+            host: the host of the preferred thrift server, whose port is route_port.
+            port: the port of the required thrift server on the host.
+
+        Returns: a Connection object.
+        """
+        avoid = getattr(self._local, 'avoid', None)
+        self._local.avoid = None
+        if host is not None and port is not None:
+            endpoint = self._endpoint_of(host, port)
+            try:
+                return self._checkout(endpoint)
+            except TTransportException:
+                self.balancer.report(endpoint, failed=True)
+                raise
+        tried = set()
+        error = None
+        if host is not None and self._route_port is not None:
+            endpoint = self._endpoint_of(host)
+            if endpoint is not avoid and endpoint.ejected_until <= time.time():
+                try:
+                    return self._checkout(endpoint)
+                except CircuitOpenError as e:
+                    logger.warning("The circuit breaker of thrift server {} is open, try another one.".format(endpoint))
+                    tried.add(endpoint)
+                    error = e
+                except TTransportException as e:
+                    logger.warning("Failed to connect to thrift server {}, try another one. {}".format(endpoint, e))
+                    self.balancer.report(endpoint, failed=True)
+                    tried.add(endpoint)
+                    error = e
+        while True:
+            endpoint = self.balancer.choose(exclude=tried | {avoid}) or self.balancer.choose(exclude=tried)
+            if endpoint is None:
+                raise error
+            try:
+                return self._checkout(endpoint)
+            except CircuitOpenError as e:
+                logger.warning("The circuit breaker of thrift server {} is open, try another one.".format(endpoint))
+                tried.add(endpoint)
+                error = e
+            except TTransportException as e:
+                logger.warning("Failed to connect to thrift server {}, try another one. {}".format(endpoint, e))
+                self.balancer.report(endpoint, failed=True)
+                tried.add(endpoint)
+                error = e
+
+    def _endpoint_of(self, host, port=None):
+        endpoint = self.balancer.add(host, self._route_port if port is None else port)
+        with self._lock:
+            if endpoint not in self._pools:
+                self._pools[endpoint] = self._new_pool(endpoint)
+        return endpoint
+
+    def _checkout(self, endpoint):
+        if endpoint.breaker is not None:
+            endpoint.breaker.check()
+        conn = self._pools[endpoint].acquire()
+        self.balancer.begin(endpoint)
+        with self._lock:
+            self._checked_out[conn] = (endpoint, time.time())
+        return conn
+
+    def release(self, conn):
+        """
+        Give back a checked out connection. A closed connection marks a failure of its server.
+        Args:
+            conn: a Connection object returned by acquire().
+
+        Returns: None
+        """
+        with self._lock:
+            endpoint, start = self._checked_out.pop(conn)
+        failed = not conn.is_open()
+        self.balancer.end(endpoint, time.time() - start, failed)
+        if failed:
+            self._local.avoid = endpoint
+        self._pools[endpoint].release(conn)
+
+    def close(self):
+        """
+        Close the idle connections of all the servers.
+        Returns: None
+        """
+        for pool in list(self._pools.values()):
+            pool.close()
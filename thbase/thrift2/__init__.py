@@ -11,4 +11,4 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-__all__ = ['cell', 'client', 'table', 'operation']
+__all__ = ['aio', 'batch', 'batcher', 'cell', 'client', 'table', 'mutator', 'operation', 'region', 'resultset', 'server']
@@ -0,0 +1,518 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from typing import AsyncIterator, List, Union
+from thrift.Thrift import TApplicationException, TMessageType
+from thrift.transport.TTransport import TMemoryBuffer, TTransportException
+from thbase.config import ClientConfig, TransportType
+from thbase.connection import THRIFT_PROTOCOLS
+from thbase.hbase import service_module
+from thbase.hbase.ttypes import TException
+from thbase.thrift2.cell import Cell, Row, ResultType
+from thbase.thrift2.decoder import RESPONSES, VIEW_RESPONSES
+from thbase.thrift2.operation import Get, Put, Delete, Scan
+from thbase.thrift2.resultset import ResultSet
+from thbase.thrift2.table import ScannerHandle, _format_results, _format_row
+from thbase.util import type_check
+from thbase.util.bytes import to_bytes, to_str
+from thbase.util.executor import AttemptStats, FixedRetryPolicy
+from thbase.util.handlers import ExceptionHandler, MessageType
+import asyncio
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncConnection(object):
+    """
+    A framed thrift connection driven by asyncio streams.
+    Requests are written as soon as they are issued without waiting for the former responses, and the responses
+    are matched to the requests by their sequence ids, so many requests can be in flight on one connection.
+    User should not use instances of this class directly. The instances should be managed by an AsyncClient object.
+    """
+    def __init__(self, host, port, protocol_type, use_ssl, service, responses=None):
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self._protocol_type = THRIFT_PROTOCOLS[protocol_type]
+        self._service = service
+        # RPC name -> the Response class of the decoder module decoding its result.
+        self._responses = responses or {}
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._write_lock = asyncio.Lock()
+        self._pending = {}  # seqid -> (future, result class)
+        self._seqid = 0
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def is_open(self):
+        return self._writer is not None
+
+    async def open(self):
+        if self.is_open():
+            return
+        ssl_context = None
+        if self.use_ssl:
+            import ssl
+            # keep the same behavior as the blocking client, which does not validate the server certificate.
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        logger.debug("Opening asyncio thrift connection to {}:{}.".format(self.host, self.port))
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+        except OSError as e:
+            raise TTransportException(type=TTransportException.NOT_OPEN,
+                                      message="Could not connect to {}:{}: {}".format(self.host, self.port, e))
+        self._read_task = asyncio.ensure_future(self._read_loop())
+
+    def close(self):
+        if not self.is_open():
+            return
+        logger.debug("Closing asyncio thrift connection to {}:{}.".format(self.host, self.port))
+        writer, self._writer = self._writer, None
+        writer.close()
+        if self._read_task is not None and not self._read_task.done():
+            self._read_task.cancel()
+        self._fail_pending(TTransportException(type=TTransportException.NOT_OPEN, message="Connection closed."))
+
+    async def call(self, name, args):
+        """
+        Send a request and wait for its response.
+        Args:
+            name: the name of the THBaseService method.
+            args: the *_args struct of the method.
+
+        Returns:
+            The success value of the response, None if the method returns void.
+        """
+        if not self.is_open():
+            raise TTransportException(type=TTransportException.NOT_OPEN, message="Connection is not open.")
+        self._seqid = (self._seqid + 1) & 0x7fffffff
+        seqid = self._seqid
+        buf = TMemoryBuffer()
+        oprot = self._protocol_type(buf)
+        oprot.writeMessageBegin(name, TMessageType.CALL, seqid)
+        args.write(oprot)
+        oprot.writeMessageEnd()
+        payload = buf.getvalue()
+        future = asyncio.get_event_loop().create_future()
+        result_type = self._responses.get(name) or getattr(self._service, name + '_result')
+        self._pending[seqid] = (future, result_type)
+        try:
+            async with self._write_lock:
+                self._writer.write(struct.pack('!i', len(payload)) + payload)
+                await self._writer.drain()
+        except (OSError, AttributeError) as e:
+            self._pending.pop(seqid, None)
+            self.close()
+            raise TTransportException(type=TTransportException.NOT_OPEN, message="Failed to send request: {}".format(e))
+        return _unwrap(name, await future)
+
+    async def _read_loop(self):
+        """
+        Read the response frames and resolve the futures of the corresponding requests.
+        """
+        try:
+            while True:
+                header = await self._reader.readexactly(4)
+                size, = struct.unpack('!i', header)
+                if size < 0:
+                    raise TTransportException(type=TTransportException.NEGATIVE_SIZE,
+                                              message="Read a frame with negative length.")
+                iprot = self._protocol_type(TMemoryBuffer(await self._reader.readexactly(size)))
+                _, mtype, seqid = iprot.readMessageBegin()
+                future, result_type = self._pending.pop(seqid, (None, None))
+                if mtype == TMessageType.EXCEPTION:
+                    result = TApplicationException()
+                else:
+                    result = result_type() if result_type is not None else None
+                if result is not None:
+                    result.read(iprot)
+                iprot.readMessageEnd()
+                if future is None:
+                    logger.warning("Drop a response with unknown sequence id {}.".format(seqid))
+                elif not future.done():
+                    future.set_result(result)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, OSError) as e:
+            logger.warning("Connection to {}:{} is lost: {}".format(self.host, self.port, e))
+            self._lost(TTransportException(type=TTransportException.NOT_OPEN,
+                                           message="Connection closed by the thrift server."))
+        except Exception as e:
+            # the stream is out of sync, the connection cannot be used any more.
+            self._lost(e)
+
+    def _lost(self, error):
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        self._fail_pending(error)
+
+    def _fail_pending(self, error):
+        pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+
+def _unwrap(name, result):
+    """
+    Return the success value of a *_result struct or raise the exception it carries.
+    """
+    if isinstance(result, TApplicationException):
+        raise result
+    spec = type(result).thrift_spec
+    for field in spec[1:]:
+        if field is not None and getattr(result, field[2]) is not None:
+            raise getattr(result, field[2])
+    if spec[0] is None:
+        return None
+    if result.success is None:
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "{} failed: unknown result".format(name))
+    return result.success
+
+
+class AsyncClient(object):
+    """
+    Client implemented by thrift2 API with asyncio.
+    The requests are multiplexed over a small set of framed connections, each request is sent through the
+    connection with the least requests in flight. Only framed transport over TCP is supported.
+    Use AsyncClient.get_table(table_name) to get an AsyncTable object to do operations.
+    """
+    def __init__(self, conf, connections=1):
+        """
+        Args:
+            conf: a customized ClientConfig object.
+            connections: the number of connections the requests are multiplexed over. If the configuration has
+            multiple endpoints, use at least one connection for each of them.
+        """
+        if not isinstance(conf, ClientConfig):
+            raise ValueError("Invalid Client Configuration type {}.".format(type(conf)))
+        if conf.transport_type != TransportType.FRAMED or conf.use_http or conf.authentication is not None:
+            raise ValueError("AsyncClient only supports framed transport over TCP without authentication.")
+        if not isinstance(connections, int) or connections < 1:
+            raise ValueError("Connections must be a positive integer.")
+        self.conf = conf
+        # the connections are spread over the configured servers in turn.
+        endpoints = conf.endpoints
+        self.service = service_module(conf.client_only_stubs)
+        responses = (VIEW_RESPONSES if conf.value_views else RESPONSES) if conf.direct_decode else None
+        self.connections = [AsyncConnection(endpoints[i % len(endpoints)][0], endpoints[i % len(endpoints)][1],
+                                            conf.protocol_type, conf.use_ssl, self.service, responses)
+                            for i in range(connections)]
+        self.handler = ExceptionHandler(self)
+        self.policy = conf.retry_policy if conf.retry_policy is not None \
+            else FixedRetryPolicy(conf.retry_times + 1, conf.retry_timeout)
+        self.stats = AttemptStats()
+
+    async def open_connection(self):
+        """
+        Open all the connections with thrift server.
+        Raise TTransportException if a connection cannot be opened.
+        Returns: True if success.
+        """
+        for conn in self.connections:
+            await conn.open()
+        return True
+
+    def close_connection(self):
+        """
+        Close all the connections. The requests in flight fail with TTransportException.
+        Returns: None
+        """
+        for conn in self.connections:
+            conn.close()
+
+    def _reconnect(self):
+        """
+        Private method, should not be used by users.
+        Called by the exception handler after a transport error. The lost connections have been closed already,
+        they will be reopened by the retry.
+        """
+        pass
+
+    async def _connection(self, scanner=None):
+        # a scanner only exists at the thrift server it is opened at.
+        connections = self.connections if scanner is None else \
+            [c for c in self.connections if c.host == scanner.host and c.port == scanner.port]
+        conn = min(connections, key=lambda c: (not c.is_open(), c.pending))
+        if not conn.is_open():
+            await conn.open()
+        return conn
+
+    async def _call(self, name, scanner=None, pin=False, **kwargs):
+        """
+        Private method, should not be used by users.
+        Send a request with the same retry policy as the Executor of the blocking client,
+        but wait between the retries with asyncio.sleep.
+        Args:
+            name: the name of the THBaseService method.
+            scanner: a ScannerHandle. The request is sent to the thrift server the scanner is opened at.
+            pin: if True, the result is wrapped into a ScannerHandle with the thrift server it comes from.
+            **kwargs: the arguments of the method.
+
+        Returns:
+            For Put, Delete operations: True if success, False otherwise.
+            For Get, Scan operations: A list of results, False otherwise.
+        """
+        args = getattr(self.service, name + '_args')(**kwargs)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        attempt = 0
+        backoff = 0
+        while True:
+            attempt += 1
+            try:
+                conn = await self._connection(scanner)
+                result = await conn.call(name, args)
+                self.stats.record(name, attempt, True)
+                if pin:
+                    return ScannerHandle(result, conn.host, conn.port)
+                if result is None:
+                    return True
+                return result
+            except TException as e:
+                if not self.handler.handle(MessageType.ERROR, value=e):
+                    self.stats.record(name, attempt, False)
+                    logger.error("There occurs an error that can not be handled. {}. "
+                                 "System is shutdown.".format(e.message))
+                    raise e
+                backoff = self.policy.next_backoff(attempt, loop.time() - start, backoff)
+                if backoff is None:
+                    self.stats.record(name, attempt, False)
+                    logger.error("An error occurs, {}. The operation failed after {} attempts.".
+                                 format(e.message, attempt))
+                    break
+                logger.warning("An error occurs, {}. Redo the operation after {} seconds.".
+                               format(e.message, backoff))
+            await asyncio.sleep(backoff)
+        return False
+
+    def attempt_stats(self):
+        """
+        The attempts made by the operations sent by this client.
+        Returns: a dict mapping the THBaseService method names to dicts of counters:
+        calls, attempts, failures (calls failed after all the attempts) and max_attempts (of a single call).
+
+        """
+        return self.stats.snapshot()
+
+    def get_table(self, table_name):
+        """
+        Acquire a table object to use functional methods.
+        Args:
+            table_name: a str representation of Table name, including the namespace part.
+
+        Returns: an AsyncTable object.
+
+        """
+        return AsyncTable(table_name=table_name, client=self)
+
+
+class AsyncTable(object):
+    """
+    Coroutine version of Table. Use AsyncClient.get_table(table_name) method to create a table object.
+    The chunks of a batch operation are sent concurrently.
+    """
+    def __init__(self, table_name, client):
+        self._name = to_bytes(table_name)
+        self._client = client
+        self.conf = client.conf
+
+    @property
+    def name(self):
+        # type: () -> bytes
+        return self._name
+
+    async def put(self, put):
+        # type: (Put) -> bool
+        """
+        Send a single Put operation to the thrift server.
+        Args:
+            put: A customized Put object.
+
+        Returns: True if successes, False otherwise.
+
+        """
+        type_check(put, Put)
+        return await self._client._call('put', table=self.name, tput=put.core)
+
+    async def put_batch(self, puts):
+        # type: (List[Put]) -> bool
+        """
+        Send multiple Put requests to the server at one time. The batches are sent concurrently.
+        Args:
+            puts: A list of Put objects
+
+        Returns: True if all the batches success, False otherwise.
+
+        """
+        type_check(puts, list)
+        for put in puts:
+            type_check(put, Put)
+        results = await asyncio.gather(*[
+            self._client._call('putMultiple', table=self.name, tputs=[put.core for put in chunk])
+            for chunk in self._chunks(puts)])
+        for i, result in enumerate(results):
+            if not result:
+                logger.error("The Put requests in batch {} failed.".format(i))
+        return all(results)
+
+    async def get(self, get, result_type=ResultType.CELL):
+        # type: (Get, ResultType) -> Union[List[Cell], Row, ResultSet, None]
+        """
+        Send a single Get operation to the thrift server.
+        Args:
+            get: A customized Get object.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a Row object,
+            ResultType.COLUMNAR to return a ResultSet.
+
+        Returns: If success: a list of cells, or a Row with ResultType.ROW, or a ResultSet with ResultType.COLUMNAR.
+                 If success but not matched data or get failed: an empty list, or None with ResultType.ROW.
+
+        """
+        type_check(get, Get)
+        result = await self._client._call('get', table=self.name, tget=get.core)
+        if result_type == ResultType.ROW:
+            rows = _format_results(self._name, [result] if result else [], result_type)
+            return rows[0] if rows else None
+        if not result and result_type == ResultType.CELL:
+            return []
+        return _format_results(self._name, [result] if result else [], result_type)
+
+    async def get_batch(self, gets, result_type=ResultType.CELL):
+        # type: (List[Get], ResultType) -> Union[List[Cell], List[Row], ResultSet]
+        """
+        Send multiple Get requests to the server at one time. The batches are sent concurrently.
+        Args:
+            gets: A list of Get objects.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a list of Rows,
+            ResultType.COLUMNAR to return a ResultSet.
+
+        Returns: a list of cells or Rows, or a ResultSet, in the order of the gets. The results of the failed batches are skipped.
+
+        """
+        type_check(gets, (list, tuple))
+        for get in gets:
+            type_check(get, Get)
+        results = await asyncio.gather(*[
+            self._client._call('getMultiple', table=self.name, tgets=[get.core for get in chunk])
+            for chunk in self._chunks(gets)])
+        result_list = []
+        for i, result in enumerate(results):
+            if result is False:
+                logger.error("The Get requests in batch {} failed.".format(i))
+            else:
+                result_list += result
+        return _format_results(self._name, result_list, result_type)
+
+    async def scan(self, scan, result_type=ResultType.CELL):
+        # type: (Scan, ResultType) -> Union[List[Cell], List[Row], ResultSet]
+        """
+        Send a Scan request to the thrift server.
+        Args:
+            scan: A single Scan object.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a list of Rows,
+            ResultType.COLUMNAR to return a ResultSet.
+
+        Returns: If success: a list of cells or Rows, or a ResultSet.
+                 If success but not matched data or scan failed: an empty list.
+
+        """
+        type_check(scan, Scan)
+        results = await self._client._call('getScannerResults', table=self.name, tscan=scan.core,
+                                           numRows=scan.num_rows)
+        return _format_results(self._name, results, result_type)
+
+    async def scan_iter(self, scan, page_size=None, result_type=ResultType.CELL):
+        # type: (Scan, int, ResultType) -> AsyncIterator[Union[List[Cell], Row]]
+        """
+        Iterate the results of a Scan request row by row through a scanner opened at the thrift server.
+        The scanner is always closed when the iteration ends, fails or the generator is closed.
+        Args:
+            scan: A single Scan object.
+            page_size: the number of rows fetched by one request. Use ClientConfig.scan_page_size if it is None.
+            result_type: ResultType.CELL to yield a list of cells for each row, ResultType.ROW to yield Rows.
+
+        Returns: An async generator which yields a list of cells or a Row for each row.
+
+        """
+        type_check(scan, Scan)
+        if page_size is None:
+            page_size = self.conf.scan_page_size
+        if result_type == ResultType.COLUMNAR:
+            raise ValueError("Iterating a scan yields rows, use scan() to get a ResultSet.")
+        scanner = await self._client._call('openScanner', pin=True, table=self.name, tscan=scan.core)
+        if scanner is False:
+            raise RuntimeError("Failed to open a scanner on table {}.".format(to_str(self.name)))
+        try:
+            while True:
+                results = await self._client._call('getScannerRows', scanner=scanner, scannerId=scanner.id,
+                                                   numRows=page_size)
+                if results is False:
+                    raise RuntimeError("Failed to fetch rows from scanner {} on table {}."
+                                       .format(scanner, to_str(self.name)))
+                if not results:
+                    return
+                for result in results:
+                    yield _format_row(self._name, result, result_type)
+        finally:
+            try:
+                await self._client._call('closeScanner', scanner=scanner, scannerId=scanner.id)
+            except Exception as e:
+                logger.warning("Failed to close scanner {} on table {}: {}".format(scanner, to_str(self.name), e))
+
+    async def delete(self, delete):
+        # type: (Delete) -> bool
+        """
+        Send a Delete request to the thrift server.
+        Args:
+            delete: a single Delete object
+
+        Returns: True if successes, False otherwise.
+
+        """
+        type_check(delete, Delete)
+        return await self._client._call('deleteSingle', table=self.name, tdelete=delete.core)
+
+    async def delete_batch(self, batch):
+        # type: (List[Delete]) -> bool
+        """
+        Send a list of Delete requests to the thrift server. The batches are sent concurrently.
+        Args:
+            batch: a list of Delete objects.
+
+        Returns: True if all the batches success, False otherwise.
+
+        """
+        type_check(batch, (list, tuple))
+        for delete in batch:
+            type_check(delete, Delete)
+        results = await asyncio.gather(*[
+            self._client._call('deleteMultiple', table=self.name, tdeletes=[delete.core for delete in chunk])
+            for chunk in self._chunks(batch)])
+        # deleteMultiple returns the deletes which are not applied.
+        failed = [i for i, result in enumerate(results) if result is False or len(result) > 0]
+        for i in failed:
+            logger.error("The Delete requests in batch {} failed.".format(i))
+        return not failed
+
+    def _chunks(self, operations):
+        return [operations[i: i + self.conf.batch_size] for i in range(0, len(operations), self.conf.batch_size)]
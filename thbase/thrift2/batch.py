@@ -0,0 +1,99 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from enum import Enum
+from typing import Callable, List, Union
+from thbase.thrift2.operation import Get, Put, Delete
+
+OperationStatus = Enum('OperationStatus', ['SUCCESS', 'FAILED', 'NOT_ATTEMPTED'])
+
+
+class BatchResult(object):
+    """
+    The outcome of each operation of a batch.
+    The i-th operation has a status, the exception which failed it if there is one, and for a Get its result:
+    a list of cells, or a Row or None with ResultType.ROW.
+    A BatchResult is truthy only if all the operations succeeded.
+    """
+    __slots__ = ('operations', 'statuses', 'errors', 'results', '_retry')
+
+    def __init__(self, operations, retry=None):
+        # type: (List[Union[Put, Get, Delete]], Callable[[list], BatchResult]) -> None
+        """
+        Args:
+            operations: the operations of the batch.
+            retry: a callable sending a list of operations again and returning their BatchResult.
+        """
+        self.operations = list(operations)
+        self.statuses = [OperationStatus.NOT_ATTEMPTED] * len(self.operations)
+        self.errors = [None] * len(self.operations)  # type: List[Union[None, Exception]]
+        self.results = [None] * len(self.operations)
+        self._retry = retry
+
+    def set(self, indexes, status, error=None):
+        # type: (List[int], OperationStatus, Union[None, Exception]) -> None
+        for i in indexes:
+            self.statuses[i] = status
+            self.errors[i] = error
+
+    def _indexes(self, status):
+        return [i for i, s in enumerate(self.statuses) if s == status]
+
+    @property
+    def succeeded(self):
+        # type: () -> List[int]
+        return self._indexes(OperationStatus.SUCCESS)
+
+    @property
+    def failed(self):
+        # type: () -> List[int]
+        return self._indexes(OperationStatus.FAILED)
+
+    @property
+    def not_attempted(self):
+        # type: () -> List[int]
+        return self._indexes(OperationStatus.NOT_ATTEMPTED)
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return all(s == OperationStatus.SUCCESS for s in self.statuses)
+
+    def unfinished_operations(self):
+        # type: () -> List[Union[Put, Get, Delete]]
+        """
+        Returns: the failed and not attempted operations, in the order of the batch.
+        """
+        return [op for op, s in zip(self.operations, self.statuses) if s != OperationStatus.SUCCESS]
+
+    def retry(self):
+        # type: () -> BatchResult
+        """
+        Send the failed and not attempted operations again.
+        Returns: a new BatchResult of these operations.
+        """
+        if self._retry is None:
+            raise RuntimeError("The batch cannot be retried.")
+        return self._retry(self.unfinished_operations())
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __bool__(self):
+        return self.success
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        return 'BatchResult of {} operations: {} succeeded, {} failed, {} not attempted'.format(
+            len(self), len(self.succeeded), len(self.failed), len(self.not_attempted))
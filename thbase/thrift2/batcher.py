@@ -0,0 +1,97 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from typing import Hashable, Union
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+MIN_BYTES_DEFAULT = 4 * 1024
+# the default max frame size of the hbase thrift server is 2 MB.
+MAX_BYTES_DEFAULT = 2 * 1024 * 1024
+GROWTH = 1.5
+DECREASE = 0.7
+
+
+class AdaptiveBatcher(object):
+    """
+    Tune the number of bytes sent by a batch request online.
+    Each kind of request, e.g. the puts of a table, has its own byte budget, which starts from initial_bytes.
+    The budget grows while the requests filling it are answered within target_latency, and shrinks when they are
+    slower. A request rejected for its size halves the budget at once, and the budget never grows back to that size.
+    The batcher is thread-safe and shared by the tables of a client.
+    """
+    def __init__(self, initial_bytes,  # type: int
+                 target_latency,  # type: Union[int, float]
+                 min_bytes=MIN_BYTES_DEFAULT,  # type: int
+                 max_bytes=MAX_BYTES_DEFAULT,  # type: int
+                 ):
+        """
+        Args:
+            initial_bytes: the byte budget of a kind of request before any feedback.
+            target_latency: the seconds a batch request is expected to take.
+            min_bytes: the min byte budget.
+            max_bytes: the max byte budget.
+        """
+        if not 0 < min_bytes <= max_bytes:
+            raise ValueError("The byte budget must satisfy 0 < min_bytes <= max_bytes.")
+        self.initial_bytes = min(max(initial_bytes, min_bytes), max_bytes)
+        self.target_latency = target_latency
+        self.min_bytes = min_bytes
+        self.max_bytes = max_bytes
+        self._budgets = {}
+        # the smallest size rejected for each kind of request.
+        self._ceilings = {}
+        self._lock = threading.Lock()
+
+    def budget(self, key):
+        # type: (Hashable) -> int
+        """
+        Returns: the current byte budget of a kind of request.
+        """
+        return self._budgets.get(key, self.initial_bytes)
+
+    def record(self, key, size, latency):
+        # type: (Hashable, int, float) -> None
+        """
+        Tune the budget with a successful request.
+        Args:
+            key: the kind of the request.
+            size: the estimated bytes of the request.
+            latency: the seconds the request took.
+
+        Returns: None
+
+        """
+        with self._lock:
+            budget = self.budget(key)
+            if latency > self.target_latency:
+                budget = max(int(budget * DECREASE), self.min_bytes)
+            elif size * 2 >= budget:
+                # only a request filling the budget tells that a larger one would be fast enough.
+                ceiling = self._ceilings.get(key, self.max_bytes + 1) - 1
+                budget = max(min(int(budget * GROWTH), self.max_bytes, ceiling), budget)
+            self._budgets[key] = budget
+
+    def shrink(self, key, size):
+        # type: (Hashable, int) -> None
+        """
+        Halve the budget after a request of the given bytes is rejected for its size.
+        """
+        with self._lock:
+            self._ceilings[key] = min(self._ceilings.get(key, size), size)
+            budget = max(min(self.budget(key), size) // 2, self.min_bytes)
+            logger.warning("A batch request of about {} bytes is too large, reduce the batch budget to {} bytes."
+                           .format(size, budget))
+            self._budgets[key] = budget
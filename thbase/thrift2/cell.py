@@ -11,22 +11,32 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from typing import Union
-from thbase.util.bytes import to_str
+from enum import Enum
+from operator import itemgetter
+from typing import Dict, Iterator, List, Union
+from thbase.hbase.ttypes import TResult
+from thbase.util.bytes import to_bytes, to_str
 
+ResultType = Enum('ResultType', ['CELL', 'ROW', 'COLUMNAR'])
 
-class Cell(object):
 
-    def __init__(self, table_name,  # type: Union[None, bytes]
-                 row,  # type: Union[None, bytes]
-                 family,  # type: Union[None, bytes]
-                 qualifier,  # type: Union[None, bytes]
-                 value,  # type: Union[None, bytes]
-                 timestamp,  # type: Union[None, int]
-                 ):
+class Cell(tuple):
+    """
+    Data structure to load data from hbase. If there is no matched cell or some errors occur at hbase server,
+    all the attributes could be None. In python2, bytes are represented by str, so the type of value is str.
+    A Cell is an immutable tuple of (table_name, row, family, qualifier, value, timestamp) without a per-instance
+    __dict__, so large results stay compact in memory.
+    """
+    __slots__ = ()
+
+    def __new__(cls, table_name,  # type: Union[None, bytes]
+                row,  # type: Union[None, bytes]
+                family,  # type: Union[None, bytes]
+                qualifier,  # type: Union[None, bytes]
+                value,  # type: Union[None, bytes]
+                timestamp,  # type: Union[None, int]
+                ):
         """
-        Data structure to load data from hbase. If there is no matched cell or some errors occur at hbase server,
-        all the attributes could be None. In python2, bytes are represented by str, so the type of value is str.
         Args:
             table_name: name of the table.
             row: the row key.
@@ -35,12 +45,46 @@ class Cell(object):
             value: the bytes stored in the cell.
             timestamp: a long int.
         """
+        return tuple.__new__(cls, (table_name, row, family, qualifier, value, timestamp))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    table_name = property(itemgetter(0))
+    row = property(itemgetter(1))
+    family = property(itemgetter(2))
+    qualifier = property(itemgetter(3))
+    value = property(itemgetter(4))
+    timestamp = property(itemgetter(5))
+
+    def __str__(self):
+        return ":".join([to_str(self.table_name), to_str(self.row), to_str(self.family), to_str(self.qualifier)]) + \
+               ' => ' + to_str(self.value)
+
+    def __repr__(self):
+        return 'Cell({})'.format(', '.join(repr(field) for field in self))
+
+
+class Row(object):
+    """
+    All the cells of a row returned by hbase.
+    The row wraps the thrift result without copying it. The cells and the column mapping are only built
+    when they are accessed for the first time.
+    """
+    __slots__ = ('_table_name', '_result', '_cells', '_columns')
+
+    def __init__(self, table_name,  # type: bytes
+                 result,  # type: TResult
+                 ):
+        """
+        Args:
+            table_name: name of the table.
+            result: a TResult returned by the thrift server, or a Result of the decoder module.
+        """
         self._table_name = table_name
-        self._row = row
-        self._family = family
-        self._qualifier = qualifier
-        self._value = value
-        self._timestamp = timestamp
+        self._result = result
+        self._cells = None
+        self._columns = None
 
     @property
     def table_name(self):
@@ -48,24 +92,56 @@ class Cell(object):
 
     @property
     def row(self):
-        return self._row
+        return self._result.row
 
     @property
-    def family(self):
-        return self._family
+    def cells(self):
+        # type: () -> List[Cell]
+        if self._cells is None:
+            row = self._result.row
+            self._cells = [Cell(self._table_name, row, cv.family, cv.qualifier, cv.value, cv.timestamp)
+                           for cv in self._result.columnValues]
+        return self._cells
 
     @property
-    def qualifier(self):
-        return self._qualifier
+    def columns(self):
+        # type: () -> Dict[bytes, bytes]
+        """
+        A mapping from b'family:qualifier' to the value. If a column has multiple versions,
+        the value of the first returned one, which is the latest version, is kept.
+        """
+        if self._columns is None:
+            columns = {}
+            for cv in self._result.columnValues:
+                columns.setdefault(cv.family + b':' + (cv.qualifier or b''), cv.value)
+            self._columns = columns
+        return self._columns
 
-    @property
-    def value(self):
-        return self._value
+    def get(self, column, default=None):
+        """
+        Get the value of a column.
+        Args:
+            column: the column name with format 'family:qualifier'.
+            default: returned if the row does not contain the column.
 
-    @property
-    def timestamp(self):
-        return self._timestamp
+        Returns: the value of the column.
+
+        """
+        return self.columns.get(to_bytes(column), default)
+
+    def __getitem__(self, column):
+        return self.columns[to_bytes(column)]
+
+    def __contains__(self, column):
+        return to_bytes(column) in self.columns
+
+    def __len__(self):
+        return len(self._result.columnValues)
+
+    def __iter__(self):
+        # type: () -> Iterator[Cell]
+        return iter(self.cells)
 
     def __str__(self):
-        return ":".join([to_str(self.table_name), to_str(self.row), to_str(self.family), to_str(self.qualifier)]) + \
-               ' => ' + to_str(self.value)
+        return to_str(self._table_name) + ':' + to_str(self.row) + ' => {' + \
+               ', '.join(to_str(k) + ': ' + to_str(v) for k, v in self.columns.items()) + '}'
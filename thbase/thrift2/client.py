@@ -11,20 +11,27 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from thbase.hbase import THBaseService
 from thbase.hbase.ttypes import TTableDescriptor, TPermissionScope
 from thbase.hbase.ttypes import TColumnFamilyDescriptor
 from thbase.hbase.ttypes import TAccessControlEntity
+from thbase.hbase.ttypes import TIOError
+from thbase.hbase import service_module
 from thbase.clientbase import ClientBase
-from thbase.thrift2.table import Table
+from thbase.thrift2.table import Table, ScannerHandle
+from thbase.thrift2.region import RegionLocationCache, is_region_moved
+from thbase.thrift2.batcher import AdaptiveBatcher
+from thbase.thrift2.decoder import client_class
 from thbase.util.executor import Executor
-from thbase.util.bytes import to_str
+from thbase.util.bytes import to_bytes, to_str
 from thbase.util.builder import ColumnDescriptorBuilder
 from thbase.util.builder import TableDescriptorBuilder
 from thbase.util import type_check
 from thbase.util import check_none
 from thbase.util import str_to_tablename
+from thrift.Thrift import TException
+from thrift.transport.TTransport import TTransportException
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +45,294 @@ class Client(ClientBase):
     """
     def __init__(self, conf):
         super(Client, self).__init__(conf=conf)
-        self.client = THBaseService.Client(self.connection.protocol)
-        self.executor = Executor(self.conf.retry_times, self.conf.retry_timeout, master=self)
+        self.client = None
+        self._service = None
+        if self.pool is None:
+            self.client = self._thrift_client(self.connection.protocol)
+        # with multiple thrift servers, the requests go through the breaker of their server instead, see _send.
+        self.executor = Executor(self.conf.retry_times, self.conf.retry_timeout, master=self,
+                                 policy=self.conf.retry_policy,
+                                 breaker=self.conf.circuit_breaker if self.balancer is None else None)
+        # a single connection can only serve one request at a time.
+        self._lock = threading.RLock()
+        self.region_cache = RegionLocationCache(ttl=self.conf.region_cache_ttl)
+        self.batcher = AdaptiveBatcher(initial_bytes=self.conf.batch_bytes,
+                                       target_latency=self.conf.batch_target_latency)
+
+    def _thrift_client(self, protocol):
+        """
+        Create the generated thrift client sending requests through a protocol.
+        The generated service module is by far the largest module of the package, so it is only imported when the
+        first thrift client is created rather than when this module is. With client_only_stubs in the configuration
+        the trimmed THBaseClient module is used instead, and with direct_decode the rows are decoded by the
+        decoder module.
+        """
+        if self._service is None:
+            service = service_module(self.conf.client_only_stubs)
+            self._service = client_class(service, self.conf.value_views) if self.conf.direct_decode \
+                else service.Client
+        return self._service(protocol)
+
+    def _call(self, name, *args, **kwargs):
+        """
+        Private method, should not be used by users.
+        Send a request with the retry mechanism of the executor. This is the only place an operation is retried,
+        so one operation has exactly one retry budget and its attempts are recorded in the executor stats.
+        If the client uses a connection pool, a connection is checked out for each attempt, so the client can be
+        shared by multiple threads. Otherwise the requests are serialized on the single connection.
+        Args:
+            name: the name of the THBaseService method.
+            *args: the arguments of the method.
+            route: a (table name, row) tuple. With region routing, the request is sent to the thrift server on the
+            host of the region holding the row.
+            scanner: a ScannerHandle. The request is sent to the thrift server the scanner is opened at.
+            pin: if True, the result is wrapped into a ScannerHandle with the thrift server it comes from.
+
+        Returns:
+            The result of the executor.
+        """
+        if self.pool is None:
+            with self._lock:
+                return self.executor.call(lambda: self._send(self.client, self.connection, name, args), name=name)
+        route = kwargs.get('route') if self.conf.region_routing else None
+        scanner, pin = kwargs.get('scanner'), kwargs.get('pin', False)
+        return self.executor.call(lambda: self._pooled_call(name, args, route, scanner, pin), name=name)
+
+    def _pooled_call(self, name, args, route=None, scanner=None, pin=False):
+        """
+        Private method, should not be used by users.
+        Send a request with a connection checked out from the pool.
+        A connection meets a transport error is closed, so the pool will drop it and open a new one for the retry.
+        Args:
+            name: the name of the THBaseService method.
+            args: the arguments of the method.
+            route: a (table name, row) tuple the request is routed by, or None.
+            scanner: the ScannerHandle whose thrift server the request must be sent to, or None.
+            pin: if True, return the result in a ScannerHandle with the thrift server it comes from.
+
+        Returns:
+            The result of the request.
+        """
+        if scanner is not None and self.balancer is not None:
+            # a pool without balancer only connects to a single thrift server.
+            conn = self.pool.acquire(scanner.host, scanner.port)
+        elif route is not None:
+            conn = self._routed_connection(*route)
+        else:
+            conn = self.pool.acquire()
+        try:
+            result = self._send(self._thrift_client(conn.protocol), conn, name, args)
+            return ScannerHandle(result, conn.host, conn.port) if pin else result
+        except TTransportException:
+            conn.close()
+            raise
+        except TIOError as e:
+            if route is not None and is_region_moved(e):
+                logger.info("Region of row {} has moved, reload its location in table {}."
+                            .format(route[1], to_str(route[0])))
+                self.region_cache.invalidate(route[0], route[1])
+            raise
+        finally:
+            self.pool.release(conn)
+
+    def _send(self, client, conn, name, args):
+        """
+        Private method, should not be used by users.
+        Send a request through a thrift client. With multiple thrift servers, the request goes through the circuit
+        breaker of the server of the connection.
+        Args:
+            client: the thrift client of the connection.
+            conn: the Connection object the request is sent through.
+            name: the name of the THBaseService method.
+            args: the arguments of the method.
+
+        Returns:
+            The result of the request.
+        """
+        breaker = conn.breaker if self.balancer is not None else None
+        if breaker is None:
+            return getattr(client, name)(*args)
+        breaker.check()
+        try:
+            result = getattr(client, name)(*args)
+        except TException as e:
+            breaker.record_error(e)
+            raise
+        breaker.record_success()
+        return result
+
+    def _routed_connection(self, table_name, row):
+        """
+        Private method, should not be used by users.
+        Check out a connection to the thrift server on the host of the region holding the row.
+        A region missing from the cache is looked up with plain requests through a balanced connection rather than
+        locate_region, so the lookup does not start another retry loop inside the attempt. If the lookup fails, the
+        request is sent through that connection without routing.
+        Returns: a Connection object.
+        """
+        table_name, row = to_bytes(table_name), to_bytes(row) or b''
+        location = self.region_cache.locate(table_name, row)
+        if location is not None:
+            return self.pool.acquire(location.serverName.hostName)
+        conn = self.pool.acquire()
+        try:
+            client = self._thrift_client(conn.protocol)
+            if table_name not in self.region_cache:
+                self.region_cache.load(table_name, client.getAllRegionLocations(table_name))
+                location = self.region_cache.locate(table_name, row)
+            if location is None:
+                location = client.getRegionLocation(table_name, row, False)
+                self.region_cache.add(table_name, location)
+        except TTransportException:
+            conn.close()
+            self.pool.release(conn)
+            raise
+        except TException as e:
+            logger.warning("Failed to locate the region of row {} in table {}, send the request without routing. {}"
+                           .format(row, to_str(table_name), e))
+            return conn
+        self.pool.release(conn)
+        return self.pool.acquire(location.serverName.hostName)
+
+    def _region_host(self, table_name, row):
+        """
+        Private method, should not be used by users.
+        Find the host of the region server holding the row.
+        Returns: the host name, or None if it is unknown.
+        """
+        location = self.locate_region(table_name, row)
+        return location.serverName.hostName if location else None
+
+    def locate_region(self, table_name, row, reload=False):
+        """
+        Find the region holding a row from the region location cache.
+        If no region of the table is cached, all of them are loaded at once by getAllRegionLocations.
+        If only the region of the row is missing, e.g. it has been invalidated, it is loaded by getRegionLocation.
+        Args:
+            table_name: the name of the table.
+            row: the row key.
+            reload: if True, skip the cache and reload the location of the row.
+
+        Returns: a THRegionLocation object, or None if the location cannot be got.
+
+        """
+        table_name, row = to_bytes(table_name), to_bytes(row) or b''
+        if reload:
+            self.region_cache.invalidate(table_name, row)
+        else:
+            location = self.region_cache.locate(table_name, row)
+            if location is not None:
+                return location
+            if table_name not in self.region_cache:
+                self.region_locations(table_name)
+                location = self.region_cache.locate(table_name, row)
+                if location is not None:
+                    return location
+        location = self._get_region_location(table_name=table_name, row=row, reload=reload)
+        if not location or location is True:
+            return None
+        self.region_cache.add(table_name, location)
+        return location
+
+    def region_locations(self, table_name, reload=False):
+        """
+        Get all the regions of a table sorted by start key, from the region location cache if they are cached.
+        Args:
+            table_name: the name of the table.
+            reload: if True, skip the cache and reload the regions.
+
+        Returns: a list of THRegionLocation objects, False if the regions cannot be got.
+
+        """
+        table_name = to_bytes(table_name)
+        if not reload:
+            locations = self.region_cache.locations(table_name)
+            if locations is not None:
+                return locations
+        locations = self._get_region_locations(table_name=table_name)
+        if locations is False:
+            return False
+        self.region_cache.load(table_name, locations)
+        return self.region_cache.locations(table_name)
+
+    def invalidate_region_cache(self, table_name=None, row=None):
+        """
+        Drop cached region locations, they are reloaded when they are used next time.
+        Args:
+            table_name: the table whose regions are dropped. If it is None, the whole cache is cleared.
+            row: if it is given, only the region holding the row is dropped.
+
+        Returns: None
+
+        """
+        self.region_cache.invalidate(None if table_name is None else to_bytes(table_name),
+                                     None if row is None else to_bytes(row))
+
+    def _batch_call(self, name, table_name, operations):
+        """
+        Private method, should not be used by users.
+        Send a batch request. With region routing, the batch is split by the hosts of the rows and each part is sent
+        to the thrift server on its host.
+        Args:
+            name: putMultiple, getMultiple or deleteMultiple.
+            table_name: the name of the table.
+            operations: a list of Put, Get or Delete objects.
+
+        Returns:
+            The result of the executor, the results of the parts are merged in the order of the operations.
+        """
+        if not self.conf.region_routing or not operations:
+            return self._call(name, table_name, [op.core for op in operations])
+        groups = {}  # host -> indexes of the operations
+        for i, op in enumerate(operations):
+            groups.setdefault(self._region_host(table_name, op.row), []).append(i)
+        if len(groups) == 1:
+            return self._call(name, table_name, [op.core for op in operations],
+                              route=(table_name, operations[0].row))
+        results = [None] * len(operations)
+        failed = []
+        for indexes in groups.values():
+            part = [operations[i] for i in indexes]
+            result = self._call(name, table_name, [op.core for op in part], route=(table_name, part[0].row))
+            if result is False:
+                if name != 'deleteMultiple':
+                    return False
+                # deleteMultiple reports the deletes which are not applied.
+                failed.extend(op.core for op in part)
+            elif name == 'getMultiple':
+                for i, r in zip(indexes, result):
+                    results[i] = r
+            elif name == 'deleteMultiple' and isinstance(result, list):
+                failed.extend(result)
+        if name == 'getMultiple':
+            return results
+        if name == 'deleteMultiple':
+            return failed
+        return True
+
+    @property
+    def last_attempts(self):
+        # type: () -> int
+        """
+        The number of attempts made by the latest operation sent by the current thread.
+        """
+        return self.executor.stats.last_attempts
+
+    @property
+    def last_error(self):
+        """
+        The last error met by the latest operation sent by the current thread if it failed, else None.
+        """
+        return self.executor.stats.last_error
+
+    def attempt_stats(self):
+        """
+        The attempts made by the operations sent by this client.
+        Returns: a dict mapping the THBaseService method names to dicts of counters:
+        calls, attempts, failures (calls failed after all the attempts) and max_attempts (of a single call).
+
+        """
+        return self.executor.stats.snapshot()
 
     def _put_row(self, **kwargs):
         """
@@ -52,7 +345,7 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         put = kwargs['put']
-        return self.executor.call(lambda: self.client.put(table_name, put.core))
+        return self._call('put', table_name, put.core, route=(table_name, put.row))
 
     def _put_rows(self, **kwargs):
         """
@@ -65,7 +358,7 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         puts = kwargs['puts']
-        return self.executor.call(lambda: self.client.putMultiple(table_name, [put.core for put in puts]))
+        return self._batch_call('putMultiple', table_name, puts)
 
     def _get_row(self, **kwargs):
         """
@@ -78,8 +371,8 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         get = kwargs['get']
-        result = self.executor.call(lambda: self.client.get(table_name, get.core))
-        return [result]
+        result = self._call('get', table_name, get.core, route=(table_name, get.row))
+        return [result] if result is not False else False
 
     def _get_rows(self, **kwargs):
         """
@@ -92,7 +385,7 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         gets = kwargs['gets']
-        return self.executor.call(lambda: self.client.getMultiple(table_name, [get.core for get in gets]))
+        return self._batch_call('getMultiple', table_name, gets)
 
     def _scan(self, **kwargs):
         """
@@ -105,7 +398,76 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         scan = kwargs['scan']
-        return self.executor.call(lambda: self.client.getScannerResults(table_name, scan.core, scan.num_rows))
+        return self._call('getScannerResults', table_name, scan.core, scan.num_rows)
+
+    def _open_scanner(self, **kwargs):
+        """
+        Private method, should not be used by users.
+        Args:
+            **kwargs:
+
+        Returns:
+
+        """
+        table_name = kwargs['table_name']
+        scan = kwargs['scan']
+        # a scanner only exists at the thrift server it is opened at, so keep the server with the id.
+        return self._call('openScanner', table_name, scan.core, pin=True)
+
+    def _get_scanner_rows(self, **kwargs):
+        """
+        Private method, should not be used by users.
+        Args:
+            **kwargs:
+
+        Returns:
+
+        """
+        scanner_id = kwargs['scanner_id']
+        num_rows = kwargs['num_rows']
+        if isinstance(scanner_id, ScannerHandle):
+            return self._call('getScannerRows', scanner_id.id, num_rows, scanner=scanner_id)
+        return self._call('getScannerRows', scanner_id, num_rows)
+
+    def _close_scanner(self, **kwargs):
+        """
+        Private method, should not be used by users.
+        Args:
+            **kwargs:
+
+        Returns:
+
+        """
+        scanner_id = kwargs['scanner_id']
+        if isinstance(scanner_id, ScannerHandle):
+            return self._call('closeScanner', scanner_id.id, scanner=scanner_id)
+        return self._call('closeScanner', scanner_id)
+
+    def _get_region_locations(self, **kwargs):
+        """
+        Private method, should not be used by users.
+        Args:
+            **kwargs:
+
+        Returns:
+
+        """
+        table_name = kwargs['table_name']
+        return self._call('getAllRegionLocations', table_name)
+
+    def _get_region_location(self, **kwargs):
+        """
+        Private method, should not be used by users.
+        Args:
+            **kwargs:
+
+        Returns:
+
+        """
+        table_name = kwargs['table_name']
+        row = kwargs['row']
+        reload = kwargs.get('reload', False)
+        return self._call('getRegionLocation', table_name, row, reload)
 
     def _delete_row(self, **kwargs):
         """
@@ -118,7 +480,7 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         delete = kwargs['delete']
-        return self.executor.call(lambda: self.client.deleteSingle(table_name, delete.core))
+        return self._call('deleteSingle', table_name, delete.core, route=(table_name, delete.row))
 
     def _delete_batch(self, **kwargs):
         """
@@ -131,7 +493,7 @@ class Client(ClientBase):
         """
         table_name = kwargs['table_name']
         deletes = kwargs['deletes']
-        return self.executor.call(lambda: self.client.deleteMultiple(table_name, [delete.core for delete in deletes]))
+        return self._batch_call('deleteMultiple', table_name, deletes)
 
     def _refresh_client(self):
         """
@@ -142,7 +504,22 @@ class Client(ClientBase):
         Returns:
 
         """
-        self.client = THBaseService.Client(self.connection.protocol)
+        if self.pool is None:
+            self.client = self._thrift_client(self.connection.protocol)
+
+    def _reconnect(self, lost=False):
+        """
+        Private method, should not be used by users.
+        A pooled client does not reconnect in place, the broken connection has been dropped and the retry will
+        check out another one.
+        Args:
+            lost: if True, the thrift server has closed the connection.
+
+        Returns:
+
+        """
+        if self.pool is None:
+            super(Client, self)._reconnect(lost)
 
     def get_table(self, table_name):
         """
@@ -167,7 +544,7 @@ class Client(ClientBase):
         """
         type_check(desc, TTableDescriptor)
         type_check(split_keys, list)
-        return self.executor.call(lambda: self.client.createTable(desc, split_keys))
+        return self._call('createTable', desc, split_keys)
 
     def delete_table(self, table_name):
         """
@@ -179,7 +556,7 @@ class Client(ClientBase):
 
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.deleteTable(tn))
+        return self._call('deleteTable', tn)
 
     def enable_table(self, table_name):
         """
@@ -191,7 +568,7 @@ class Client(ClientBase):
 
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.enableTable(tn))
+        return self._call('enableTable', tn)
 
     def disable_table(self, table_name):
         """
@@ -203,7 +580,7 @@ class Client(ClientBase):
 
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.disableTable(tn))
+        return self._call('disableTable', tn)
 
     def truncate_table(self, table_name, preserve_splits):
         """
@@ -216,7 +593,7 @@ class Client(ClientBase):
         
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.truncateTable(tn, preserve_splits))
+        return self._call('truncateTable', tn, preserve_splits)
 
     def is_enabled(self, table_name):
         """
@@ -228,7 +605,7 @@ class Client(ClientBase):
 
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.isTableEnabled(tn))
+        return self._call('isTableEnabled', tn)
 
     def get_tableDescriptor(self, table_name):
         """
@@ -240,7 +617,7 @@ class Client(ClientBase):
 
         """
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.getTableDescriptor(tn))
+        return self._call('getTableDescriptor', tn)
 
     def get_columnDescriptor(self, table_name, cf):
         """
@@ -287,7 +664,7 @@ class Client(ClientBase):
         """
         type_check(desc, TColumnFamilyDescriptor)
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.modifyColumnFamily(tn, desc))
+        return self._call('modifyColumnFamily', tn, desc)
 
     def get_tableBuilder(self, table_name):
         """
@@ -313,7 +690,7 @@ class Client(ClientBase):
 
         """
         type_check(table_descriptor, TTableDescriptor)
-        return self.executor.call(lambda: self.client.modifyTable(table_descriptor))
+        return self._call('modifyTable', table_descriptor)
 
     def grant(self, info):
         """
@@ -325,7 +702,7 @@ class Client(ClientBase):
 
         """
         type_check(info, TAccessControlEntity)
-        return self.executor.call(lambda: self.client.grant(info))
+        return self._call('grant', info)
 
     def revoke(self, info):
         """
@@ -337,7 +714,7 @@ class Client(ClientBase):
 
         """
         type_check(info, TAccessControlEntity)
-        return self.executor.call(lambda: self.client.revoke(info))
+        return self._call('revoke', info)
 
     def get_user_permissions(self, domain_name):
         """
@@ -351,7 +728,7 @@ class Client(ClientBase):
         """
         type_check(domain_name, str)
         scope = TPermissionScope.TABLE if domain_name[0] != '@' else TPermissionScope.NAMESPACE
-        return self.executor.call(lambda: self.client.getUserPermission(domain_name, scope))
+        return self._call('getUserPermission', domain_name, scope)
 
     def table_exists(self, table_name):
         """
@@ -364,4 +741,4 @@ class Client(ClientBase):
         """
         type_check(table_name, str)
         tn = str_to_tablename(table_name)
-        return self.executor.call(lambda: self.client.tableExists(tn))
+        return self._call('tableExists', tn)
@@ -0,0 +1,601 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Decode the responses of the RPCs returning rows straight into light result objects.
+The generated TResult and TColumnValue structs carry fields the client never reads (tags, type, exists, stale,
+partial) and a __dict__ per object. The decoder reads the same wire format with specs only naming the fields the
+client uses, so the other fields are skipped in the stream, and builds __slots__ objects instead.
+
+With the view responses, the values are memoryview slices of the received message instead of bytes copies. A
+message read by the framed transport, or by the asyncio client, is parsed in place, so the cells of a response
+share its buffer, which is kept alive as long as any of the values are.
+"""
+from typing import Dict, List, Union
+from struct import Struct
+from thrift.Thrift import TType, TMessageType, TApplicationException
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TCompactProtocol import TCompactProtocol
+from thrift.transport.TTransport import CReadableTransport, TFramedTransport, TMemoryBuffer
+from thbase.hbase.ttypes import TIOError, TIllegalArgument
+
+
+class ColumnValue(object):
+    """
+    A decoded column value with the fields of TColumnValue the client uses.
+    """
+    __slots__ = ('family', 'qualifier', 'value', 'timestamp')
+
+    def __init__(self, family=None, qualifier=None, value=None, timestamp=None):
+        self.family = family
+        self.qualifier = qualifier
+        self.value = value
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return 'ColumnValue(family={!r}, qualifier={!r}, value={!r}, timestamp={!r})'.format(
+            self.family, self.qualifier, self.value, self.timestamp)
+
+
+class Result(object):
+    """
+    A decoded row with the fields of TResult the client uses.
+    """
+    __slots__ = ('row', 'columnValues')
+
+    def __init__(self, row=None, columnValues=None):
+        # type: (Union[None, bytes], Union[None, List[ColumnValue]]) -> None
+        self.row = row
+        self.columnValues = columnValues
+
+    def __repr__(self):
+        return 'Result(row={!r}, columnValues={!r})'.format(self.row, self.columnValues)
+
+
+# the thrift specs of the decoded structs, indexed by field id like the generated ones. The fields missing from
+# them are skipped.
+COLUMN_VALUE_SPEC = (
+    None,
+    (1, TType.STRING, 'family', 'BINARY', None),
+    (2, TType.STRING, 'qualifier', 'BINARY', None),
+    (3, TType.STRING, 'value', 'BINARY', None),
+    (4, TType.I64, 'timestamp', None, None),
+)
+RESULT_SPEC = (
+    None,
+    (1, TType.STRING, 'row', 'BINARY', None),
+    (2, TType.LIST, 'columnValues', (TType.STRUCT, [ColumnValue, COLUMN_VALUE_SPEC], False), None),
+)
+# the value is read as a memoryview slice of the message.
+VIEW_COLUMN_VALUE_SPEC = COLUMN_VALUE_SPEC[:3] + ((3, TType.STRING, 'value', 'VIEW', None),) + COLUMN_VALUE_SPEC[4:]
+VIEW_RESULT_SPEC = RESULT_SPEC[:2] + (
+    (2, TType.LIST, 'columnValues', (TType.STRUCT, [ColumnValue, VIEW_COLUMN_VALUE_SPEC], False), None),
+)
+_IO_ERROR = (1, TType.STRUCT, 'io', [TIOError, TIOError.thrift_spec], None)
+_ILLEGAL_ARGUMENT = (2, TType.STRUCT, 'ia', [TIllegalArgument, TIllegalArgument.thrift_spec], None)
+
+
+class Response(object):
+    """
+    The *_result struct of an RPC returning rows, decoded into Result objects.
+    It can be used in place of the generated struct, e.g. response.read(iprot), then response.success,
+    response.io or response.ia.
+    """
+    __slots__ = ('success', 'io', 'ia')
+    thrift_spec = ()  # type: tuple
+
+    def __init__(self, success=None, io=None, ia=None):
+        self.success = success
+        self.io = io
+        self.ia = ia
+
+    def read(self, iprot):
+        self._decode(iprot, self.thrift_spec)
+
+    def _decode(self, iprot, spec):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, CReadableTransport):
+            iprot._fast_decode(self, iprot, [self.__class__, spec])
+        else:
+            _read_struct(iprot, self, spec)
+
+
+class ResultResponse(Response):
+    """
+    The response of get.
+    """
+    __slots__ = ()
+    thrift_spec = ((0, TType.STRUCT, 'success', [Result, RESULT_SPEC], None), _IO_ERROR)
+
+
+class ResultsResponse(Response):
+    """
+    The response of getMultiple and getScannerResults.
+    """
+    __slots__ = ()
+    thrift_spec = ((0, TType.LIST, 'success', (TType.STRUCT, [Result, RESULT_SPEC], False), None), _IO_ERROR)
+
+
+class ScannerRowsResponse(ResultsResponse):
+    """
+    The response of getScannerRows, which raises TIllegalArgument for an invalid scanner id.
+    """
+    __slots__ = ()
+    thrift_spec = ResultsResponse.thrift_spec + (_ILLEGAL_ARGUMENT,)
+
+
+class ViewResponse(Response):
+    """
+    A Response whose values are memoryview slices of the message.
+    The message is parsed in place if the whole of it is in the buffer of the transport, i.e. with the framed
+    transport or a TMemoryBuffer, and the protocol is binary or compact. Otherwise it is decoded as a Response and
+    the values are wrapped in memoryviews.
+    """
+    __slots__ = ()
+    # the spec decoding the values into bytes, for the messages which cannot be parsed in place.
+    copy_spec = ()  # type: tuple
+
+    def read(self, iprot):
+        trans = iprot.trans
+        reader = next((r for protocol, r in _READERS if isinstance(iprot, protocol)), None)
+        if reader is None or not isinstance(trans, (TFramedTransport, TMemoryBuffer)):
+            self._decode(iprot, self.copy_spec)
+            results = self.success if isinstance(self.success, list) else [self.success]
+            for result in results:
+                if result is None:
+                    continue
+                for cv in result.columnValues or []:
+                    if cv.value is not None:
+                        cv.value = memoryview(cv.value)
+            return
+        buf = trans.cstringio_buf
+        # the buffer shares the bytes of the message, so neither getvalue() nor the views copy them.
+        stream = reader(buf.getvalue(), buf.tell())
+        _read_view_struct(stream, self, self.thrift_spec)
+        buf.seek(stream.pos)
+
+
+class ViewResultResponse(ViewResponse):
+    """
+    The response of get with memoryview values.
+    """
+    __slots__ = ()
+    thrift_spec = ((0, TType.STRUCT, 'success', [Result, VIEW_RESULT_SPEC], None), _IO_ERROR)
+    copy_spec = ResultResponse.thrift_spec
+
+
+class ViewResultsResponse(ViewResponse):
+    """
+    The response of getMultiple and getScannerResults with memoryview values.
+    """
+    __slots__ = ()
+    thrift_spec = ((0, TType.LIST, 'success', (TType.STRUCT, [Result, VIEW_RESULT_SPEC], False), None), _IO_ERROR)
+    copy_spec = ResultsResponse.thrift_spec
+
+
+class ViewScannerRowsResponse(ViewResultsResponse):
+    """
+    The response of getScannerRows with memoryview values.
+    """
+    __slots__ = ()
+    thrift_spec = ViewResultsResponse.thrift_spec + (_ILLEGAL_ARGUMENT,)
+    copy_spec = ScannerRowsResponse.thrift_spec
+
+
+# RPC name -> the Response class decoding its result.
+RESPONSES = {
+    'get': ResultResponse,
+    'getMultiple': ResultsResponse,
+    'getScannerResults': ResultsResponse,
+    'getScannerRows': ScannerRowsResponse,
+}  # type: Dict[str, type]
+VIEW_RESPONSES = {
+    'get': ViewResultResponse,
+    'getMultiple': ViewResultsResponse,
+    'getScannerResults': ViewResultsResponse,
+    'getScannerRows': ViewScannerRowsResponse,
+}  # type: Dict[str, type]
+
+
+def _read_struct(iprot, obj, spec):
+    """
+    Read a struct field by field with the python implementation of a protocol, skipping the fields missing from
+    the spec.
+    """
+    iprot.readStructBegin()
+    while True:
+        _, ftype, fid = iprot.readFieldBegin()
+        if ftype == TType.STOP:
+            break
+        field = spec[fid] if 0 <= fid < len(spec) else None
+        if field is None or field[1] != ftype:
+            iprot.skip(ftype)
+        else:
+            setattr(obj, field[2], _read_value(iprot, ftype, field[3]))
+        iprot.readFieldEnd()
+    iprot.readStructEnd()
+    return obj
+
+
+def _read_value(iprot, ttype, args):
+    if ttype == TType.STRING:
+        return iprot.readBinary()
+    if ttype == TType.I64:
+        return iprot.readI64()
+    if ttype == TType.LIST:
+        etype, size = iprot.readListBegin()
+        values = [_read_value(iprot, etype, args[1]) for _ in range(size)]
+        iprot.readListEnd()
+        return values
+    if ttype == TType.STRUCT:
+        klass, spec = args
+        if hasattr(klass, 'read'):
+            # a generated struct, e.g. TIOError.
+            obj = klass()
+            obj.read(iprot)
+            return obj
+        return _read_struct(iprot, klass(), spec)
+    iprot.skip(ttype)
+    return None
+
+
+_I16 = Struct('!h')
+_I32 = Struct('!i')
+_I64 = Struct('!q')
+# the sizes of the fixed size types of the binary protocol.
+_BINARY_SIZES = {TType.BOOL: 1, TType.BYTE: 1, TType.I16: 2, TType.I32: 4, TType.I64: 8, TType.DOUBLE: 8}
+
+
+class _BinaryReader(object):
+    """
+    Read the binary protocol from the bytes of a message.
+    """
+    __slots__ = ('data', 'view', 'pos')
+
+    def __init__(self, data, pos):
+        # type: (bytes, int) -> None
+        self.data = data
+        self.view = memoryview(data)
+        self.pos = pos
+
+    def struct_begin(self):
+        pass
+
+    def struct_end(self):
+        pass
+
+    def field_begin(self):
+        ftype = self.data[self.pos]
+        if ftype == TType.STOP:
+            self.pos += 1
+            return ftype, 0
+        fid, = _I16.unpack_from(self.data, self.pos + 1)
+        self.pos += 3
+        return ftype, fid
+
+    def list_begin(self):
+        etype = self.data[self.pos]
+        size, = _I32.unpack_from(self.data, self.pos + 1)
+        self.pos += 5
+        return etype, size
+
+    def span(self):
+        size, = _I32.unpack_from(self.data, self.pos)
+        begin = self.pos + 4
+        self.pos = begin + size
+        return begin, self.pos
+
+    def read_i64(self):
+        value, = _I64.unpack_from(self.data, self.pos)
+        self.pos += 8
+        return value
+
+    def read_bool(self):
+        self.pos += 1
+        return self.data[self.pos - 1] != 0
+
+    def column_value(self):
+        """
+        Read a TColumnValue with a memoryview value. It is the bulk of a response, so its fields are read inline.
+        """
+        data, pos = self.data, self.pos
+        family = qualifier = value = timestamp = None
+        while True:
+            ftype = data[pos]
+            if ftype == TType.STOP:
+                pos += 1
+                break
+            fid, = _I16.unpack_from(data, pos + 1)
+            pos += 3
+            if ftype == TType.STRING:
+                size, = _I32.unpack_from(data, pos)
+                pos += 4
+                if fid == 3:
+                    value = self.view[pos:pos + size]
+                elif fid == 1:
+                    family = data[pos:pos + size]
+                elif fid == 2:
+                    qualifier = data[pos:pos + size]
+                pos += size
+            elif ftype == TType.I64 and fid == 4:
+                timestamp, = _I64.unpack_from(data, pos)
+                pos += 8
+            else:
+                self.pos = pos
+                self.skip(ftype)
+                pos = self.pos
+        self.pos = pos
+        return ColumnValue(family, qualifier, value, timestamp)
+
+    def skip(self, ttype):
+        if ttype in _BINARY_SIZES:
+            self.pos += _BINARY_SIZES[ttype]
+        elif ttype == TType.STRING:
+            self.span()
+        elif ttype == TType.STRUCT:
+            while True:
+                ftype, _ = self.field_begin()
+                if ftype == TType.STOP:
+                    break
+                self.skip(ftype)
+        elif ttype == TType.MAP:
+            ktype, vtype = self.data[self.pos], self.data[self.pos + 1]
+            size, = _I32.unpack_from(self.data, self.pos + 2)
+            self.pos += 6
+            for _ in range(size):
+                self.skip(ktype)
+                self.skip(vtype)
+        elif ttype in (TType.LIST, TType.SET):
+            etype, size = self.list_begin()
+            for _ in range(size):
+                self.skip(etype)
+        else:
+            raise TApplicationException(TApplicationException.PROTOCOL_ERROR, "Unknown type {}.".format(ttype))
+
+
+# the types of the compact protocol -> the thrift types.
+_COMPACT_TYPES = {1: TType.BOOL, 2: TType.BOOL, 3: TType.BYTE, 4: TType.I16, 5: TType.I32, 6: TType.I64,
+                  7: TType.DOUBLE, 8: TType.STRING, 9: TType.LIST, 10: TType.SET, 11: TType.MAP, 12: TType.STRUCT}
+
+
+class _CompactReader(_BinaryReader):
+    """
+    Read the compact protocol from the bytes of a message.
+    """
+    __slots__ = ('_fids', '_bool')
+
+    def __init__(self, data, pos):
+        # type: (bytes, int) -> None
+        super(_CompactReader, self).__init__(data, pos)
+        self._fids = [0]
+        self._bool = None
+
+    def _varint(self):
+        data, pos, shift, result = self.data, self.pos, 0, 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def _zigzag(self):
+        n = self._varint()
+        return (n >> 1) ^ -(n & 1)
+
+    def struct_begin(self):
+        self._fids.append(0)
+
+    def struct_end(self):
+        self._fids.pop()
+
+    def field_begin(self):
+        header = self.data[self.pos]
+        self.pos += 1
+        if header == TType.STOP:
+            return TType.STOP, 0
+        delta, ctype = header >> 4, header & 0x0f
+        fid = self._fids[-1] + delta if delta else self._zigzag()
+        self._fids[-1] = fid
+        if ctype in (1, 2):
+            # a bool field carries its value in the header.
+            self._bool = ctype == 1
+        return _COMPACT_TYPES[ctype], fid
+
+    def list_begin(self):
+        header = self.data[self.pos]
+        self.pos += 1
+        size = header >> 4
+        if size == 15:
+            size = self._varint()
+        return _COMPACT_TYPES[header & 0x0f], size
+
+    def span(self):
+        size = self._varint()
+        begin = self.pos
+        self.pos = begin + size
+        return begin, self.pos
+
+    def read_i64(self):
+        return self._zigzag()
+
+    def column_value(self):
+        """
+        Read a TColumnValue with a memoryview value. It is the bulk of a response, so its fields are read inline.
+        """
+        data, fid = self.data, 0
+        family = qualifier = value = timestamp = None
+        while True:
+            header = data[self.pos]
+            self.pos += 1
+            if header == TType.STOP:
+                break
+            ctype = header & 0x0f
+            fid = fid + (header >> 4) if header >> 4 else self._zigzag()
+            if ctype == 8:
+                begin, end = self.span()
+                if fid == 3:
+                    value = self.view[begin:end]
+                elif fid == 1:
+                    family = data[begin:end]
+                elif fid == 2:
+                    qualifier = data[begin:end]
+            elif ctype == 6 and fid == 4:
+                timestamp = self._zigzag()
+            else:
+                self._bool = ctype == 1 if ctype in (1, 2) else None
+                self.skip(_COMPACT_TYPES[ctype])
+        return ColumnValue(family, qualifier, value, timestamp)
+
+    def read_bool(self):
+        if self._bool is not None:
+            value, self._bool = self._bool, None
+            return value
+        return super(_CompactReader, self).read_bool()
+
+    def skip(self, ttype):
+        if ttype == TType.BOOL:
+            self.read_bool()
+        elif ttype == TType.BYTE:
+            self.pos += 1
+        elif ttype == TType.DOUBLE:
+            self.pos += 8
+        elif ttype in (TType.I16, TType.I32, TType.I64):
+            self._varint()
+        elif ttype == TType.STRING:
+            self.span()
+        elif ttype == TType.STRUCT:
+            self.struct_begin()
+            while True:
+                ftype, _ = self.field_begin()
+                if ftype == TType.STOP:
+                    break
+                self.skip(ftype)
+            self.struct_end()
+        elif ttype == TType.MAP:
+            size = self._varint()
+            if size:
+                types = self.data[self.pos]
+                self.pos += 1
+                for _ in range(size):
+                    self.skip(_COMPACT_TYPES[types >> 4])
+                    self.skip(_COMPACT_TYPES[types & 0x0f])
+        elif ttype in (TType.LIST, TType.SET):
+            etype, size = self.list_begin()
+            for _ in range(size):
+                self.skip(etype)
+        else:
+            raise TApplicationException(TApplicationException.PROTOCOL_ERROR, "Unknown type {}.".format(ttype))
+
+
+# (protocol class, the reader parsing its messages in place), the accelerated protocols are subclasses.
+_READERS = ((TBinaryProtocol, _BinaryReader), (TCompactProtocol, _CompactReader))
+
+
+def _read_view_struct(stream, obj, spec):
+    """
+    Read a struct from a reader, skipping the fields missing from the spec.
+    """
+    stream.struct_begin()
+    while True:
+        ftype, fid = stream.field_begin()
+        if ftype == TType.STOP:
+            break
+        field = spec[fid] if 0 <= fid < len(spec) else None
+        if field is None or field[1] != ftype:
+            stream.skip(ftype)
+        else:
+            setattr(obj, field[2], _read_view_value(stream, ftype, field[3]))
+    stream.struct_end()
+    return obj
+
+
+def _read_view_value(stream, ttype, args):
+    if ttype == TType.STRING:
+        begin, end = stream.span()
+        if args == 'VIEW':
+            return stream.view[begin:end]
+        value = stream.data[begin:end]
+        return value.decode('utf-8') if args == 'UTF8' else value
+    if ttype == TType.I64:
+        return stream.read_i64()
+    if ttype == TType.BOOL:
+        return stream.read_bool()
+    if ttype == TType.LIST:
+        etype, size = stream.list_begin()
+        if etype == TType.STRUCT and args[1][1] is VIEW_COLUMN_VALUE_SPEC:
+            return [stream.column_value() for _ in range(size)]
+        return [_read_view_value(stream, etype, args[1]) for _ in range(size)]
+    if ttype == TType.STRUCT:
+        return _read_view_struct(stream, args[0](), args[1])
+    stream.skip(ttype)
+    return None
+
+
+class _DecodingClient(object):
+    """
+    Replace the receiving methods of a generated Client for the RPCs returning rows.
+    """
+    _responses = RESPONSES  # type: Dict[str, type]
+
+    def _recv_rows(self, name):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = self._responses[name]()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.io is not None:
+            raise result.io
+        if result.ia is not None:
+            raise result.ia
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "{} failed: unknown result".format(name))
+
+    def recv_get(self):
+        return self._recv_rows('get')
+
+    def recv_getMultiple(self):
+        return self._recv_rows('getMultiple')
+
+    def recv_getScannerResults(self):
+        return self._recv_rows('getScannerResults')
+
+    def recv_getScannerRows(self):
+        return self._recv_rows('getScannerRows')
+
+
+_client_classes = {}  # type: Dict[object, type]
+
+
+def client_class(service, views=False):
+    """
+    Get the subclass of the Client of a generated service module decoding the rows with the Response structs.
+    Args:
+        service: the module, THBaseService or THBaseClient.
+        views: if True, decode the values into memoryview slices of the messages with the ViewResponse structs.
+
+    Returns: the Client class.
+
+    """
+    cls = _client_classes.get((service, views))
+    if cls is None:
+        attributes = {'_responses': VIEW_RESPONSES if views else RESPONSES}
+        cls = _client_classes.setdefault((service, views),
+                                         type('Client', (_DecodingClient, service.Client), attributes))
+    return cls
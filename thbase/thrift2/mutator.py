@@ -0,0 +1,241 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from typing import Callable, List, Union
+from thbase.thrift2.operation import Put, Delete, estimate_size
+from thbase.util import type_check
+from thbase.util.bytes import to_str
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES_DEFAULT = 2 * 1024 * 1024
+MAX_COUNT_DEFAULT = 1000
+MAX_LATENCY_DEFAULT = 1.0
+
+
+class BufferedMutator(object):
+    """
+    Buffer Put and Delete operations of a table and send them in batches from a background thread.
+    The buffer is flushed by putMultiple/deleteMultiple when it holds max_bytes or max_count operations,
+    or when the oldest buffered operation has waited max_latency seconds.
+    The operations are sent in the order they are buffered. If the buffer is full while the former batch is still
+    being sent, the caller blocks until that batch is done.
+    The failed operations are reported through the on_error callback with the exception if there is one.
+    Use Table.buffered_mutator() to create a mutator and always close it, or use it as a context manager.
+    """
+    def __init__(self, table,
+                 max_bytes=MAX_BYTES_DEFAULT,  # type: int
+                 max_count=MAX_COUNT_DEFAULT,  # type: int
+                 max_latency=MAX_LATENCY_DEFAULT,  # type: Union[int, float]
+                 on_error=None,  # type: Callable[[Union[Put, Delete], Union[None, Exception]], None]
+                 ):
+        """
+        Args:
+            table: the Table object the operations are sent to.
+            max_bytes: flush when the estimated size of the buffered operations reaches this number of bytes.
+            max_count: flush when this number of operations are buffered.
+            max_latency: flush when the oldest buffered operation has waited this number of seconds.
+            on_error: a callable invoked as on_error(operation, exception) for each failed operation.
+            The exception is None if the server reports the operation as failed without an exception.
+        """
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("Max bytes must be a positive integer.")
+        if not isinstance(max_count, int) or max_count < 1:
+            raise ValueError("Max count must be a positive integer.")
+        if not isinstance(max_latency, (int, float)) or max_latency <= 0:
+            raise ValueError("Max latency must be a positive number.")
+        self._table = table
+        self._max_bytes = max_bytes
+        self._max_count = max_count
+        self._max_latency = max_latency
+        self._on_error = on_error
+        self._buffer = []  # type: List[Union[Put, Delete]]
+        self._bytes = 0
+        self._first_time = None
+        self._flushing = False
+        self._flush_waiters = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="BufferedMutator-flusher")
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def buffered_count(self):
+        return len(self._buffer)
+
+    @property
+    def buffered_bytes(self):
+        return self._bytes
+
+    def put(self, put):
+        # type: (Put) -> None
+        """
+        Buffer a Put operation.
+        Args:
+            put: a Put object.
+
+        Returns: None
+
+        """
+        type_check(put, Put)
+        self._add(put)
+
+    def delete(self, delete):
+        # type: (Delete) -> None
+        """
+        Buffer a Delete operation.
+        Args:
+            delete: a Delete object.
+
+        Returns: None
+
+        """
+        type_check(delete, Delete)
+        self._add(delete)
+
+    def mutate(self, operations):
+        # type: (List[Union[Put, Delete]]) -> None
+        """
+        Buffer a list of Put and Delete operations.
+        Args:
+            operations: a list of Put or Delete objects.
+
+        Returns: None
+
+        """
+        type_check(operations, (list, tuple))
+        for op in operations:
+            type_check(op, (Put, Delete))
+        for op in operations:
+            self._add(op)
+
+    def flush(self):
+        """
+        Send all the buffered operations and wait until they are done.
+        Returns: None
+        """
+        with self._cond:
+            self._flush_waiters += 1
+            try:
+                self._cond.notify_all()
+                while self._buffer or self._flushing:
+                    self._cond.wait()
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self):
+        """
+        Flush the buffered operations and stop the background thread. The mutator cannot be used after closing.
+        Returns: None
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _full(self):
+        return self._bytes >= self._max_bytes or len(self._buffer) >= self._max_count
+
+    def _add(self, op):
+        size = estimate_size(op)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The BufferedMutator is closed.")
+            # keep at most one full buffer besides the batch being sent.
+            while self._full() and self._flushing:
+                self._cond.wait()
+            first = not self._buffer
+            if first:
+                self._first_time = time.time()
+            self._buffer.append(op)
+            self._bytes += size
+            # wake up the background thread to start the latency timer or to flush a full buffer.
+            if first or self._full():
+                self._cond.notify_all()
+
+    def _run(self):
+        """
+        The loop of the background thread, taking the buffer away and sending it when a flush condition is met.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    if self._buffer:
+                        waited = time.time() - self._first_time
+                        if self._full() or self._closed or self._flush_waiters or waited >= self._max_latency:
+                            break
+                        self._cond.wait(self._max_latency - waited)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                batch, self._buffer, self._bytes = self._buffer, [], 0
+                self._flushing = True
+            try:
+                self._send(batch)
+            finally:
+                with self._cond:
+                    self._flushing = False
+                    self._cond.notify_all()
+
+    def _send(self, batch):
+        # type: (List[Union[Put, Delete]]) -> None
+        """
+        Send a batch with one request for each run of consecutive operations of the same type.
+        """
+        start = 0
+        for i in range(1, len(batch) + 1):
+            if i == len(batch) or type(batch[i]) is not type(batch[start]):
+                self._send_run(batch[start:i])
+                start = i
+
+    def _send_run(self, run):
+        # type: (List[Union[Put, Delete]]) -> None
+        client, table_name = self._table._client, self._table.name
+        try:
+            if isinstance(run[0], Put):
+                if not client._put_rows(table_name=table_name, puts=run):
+                    self._report(run, None)
+            else:
+                result = client._delete_batch(table_name=table_name, deletes=run)
+                if result is False:
+                    self._report(run, None)
+                elif isinstance(result, list) and result:
+                    # deleteMultiple returns the deletes which are not applied.
+                    failed = [d for d in run if d.core in result]
+                    self._report(failed, None)
+        except Exception as e:
+            self._report(run, e)
+
+    def _report(self, operations, error):
+        if self._on_error is None:
+            logger.error("{} buffered operations on table {} failed. {}".format(len(operations),
+                                                                                 to_str(self._table.name), error or ''))
+            return
+        for op in operations:
+            try:
+                self._on_error(op, error)
+            except Exception as e:
+                logger.error("The error callback of BufferedMutator raised an exception: {}".format(e))
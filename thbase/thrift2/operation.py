@@ -11,11 +11,15 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from functools import lru_cache
 from thbase.util import check_none
 from thbase.util.bytes import to_bytes
 from typing import List, Union
 from thbase.hbase.ttypes import TGet, TDelete, TScan, TPut, TColumnValue, TColumn
 
+# the max number of distinct (family, qualifier) pairs whose TColumn is kept by the column cache.
+COLUMN_CACHE_SIZE_DEFAULT = 4096
+
 
 class Operation(object):
     """
@@ -112,9 +116,9 @@ class Put(Operation):
         if isinstance(value, str) or isinstance(value, bytes) or isinstance(value, bytearray):
             for col in columns:
                 column_values.append(TColumnValue(
-                    family=to_bytes(col.family),
-                    qualifier=to_bytes(col.qualifier),
-                    value=to_bytes(self.value)
+                    family=col.family,
+                    qualifier=col.qualifier,
+                    value=self.value
                 ))
         elif isinstance(value, list) or isinstance(value, tuple):
             if len(columns) != len(value):
@@ -140,20 +144,82 @@ def _column_format(family, qualifier):
         family: name of column family.
         qualifier: name of column qualifier, it can be a str, None or a list of strs.
 
-    Returns: a list of combined columns.
+    Returns: a list of combined columns. The TColumn objects come from the column cache and are shared by the
+    operations, they must not be modified.
 
     """
     if family is None:
         return None
     if not isinstance(family, str) and not isinstance(family, bytes):
         raise ValueError("A family name must be a str object, but got {}".format(type(family)))
-    family_bytes = to_bytes(family)
-    if qualifier is None:
-        return [TColumn(family=family_bytes)]
     if isinstance(qualifier, list) or isinstance(qualifier, tuple):
-        cols = []
-        for cq in qualifier:
-            cols.append(TColumn(family=family_bytes, qualifier=to_bytes(cq)))
-        return cols
+        return [_column(family, cq) for cq in qualifier]
+    return [_column(family, qualifier)]
+
+
+def _new_column(family, qualifier):
+    # type: (Union[str, bytes], Union[None, str, bytes]) -> TColumn
+    return TColumn(family=to_bytes(family), qualifier=to_bytes(qualifier))
+
+
+def _column(family, qualifier):
+    # type: (Union[str, bytes], Union[None, str, bytes]) -> TColumn
+    """
+    Get the TColumn of a family and a qualifier from the column cache. A schema usually has a few fixed columns
+    used by most operations, so they are encoded and built once instead of for every operation.
+    """
+    if isinstance(qualifier, bytearray):
+        # unhashable, it cannot be a key of the cache.
+        return _new_column(family, qualifier)
+    return _cached_column(family, qualifier)
+
+
+def set_column_cache_size(size=COLUMN_CACHE_SIZE_DEFAULT):
+    # type: (int) -> None
+    """
+    Bound the cache of the TColumn objects built by the operations. The least recently used columns are dropped
+    when it is full. The cache is cleared.
+    Args:
+        size: the max number of cached (family, qualifier) pairs, 0 to disable the cache.
+
+    Returns: None
+
+    """
+    global _cached_column
+    if not isinstance(size, int) or size < 0:
+        raise ValueError("Column cache size must be a non-negative integer.")
+    _cached_column = lru_cache(maxsize=size)(_new_column) if size else _new_column
+
+
+def column_cache_info():
+    """
+    Returns: the hits, misses, maxsize and currsize of the column cache, None if it is disabled.
+    """
+    info = getattr(_cached_column, 'cache_info', None)
+    return info() if info is not None else None
+
+
+set_column_cache_size()
+
 
-    return [TColumn(family=family_bytes, qualifier=to_bytes(qualifier))]
+# rough number of bytes taken by the field headers and the timestamp of a column in a request.
+COLUMN_OVERHEAD = 16
+
+
+def estimate_size(operation):
+    # type: (Operation) -> int
+    """
+    Estimate the number of bytes an operation takes in a request.
+    Args:
+        operation: a Put, Get, Delete or Scan object.
+
+    Returns: the estimated size in bytes.
+
+    """
+    core = operation.core
+    size = len(operation.row or b'')
+    columns = getattr(core, 'columnValues', None) or getattr(core, 'columns', None) or []
+    for col in columns:
+        size += len(col.family or b'') + len(col.qualifier or b'') + len(getattr(col, 'value', None) or b'') + \
+            COLUMN_OVERHEAD
+    return size
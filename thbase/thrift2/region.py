@@ -0,0 +1,197 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from bisect import bisect_right
+from typing import List, Union
+from thbase.hbase.ttypes import THRegionLocation, TIOError
+import threading
+import time
+
+# the exceptions hbase raises when a request reaches a region server which no longer hosts the region.
+REGION_MOVED_ERRORS = ('NotServingRegionException', 'RegionMovedException', 'RegionOpeningException')
+
+
+class _TableRegions(object):
+    """
+    The cached regions of a table, sorted by start key. The object is never modified after being built,
+    a change of the cache builds a new one, so it can be read without locking.
+    """
+    __slots__ = ('start_keys', 'end_keys', 'locations', 'loaded_at', 'complete')
+
+    def __init__(self, locations, loaded_at, complete):
+        # type: (List[THRegionLocation], float, bool) -> None
+        locations = sorted(locations, key=lambda loc: loc.regionInfo.startKey or b'')
+        self.start_keys = [loc.regionInfo.startKey or b'' for loc in locations]
+        self.end_keys = [loc.regionInfo.endKey or b'' for loc in locations]
+        self.locations = locations
+        self.loaded_at = loaded_at
+        # if all the regions of the table are cached.
+        self.complete = complete
+
+    def index_of(self, row):
+        # type: (bytes) -> int
+        """
+        Returns: the index of the cached region containing the row, or -1 if it is not cached.
+        """
+        i = bisect_right(self.start_keys, row) - 1
+        if i < 0:
+            return -1
+        end = self.end_keys[i]
+        if end and row >= end:
+            return -1
+        return i
+
+
+class RegionLocationCache(object):
+    """
+    Cache of the region locations of tables, resolving a row to the region holding it without requests.
+    The regions of a table are loaded in bulk from getAllRegionLocations and kept as a sorted array of start keys,
+    so a lookup is a binary search. The regions of a table expire ttl seconds after being loaded.
+    A single region can be invalidated, e.g. after it has moved, and replaced by the location of one row.
+    The cache is thread-safe.
+    """
+    def __init__(self, ttl=None):
+        # type: (Union[None, int, float]) -> None
+        """
+        Args:
+            ttl: the seconds the regions of a table are cached for. None means they never expire.
+        """
+        self.ttl = ttl
+        self._tables = {}  # table name -> _TableRegions
+        self._lock = threading.Lock()
+
+    def _regions(self, table_name):
+        regions = self._tables.get(table_name)
+        if regions is not None and self.ttl is not None and time.time() - regions.loaded_at > self.ttl:
+            return None
+        return regions
+
+    def is_loaded(self, table_name):
+        # type: (bytes) -> bool
+        """
+        Returns: True if all the regions of the table are cached and not expired.
+        """
+        regions = self._regions(table_name)
+        return regions is not None and regions.complete
+
+    def __contains__(self, table_name):
+        # type: (bytes) -> bool
+        """
+        Returns: True if any region of the table is cached and not expired.
+        """
+        return self._regions(table_name) is not None
+
+    def load(self, table_name, locations):
+        # type: (bytes, List[THRegionLocation]) -> None
+        """
+        Cache all the regions of a table, replacing the former ones.
+        Args:
+            table_name: the name of the table.
+            locations: the region locations returned by getAllRegionLocations.
+
+        Returns: None
+
+        """
+        regions = _TableRegions(locations, time.time(), True)
+        with self._lock:
+            self._tables[table_name] = regions
+
+    def add(self, table_name, location):
+        # type: (bytes, THRegionLocation) -> None
+        """
+        Cache the location of one region, replacing the cached regions overlapping it.
+        Args:
+            table_name: the name of the table.
+            location: a region location returned by getRegionLocation.
+
+        Returns: None
+
+        """
+        start = location.regionInfo.startKey or b''
+        end = location.regionInfo.endKey or b''
+        with self._lock:
+            old = self._regions(table_name)
+            if old is None:
+                self._tables[table_name] = _TableRegions([location], time.time(), False)
+                return
+            kept = [loc for s, e, loc in zip(old.start_keys, old.end_keys, old.locations)
+                    if (end and s >= end) or (e and e <= start)]
+            self._tables[table_name] = _TableRegions(kept + [location], old.loaded_at, old.complete)
+
+    def locate(self, table_name, row):
+        # type: (bytes, bytes) -> Union[None, THRegionLocation]
+        """
+        Find the cached region containing a row.
+        Args:
+            table_name: the name of the table.
+            row: the row key.
+
+        Returns: a THRegionLocation object, or None if the region is not cached.
+
+        """
+        regions = self._regions(table_name)
+        if regions is None:
+            return None
+        i = regions.index_of(row or b'')
+        return regions.locations[i] if i >= 0 else None
+
+    def locations(self, table_name):
+        # type: (bytes) -> Union[None, List[THRegionLocation]]
+        """
+        Returns: the cached regions of a table sorted by start key, or None if they are not all cached.
+        """
+        regions = self._regions(table_name)
+        if regions is None or not regions.complete:
+            return None
+        return list(regions.locations)
+
+    def invalidate(self, table_name=None, row=None):
+        # type: (Union[None, bytes], Union[None, bytes]) -> None
+        """
+        Drop cached regions.
+        Args:
+            table_name: the table whose regions are dropped. If it is None, the whole cache is cleared.
+            row: if it is given, only the region containing the row is dropped.
+
+        Returns: None
+
+        """
+        with self._lock:
+            if table_name is None:
+                self._tables.clear()
+                return
+            if row is None:
+                self._tables.pop(table_name, None)
+                return
+            old = self._tables.get(table_name)
+            if old is None:
+                return
+            i = old.index_of(row)
+            if i < 0:
+                return
+            kept = old.locations[:i] + old.locations[i + 1:]
+            self._tables[table_name] = _TableRegions(kept, old.loaded_at, False)
+
+    def __len__(self):
+        return sum(len(regions.locations) for regions in list(self._tables.values()))
+
+
+def is_region_moved(error):
+    # type: (Exception) -> bool
+    """
+    Check if an error means the region of the request is no longer hosted where the client thinks it is.
+    """
+    if not isinstance(error, TIOError):
+        return False
+    message = error.message or ''
+    return any(name in message for name in REGION_MOVED_ERRORS)
@@ -0,0 +1,166 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from array import array
+from typing import Dict, Iterator, List, Union
+from thbase.hbase.ttypes import TResult
+from thbase.thrift2.cell import Cell
+from thbase.util.bytes import to_str
+
+# the timestamp stored for a cell returned without timestamp.
+NO_TIMESTAMP = -1
+
+
+class BytesColumn(object):
+    """
+    A column of byte strings stored in one contiguous buffer.
+    The i-th item is buffer[offsets[i]:offsets[i + 1]], so the column costs one int64 per item
+    instead of one bytes object per item. A None item is kept apart from an empty one by the validity
+    mask, valid[i] is 0 for None and 1 otherwise.
+    """
+    __slots__ = ('_buffer', '_offsets', '_valid')
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offsets = array('q', [0])
+        self._valid = bytearray()
+
+    @property
+    def buffer(self):
+        # type: () -> bytearray
+        return self._buffer
+
+    @property
+    def offsets(self):
+        # type: () -> array
+        return self._offsets
+
+    @property
+    def valid(self):
+        # type: () -> bytearray
+        return self._valid
+
+    def append(self, value):
+        # type: (Union[None, bytes]) -> None
+        if value:
+            self._buffer += value
+        self._offsets.append(len(self._buffer))
+        self._valid.append(value is not None)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        # type: (int) -> Union[None, bytes]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BytesColumn index out of range.")
+        if not self._valid[index]:
+            return None
+        return bytes(self._buffer[self._offsets[index]:self._offsets[index + 1]])
+
+    def __iter__(self):
+        # type: () -> Iterator[Union[None, bytes]]
+        for i in range(len(self)):
+            yield self[i]
+
+
+class ResultSet(object):
+    """
+    Columnar representation of the cells returned by hbase.
+    The cells are stored as parallel columns: the i-th cell is
+    (rows[i], families[i], qualifiers[i], values[i], timestamps[i]).
+    Row keys, families and qualifiers are shared references to a few distinct bytes objects, values are kept in a
+    BytesColumn and timestamps in an array('q').
+    """
+    __slots__ = ('table_name', 'rows', 'families', 'qualifiers', 'values', 'timestamps')
+
+    def __init__(self, table_name):
+        # type: (bytes) -> None
+        self.table_name = table_name
+        self.rows = []  # type: List[bytes]
+        self.families = []  # type: List[bytes]
+        self.qualifiers = []  # type: List[bytes]
+        self.values = BytesColumn()
+        self.timestamps = array('q')
+
+    @classmethod
+    def from_results(cls, table_name, results):
+        # type: (bytes, List[TResult]) -> ResultSet
+        """
+        Build a ResultSet directly from thrift results.
+        Args:
+            table_name: name of the table the results come from.
+            results: a list of TResult, or of Result of the decoder module.
+
+        Returns: a ResultSet object.
+
+        """
+        result_set = cls(table_name)
+        rows, families, qualifiers = result_set.rows, result_set.families, result_set.qualifiers
+        values, timestamps = result_set.values, result_set.timestamps
+        # every decoded column value owns its family and qualifier bytes, keep only one object for equal names.
+        names = {}
+        for result in results or []:
+            row = result.row
+            for cv in result.columnValues:
+                rows.append(row)
+                families.append(names.setdefault(cv.family, cv.family))
+                qualifiers.append(names.setdefault(cv.qualifier, cv.qualifier))
+                values.append(cv.value)
+                timestamps.append(NO_TIMESTAMP if cv.timestamp is None else cv.timestamp)
+        return result_set
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        # type: (int) -> Cell
+        return Cell(self.table_name, self.rows[index], self.families[index], self.qualifiers[index],
+                    self.values[index], self.timestamps[index])
+
+    def __iter__(self):
+        # type: () -> Iterator[Cell]
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self):
+        return 'ResultSet of {} with {} cells'.format(to_str(self.table_name), len(self))
+
+    def to_numpy(self):
+        # type: () -> Dict[str, object]
+        """
+        Export the columns as NumPy arrays. NumPy must be installed.
+        The value buffer, value offsets, value validity and timestamps arrays share memory with this ResultSet
+        without copying.
+        Returns: a dict with keys 'rows', 'families', 'qualifiers' (object arrays), 'value_buffer' (uint8),
+        'value_offsets' (int64, one more than the number of cells), 'value_valid' (bool, False for a missing
+        value, as opposed to an empty one) and 'timestamps' (int64).
+
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is needed to export a ResultSet, install it with 'pip install numpy'.")
+        return {
+            'rows': numpy.array(self.rows, dtype=object),
+            'families': numpy.array(self.families, dtype=object),
+            'qualifiers': numpy.array(self.qualifiers, dtype=object),
+            'value_buffer': numpy.frombuffer(self.values.buffer, dtype=numpy.uint8),
+            'value_offsets': numpy.frombuffer(self.values.offsets, dtype=numpy.int64),
+            'value_valid': numpy.frombuffer(self.values.valid, dtype=numpy.bool_),
+            'timestamps': numpy.frombuffer(self.timestamps, dtype=numpy.int64),
+        }
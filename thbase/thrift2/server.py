@@ -0,0 +1,926 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+from thbase.hbase import THBaseService
+from thbase.hbase.ttypes import TResult, TColumnValue, TColumn, TTimeRange, TGet, TPut, TDelete, TScan
+from thbase.hbase.ttypes import TIncrement, TAppend, TRowMutations, TDeleteType, TCompareOp, TThriftServerType
+from thbase.hbase.ttypes import THRegionLocation, THRegionInfo, TServerName, TTableName
+from thbase.hbase.ttypes import TTableDescriptor, TColumnFamilyDescriptor, TIOError, TIllegalArgument
+from thbase.config import TransportType, ProtocolType, TRANSPORT_DEFAULT, PROTOCOL_DEFAULT
+from thbase.connection import THRIFT_TRANSPORTS, THRIFT_PROTOCOLS
+from thbase.util.bytes import to_bytes, to_str
+from thrift.transport import TSocket, TTransport
+import argparse
+import functools
+import logging
+import random
+import re
+import socket
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MAX_VERSIONS_DEFAULT = 1
+DEFAULT_NAMESPACE = b'default'
+# the seconds the accepting thread waits for a connection before checking if the server is stopped.
+ACCEPT_TIMEOUT = 0.2
+
+
+def _now():
+    # type: () -> int
+    return int(time.time() * 1000)
+
+
+def _table_key(name):
+    # type: (Union[bytes, TTableName]) -> bytes
+    """
+    The key of a table in the store, 'ns:table' or 'table' for the default namespace.
+    """
+    if isinstance(name, TTableName):
+        if name.ns and name.ns != DEFAULT_NAMESPACE:
+            return name.ns + b':' + name.qualifier
+        return name.qualifier
+    name = to_bytes(name)
+    if name.startswith(DEFAULT_NAMESPACE + b':'):
+        return name[len(DEFAULT_NAMESPACE) + 1:]
+    return name
+
+
+def _table_name(key):
+    # type: (bytes) -> TTableName
+    if b':' in key:
+        ns, qualifier = key.split(b':', 1)
+        return TTableName(ns=ns, qualifier=qualifier)
+    return TTableName(ns=DEFAULT_NAMESPACE, qualifier=key)
+
+
+def _served(func):
+    """
+    Count the calls of a thrift method and apply the injected latency and failures before serving it.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        self._before(func.__name__)
+        return func(self, *args)
+    return wrapper
+
+
+class _MemTable(object):
+    """
+    A table of the in-memory server.
+    The cells of a row are kept as {(family, qualifier): [(timestamp, value), ...]} with the newest version first,
+    and the row keys are kept sorted for scans. The regions are simulated by the sorted split keys.
+    """
+    __slots__ = ('name', 'families', 'splits', 'region_ids', 'enabled', 'rows', 'keys')
+
+    def __init__(self, name, families, splits, region_ids):
+        # type: (bytes, Dict[bytes, int], List[bytes], List[int]) -> None
+        self.name = name
+        self.families = families  # family -> max versions
+        self.splits = splits
+        self.region_ids = region_ids
+        self.enabled = True
+        self.rows = {}  # type: Dict[bytes, Dict[Tuple[bytes, bytes], List[Tuple[int, bytes]]]]
+        self.keys = []  # type: List[bytes]
+
+    def region_of(self, row):
+        # type: (bytes) -> int
+        return bisect_right(self.splits, row or b'')
+
+    def drop_row(self, row):
+        # type: (bytes) -> None
+        del self.rows[row]
+        del self.keys[bisect_left(self.keys, row)]
+
+
+class _Scanner(object):
+    __slots__ = ('table', 'scan', 'last_row', 'returned')
+
+    def __init__(self, table, scan):
+        # type: (bytes, TScan) -> None
+        self.table = table
+        self.scan = scan
+        self.last_row = None
+        self.returned = 0
+
+
+class MemoryHandler(THBaseService.Iface):
+    """
+    An in-memory implementation of the thrift2 THBaseService, for testing and benchmarking the client without HBase.
+    The tables keep the versions of each cell, and support gets, puts, deletes, check-and-mutate, increments,
+    appends, scans and scanners, simulated regions and the usual table admin methods.
+    Differences from HBase: deletes remove the cells instead of writing tombstones, filters, visibility labels,
+    permissions and namespaces admin are not supported, and a scanner sees the rows written after it is opened.
+
+    The handler can slow down and fail the requests:
+    latency: the seconds each request takes, or a (min, max) tuple to draw it uniformly from.
+    failure_rate: the probability for a request to fail with a retryable TIOError.
+    fail_next(): fail the next requests of some methods with a given error.
+    The calls of each method are counted in calls.
+
+    The handler is thread-safe and can be shared by several servers, see LocalServer.
+    """
+    def __init__(self, auto_create=True,  # type: bool
+                 max_versions=MAX_VERSIONS_DEFAULT,  # type: int
+                 latency=0,  # type: Union[int, float, Tuple[float, float]]
+                 failure_rate=0,  # type: float
+                 servers=None,  # type: Union[None, List[Tuple[str, int]]]
+                 seed=None,
+                 ):
+        """
+        Args:
+            auto_create: if True, the tables and column families used by data requests are created on demand.
+            Otherwise using them raises TableNotFoundException and NoSuchColumnFamilyException errors.
+            max_versions: the versions kept by the column families created on demand.
+            latency: the seconds each request takes, or a (min, max) tuple.
+            failure_rate: the probability for a request to fail, in [0, 1].
+            servers: the (host, port) of the servers hosting the regions, the regions are assigned to them in turn.
+            Set by LocalServer to its own address if it is empty.
+            seed: the seed of the random latencies and failures.
+        """
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("Failure rate must be in [0, 1].")
+        if not isinstance(max_versions, int) or max_versions < 1:
+            raise ValueError("Max versions must be a positive integer.")
+        self.auto_create = auto_create
+        self.max_versions = max_versions
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.servers = list(servers or [])
+        self.calls = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._fault_lock = threading.Lock()
+        self._faults = []  # [remaining count, method names or None, error]
+        self._tables = {}  # type: Dict[bytes, _MemTable]
+        self._scanners = {}  # type: Dict[int, _Scanner]
+        self._next_scanner = 0
+        self._next_region = 0
+        self._start_code = _now()
+
+    def fail_next(self, count=1, methods=None, error=None):
+        # type: (int, Union[None, Iterable[str]], Union[None, Exception]) -> None
+        """
+        Fail the next requests.
+        Args:
+            count: the number of requests to fail.
+            methods: the names of the thrift methods to fail, e.g. ['put', 'putMultiple']. None means any method.
+            error: the exception raised, a retryable TIOError by default.
+
+        Returns: None
+
+        """
+        if error is None:
+            error = TIOError(message='Injected failure', canRetry=True)
+        with self._fault_lock:
+            self._faults.append([count, set(methods) if methods is not None else None, error])
+
+    def _before(self, name):
+        # type: (str) -> None
+        error = None
+        with self._fault_lock:
+            self.calls[name] += 1
+            for fault in self._faults:
+                if fault[1] is None or name in fault[1]:
+                    fault[0] -= 1
+                    error = fault[2]
+                    if fault[0] <= 0:
+                        self._faults.remove(fault)
+                    break
+            if error is None and self.failure_rate and self._random.random() < self.failure_rate:
+                error = TIOError(message='Injected failure', canRetry=True)
+            latency = self.latency
+            if isinstance(latency, tuple):
+                latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+        if error is not None:
+            raise error
+
+    def create_table(self, name, families=(), splits=(), max_versions=None):
+        # type: (Union[str, bytes], Iterable[Union[str, bytes]], Iterable[Union[str, bytes]], int) -> None
+        """
+        Create a table without a request.
+        Args:
+            name: the table name, 'ns:table' or 'table'.
+            families: the column family names.
+            splits: the split keys of the regions of the table.
+            max_versions: the versions kept by the families, max_versions of the handler by default.
+
+        Returns: None
+
+        """
+        versions = max_versions or self.max_versions
+        with self._lock:
+            self._create(_table_key(name), dict((to_bytes(f), versions) for f in families),
+                         [to_bytes(s) for s in splits])
+
+    def split_region(self, name, key):
+        # type: (Union[str, bytes], Union[str, bytes]) -> None
+        """
+        Split the region of a table containing the key, the key becomes the start key of the second region.
+        """
+        key = to_bytes(key)
+        with self._lock:
+            table = self._get_table(_table_key(name), create=False, enabled=False)
+            if not key or key in table.splits:
+                return
+            i = table.region_of(key)
+            table.splits.insert(i, key)
+            table.region_ids[i:i + 1] = [self._region_id(), self._region_id()]
+
+    def _region_id(self):
+        self._next_region += 1
+        return self._start_code + self._next_region
+
+    def _create(self, key, families, splits):
+        # type: (bytes, Dict[bytes, int], List[bytes]) -> _MemTable
+        if key in self._tables:
+            raise TIOError(message='org.apache.hadoop.hbase.TableExistsException: {}'.format(to_str(key)),
+                           canRetry=False)
+        splits = sorted(set(s for s in splits if s))
+        table = _MemTable(key, families, splits, [self._region_id() for _ in range(len(splits) + 1)])
+        self._tables[key] = table
+        return table
+
+    def _get_table(self, key, create=True, enabled=True):
+        # type: (bytes, bool, bool) -> _MemTable
+        table = self._tables.get(key)
+        if table is None:
+            if not (create and self.auto_create):
+                raise TIOError(message='org.apache.hadoop.hbase.TableNotFoundException: {}'.format(to_str(key)),
+                               canRetry=False)
+            table = self._create(key, {}, [])
+        if enabled and not table.enabled:
+            raise TIOError(message='org.apache.hadoop.hbase.TableNotEnabledException: {}'.format(to_str(key)),
+                           canRetry=False)
+        return table
+
+    def _table(self, table):
+        # type: (bytes) -> _MemTable
+        return self._get_table(_table_key(table))
+
+    def _check_families(self, table, families):
+        # type: (_MemTable, Iterable[bytes]) -> None
+        for family in families:
+            if family in table.families:
+                continue
+            if not self.auto_create:
+                raise TIOError(message='org.apache.hadoop.hbase.regionserver.NoSuchColumnFamilyException: {}'
+                               .format(to_str(family)), canRetry=False)
+            table.families[family] = self.max_versions
+
+    @staticmethod
+    def _write(table, row, family, qualifier, timestamp, value):
+        # type: (_MemTable, bytes, bytes, bytes, int, bytes) -> None
+        cells = table.rows.get(row)
+        if cells is None:
+            cells = table.rows[row] = {}
+            insort(table.keys, row)
+        versions = cells.setdefault((family, qualifier or b''), [])
+        i = 0
+        while i < len(versions) and versions[i][0] > timestamp:
+            i += 1
+        # a write with the timestamp of an existing version replaces it.
+        if i < len(versions) and versions[i][0] == timestamp:
+            versions[i] = (timestamp, value)
+        else:
+            versions.insert(i, (timestamp, value))
+        del versions[table.families[family]:]
+
+    @staticmethod
+    def _read(table, row, columns, timestamp, time_range, max_versions):
+        # type: (_MemTable, bytes, List[TColumn], int, TTimeRange, int) -> TResult
+        cells = table.rows.get(row)
+        if not cells:
+            return TResult(columnValues=[])
+        families, exact = set(), {}
+        for column in columns or []:
+            if column.qualifier is None:
+                families.add(column.family)
+            else:
+                exact[(column.family, column.qualifier)] = column.timestamp
+        values = []
+        for (family, qualifier) in sorted(cells):
+            if columns and family not in families and (family, qualifier) not in exact:
+                continue
+            exact_ts = exact.get((family, qualifier)) if family not in families else None
+            if exact_ts is None:
+                exact_ts = timestamp
+            found = 0
+            for ts, value in cells[(family, qualifier)]:
+                if exact_ts is not None and ts != exact_ts:
+                    continue
+                if time_range is not None and not (time_range.minStamp or 0) <= ts < (time_range.maxStamp or 2 ** 63):
+                    continue
+                values.append(TColumnValue(family=family, qualifier=qualifier, value=value, timestamp=ts))
+                found += 1
+                if found >= (max_versions or 1):
+                    break
+        if not values:
+            return TResult(columnValues=[])
+        return TResult(row=row, columnValues=values)
+
+    def _get(self, table, tget):
+        # type: (_MemTable, TGet) -> TResult
+        if tget.filterString or tget.filterBytes:
+            raise TIllegalArgument(message='Filters are not supported by the in-memory server.')
+        return self._read(table, tget.row, tget.columns, tget.timestamp, tget.timeRange, tget.maxVersions)
+
+    def _put(self, table, tput):
+        # type: (_MemTable, TPut) -> None
+        if not tput.row:
+            raise TIllegalArgument(message='Row length is 0')
+        self._check_families(table, set(cv.family for cv in tput.columnValues or []))
+        timestamp = tput.timestamp if tput.timestamp is not None else _now()
+        for cv in tput.columnValues or []:
+            self._write(table, tput.row, cv.family, cv.qualifier,
+                        cv.timestamp if cv.timestamp is not None else timestamp, cv.value)
+
+    @staticmethod
+    def _delete(table, tdelete):
+        # type: (_MemTable, TDelete) -> None
+        cells = table.rows.get(tdelete.row)
+        if not cells:
+            return
+
+        def prune(key, upto=None, exact=None, latest=False):
+            versions = cells.get(key)
+            if not versions:
+                return
+            if latest:
+                del versions[0]
+            elif exact is not None:
+                versions[:] = [v for v in versions if v[0] != exact]
+            else:
+                versions[:] = [v for v in versions if upto is not None and v[0] > upto]
+
+        if not tdelete.columns:
+            for key in list(cells):
+                prune(key, upto=tdelete.timestamp)
+        for column in tdelete.columns or []:
+            timestamp = column.timestamp if column.timestamp is not None else tdelete.timestamp
+            if column.qualifier is None:
+                for key in [k for k in cells if k[0] == column.family]:
+                    if tdelete.deleteType == TDeleteType.DELETE_FAMILY_VERSION:
+                        prune(key, exact=timestamp)
+                    else:
+                        prune(key, upto=timestamp)
+            elif tdelete.deleteType == TDeleteType.DELETE_COLUMN:
+                # a single version, the one at the timestamp or the latest one.
+                prune((column.family, column.qualifier), exact=timestamp, latest=timestamp is None)
+            else:
+                prune((column.family, column.qualifier), upto=timestamp)
+        for key in [k for k, versions in cells.items() if not versions]:
+            del cells[key]
+        if not cells:
+            table.drop_row(tdelete.row)
+
+    @staticmethod
+    def _matches(table, row, family, qualifier, op, value):
+        # type: (_MemTable, bytes, bytes, bytes, int, bytes) -> bool
+        """
+        Compare the given value to the latest value of a cell, as hbase does. No value checks the cell is absent.
+        """
+        versions = table.rows.get(row, {}).get((family, qualifier or b''))
+        current = versions[0][1] if versions else None
+        if not value:
+            return current is None
+        if current is None:
+            return False
+        cmp = (value > current) - (value < current)
+        return {TCompareOp.LESS: cmp < 0,
+                TCompareOp.LESS_OR_EQUAL: cmp <= 0,
+                TCompareOp.EQUAL: cmp == 0,
+                TCompareOp.NOT_EQUAL: cmp != 0,
+                TCompareOp.GREATER_OR_EQUAL: cmp >= 0,
+                TCompareOp.GREATER: cmp > 0}.get(op, False)
+
+    def _mutate(self, table, trowMutations):
+        # type: (_MemTable, TRowMutations) -> None
+        families = [cv.family for m in trowMutations.mutations if m.put for cv in m.put.columnValues or []]
+        self._check_families(table, families)
+        for mutation in trowMutations.mutations:
+            if mutation.put is not None:
+                self._put(table, mutation.put)
+            if mutation.deleteSingle is not None:
+                self._delete(table, mutation.deleteSingle)
+
+    def _scan(self, table, tscan, after, count):
+        # type: (_MemTable, TScan, Union[None, bytes], int) -> List[TResult]
+        """
+        Read up to count rows of a scan, starting after the given row if it is not None.
+        """
+        if tscan.filterString or tscan.filterBytes:
+            raise TIllegalArgument(message='Filters are not supported by the in-memory server.')
+        keys = table.keys
+        if tscan.reversed:
+            if after is not None:
+                end = bisect_left(keys, after)
+            else:
+                end = bisect_right(keys, tscan.startRow) if tscan.startRow else len(keys)
+            begin = bisect_right(keys, tscan.stopRow) if tscan.stopRow else 0
+            candidates = (keys[i] for i in range(end - 1, begin - 1, -1))
+        else:
+            if after is not None:
+                begin = bisect_right(keys, after)
+            else:
+                begin = bisect_left(keys, tscan.startRow or b'')
+            end = bisect_left(keys, tscan.stopRow) if tscan.stopRow else len(keys)
+            candidates = (keys[i] for i in range(begin, end))
+        results = []
+        for row in candidates:
+            if len(results) >= count:
+                break
+            result = self._read(table, row, tscan.columns, None, tscan.timeRange, tscan.maxVersions)
+            if result.row is not None:
+                results.append(result)
+        return results
+
+    @_served
+    def exists(self, table, tget):
+        with self._lock:
+            return self._get(self._table(table), tget).row is not None
+
+    @_served
+    def existsAll(self, table, tgets):
+        with self._lock:
+            t = self._table(table)
+            return [self._get(t, tget).row is not None for tget in tgets]
+
+    @_served
+    def get(self, table, tget):
+        with self._lock:
+            return self._get(self._table(table), tget)
+
+    @_served
+    def getMultiple(self, table, tgets):
+        with self._lock:
+            t = self._table(table)
+            return [self._get(t, tget) for tget in tgets]
+
+    @_served
+    def put(self, table, tput):
+        with self._lock:
+            self._put(self._table(table), tput)
+
+    @_served
+    def checkAndPut(self, table, row, family, qualifier, value, tput):
+        with self._lock:
+            t = self._table(table)
+            if not self._matches(t, row, family, qualifier, TCompareOp.EQUAL, value):
+                return False
+            self._put(t, tput)
+            return True
+
+    @_served
+    def putMultiple(self, table, tputs):
+        with self._lock:
+            t = self._table(table)
+            for tput in tputs:
+                self._put(t, tput)
+
+    @_served
+    def deleteSingle(self, table, tdelete):
+        with self._lock:
+            self._delete(self._table(table), tdelete)
+
+    @_served
+    def deleteMultiple(self, table, tdeletes):
+        with self._lock:
+            t = self._table(table)
+            for tdelete in tdeletes:
+                self._delete(t, tdelete)
+            return []
+
+    @_served
+    def checkAndDelete(self, table, row, family, qualifier, value, tdelete):
+        with self._lock:
+            t = self._table(table)
+            if not self._matches(t, row, family, qualifier, TCompareOp.EQUAL, value):
+                return False
+            self._delete(t, tdelete)
+            return True
+
+    def _update(self, table, row, columns, update, return_results):
+        # type: (bytes, bytes, list, Callable, bool) -> TResult
+        """
+        Replace the latest values of some cells with update(column, value or None) at the current time.
+        """
+        with self._lock:
+            t = self._table(table)
+            self._check_families(t, set(c.family for c in columns))
+            timestamp = _now()
+            values = []
+            for column in columns:
+                versions = t.rows.get(row, {}).get((column.family, column.qualifier or b''))
+                value = update(column, versions[0][1] if versions else None)
+                # keep the new version the latest even if the clock is behind the former one.
+                ts = max(timestamp, versions[0][0]) if versions else timestamp
+                self._write(t, row, column.family, column.qualifier, ts, value)
+                values.append(TColumnValue(family=column.family, qualifier=column.qualifier, value=value,
+                                           timestamp=ts))
+            if return_results is False:
+                return TResult(columnValues=[])
+            return TResult(row=row, columnValues=values)
+
+    @_served
+    def increment(self, table, tincrement):
+        # type: (bytes, TIncrement) -> TResult
+        def update(column, value):
+            if value is not None and len(value) != 8:
+                raise TIOError(message='org.apache.hadoop.hbase.DoNotRetryIOException: '
+                                       'Field is not a long, it\'s {} bytes wide'.format(len(value)), canRetry=False)
+            current = struct.unpack('>q', value)[0] if value is not None else 0
+            return struct.pack('>q', current + column.amount)
+        return self._update(table, tincrement.row, tincrement.columns, update, tincrement.returnResults)
+
+    @_served
+    def append(self, table, tappend):
+        # type: (bytes, TAppend) -> TResult
+        return self._update(table, tappend.row, tappend.columns, lambda column, value: (value or b'') + column.value,
+                            tappend.returnResults)
+
+    @_served
+    def openScanner(self, table, tscan):
+        with self._lock:
+            self._table(table)
+            self._next_scanner += 1
+            self._scanners[self._next_scanner] = _Scanner(_table_key(table), tscan)
+            return self._next_scanner
+
+    @_served
+    def getScannerRows(self, scannerId, numRows):
+        with self._lock:
+            scanner = self._scanners.get(scannerId)
+            if scanner is None:
+                raise TIllegalArgument(message='Invalid scanner Id')
+            if scanner.scan.limit:
+                numRows = min(numRows, scanner.scan.limit - scanner.returned)
+            results = self._scan(self._get_table(scanner.table, create=False), scanner.scan, scanner.last_row,
+                                 numRows)
+            if results:
+                scanner.last_row = results[-1].row
+                scanner.returned += len(results)
+            return results
+
+    @_served
+    def closeScanner(self, scannerId):
+        with self._lock:
+            if self._scanners.pop(scannerId, None) is None:
+                raise TIllegalArgument(message='Invalid scanner Id')
+
+    @_served
+    def mutateRow(self, table, trowMutations):
+        with self._lock:
+            self._mutate(self._table(table), trowMutations)
+
+    @_served
+    def getScannerResults(self, table, tscan, numRows):
+        with self._lock:
+            if tscan.limit:
+                numRows = min(numRows, tscan.limit)
+            return self._scan(self._table(table), tscan, None, numRows)
+
+    @_served
+    def checkAndMutate(self, table, row, family, qualifier, compareOp, value, rowMutations):
+        with self._lock:
+            t = self._table(table)
+            if not self._matches(t, row, family, qualifier, compareOp, value):
+                return False
+            self._mutate(t, rowMutations)
+            return True
+
+    def _location(self, table, i):
+        # type: (_MemTable, int) -> THRegionLocation
+        bounds = [b''] + table.splits + [b'']
+        host, port = self.servers[i % len(self.servers)] if self.servers else ('localhost', 9090)
+        return THRegionLocation(
+            serverName=TServerName(hostName=host, port=port, startCode=self._start_code),
+            regionInfo=THRegionInfo(regionId=table.region_ids[i], tableName=table.name, startKey=bounds[i],
+                                    endKey=bounds[i + 1], offline=False, split=False, replicaId=0))
+
+    @_served
+    def getRegionLocation(self, table, row, reload):
+        with self._lock:
+            t = self._table(table)
+            return self._location(t, t.region_of(row))
+
+    @_served
+    def getAllRegionLocations(self, table):
+        with self._lock:
+            t = self._table(table)
+            return [self._location(t, i) for i in range(len(t.splits) + 1)]
+
+    @staticmethod
+    def _descriptor(table):
+        # type: (_MemTable) -> TTableDescriptor
+        return TTableDescriptor(tableName=_table_name(table.name),
+                                columns=[TColumnFamilyDescriptor(name=f, maxVersions=v)
+                                         for f, v in sorted(table.families.items())])
+
+    @_served
+    def getTableDescriptor(self, table):
+        with self._lock:
+            return self._descriptor(self._get_table(_table_key(table), create=False, enabled=False))
+
+    @_served
+    def getTableDescriptors(self, tables):
+        with self._lock:
+            return [self._descriptor(self._get_table(_table_key(t), create=False, enabled=False)) for t in tables]
+
+    @_served
+    def tableExists(self, tableName):
+        with self._lock:
+            return _table_key(tableName) in self._tables
+
+    def _names(self, regex):
+        pattern = re.compile(to_str(regex)) if regex else None
+        return [_table_name(key) for key in sorted(self._tables)
+                if pattern is None or pattern.match(to_str(key))]
+
+    @_served
+    def getTableDescriptorsByPattern(self, regex, includeSysTables):
+        with self._lock:
+            return [self._descriptor(self._tables[_table_key(n)]) for n in self._names(regex)]
+
+    @_served
+    def getTableDescriptorsByNamespace(self, name):
+        with self._lock:
+            return [self._descriptor(self._tables[_table_key(n)]) for n in self._names(None) if n.ns == name]
+
+    @_served
+    def getTableNamesByPattern(self, regex, includeSysTables):
+        with self._lock:
+            return self._names(regex)
+
+    @_served
+    def getTableNamesByNamespace(self, name):
+        with self._lock:
+            return [n for n in self._names(None) if n.ns == name]
+
+    @_served
+    def createTable(self, desc, splitKeys):
+        with self._lock:
+            self._create(_table_key(desc.tableName),
+                         dict((c.name, c.maxVersions or MAX_VERSIONS_DEFAULT) for c in desc.columns or []),
+                         list(splitKeys or []))
+
+    def _disabled_table(self, tableName):
+        # type: (TTableName) -> _MemTable
+        table = self._get_table(_table_key(tableName), create=False, enabled=False)
+        if table.enabled:
+            raise TIOError(message='org.apache.hadoop.hbase.TableNotDisabledException: {}'
+                           .format(to_str(table.name)), canRetry=False)
+        return table
+
+    @_served
+    def deleteTable(self, tableName):
+        with self._lock:
+            table = self._disabled_table(tableName)
+            del self._tables[table.name]
+
+    @_served
+    def truncateTable(self, tableName, preserveSplits):
+        with self._lock:
+            table = self._disabled_table(tableName)
+            del self._tables[table.name]
+            self._create(table.name, table.families, table.splits if preserveSplits else [])
+
+    @_served
+    def enableTable(self, tableName):
+        with self._lock:
+            self._get_table(_table_key(tableName), create=False, enabled=False).enabled = True
+
+    @_served
+    def disableTable(self, tableName):
+        with self._lock:
+            self._get_table(_table_key(tableName), create=False, enabled=False).enabled = False
+
+    @_served
+    def isTableEnabled(self, tableName):
+        with self._lock:
+            return self._get_table(_table_key(tableName), create=False, enabled=False).enabled
+
+    @_served
+    def isTableDisabled(self, tableName):
+        with self._lock:
+            return not self._get_table(_table_key(tableName), create=False, enabled=False).enabled
+
+    @_served
+    def isTableAvailable(self, tableName):
+        with self._lock:
+            table = self._tables.get(_table_key(tableName))
+            return table is not None and table.enabled
+
+    @_served
+    def isTableAvailableWithSplit(self, tableName, splitKeys):
+        with self._lock:
+            table = self._tables.get(_table_key(tableName))
+            return table is not None and table.enabled and set(splitKeys or []) <= set(table.splits)
+
+    @_served
+    def addColumnFamily(self, tableName, column):
+        with self._lock:
+            table = self._get_table(_table_key(tableName), create=False, enabled=False)
+            if column.name in table.families:
+                raise TIllegalArgument(message='Column family {} already exists'.format(to_str(column.name)))
+            table.families[column.name] = column.maxVersions or MAX_VERSIONS_DEFAULT
+
+    @_served
+    def deleteColumnFamily(self, tableName, column):
+        with self._lock:
+            table = self._get_table(_table_key(tableName), create=False, enabled=False)
+            if table.families.pop(column, None) is None:
+                raise TIllegalArgument(message='Column family {} does not exist'.format(to_str(column)))
+            for row in list(table.keys):
+                cells = table.rows[row]
+                for key in [k for k in cells if k[0] == column]:
+                    del cells[key]
+                if not cells:
+                    table.drop_row(row)
+
+    @_served
+    def modifyColumnFamily(self, tableName, column):
+        with self._lock:
+            table = self._get_table(_table_key(tableName), create=False, enabled=False)
+            if column.name not in table.families:
+                raise TIllegalArgument(message='Column family {} does not exist'.format(to_str(column.name)))
+            table.families[column.name] = column.maxVersions or MAX_VERSIONS_DEFAULT
+
+    @_served
+    def modifyTable(self, desc):
+        with self._lock:
+            table = self._get_table(_table_key(desc.tableName), create=False, enabled=False)
+            table.families = dict((c.name, c.maxVersions or MAX_VERSIONS_DEFAULT) for c in desc.columns or [])
+
+    @_served
+    def getThriftServerType(self):
+        return TThriftServerType.TWO
+
+
+class LocalServer(object):
+    """
+    Serve a MemoryHandler over TCP from background threads, one thread per connection.
+    The transport and protocol must match the ones of the clients' ClientConfig.
+    A port of 0 picks a free port, read the port attribute after start().
+
+        with LocalServer() as server:
+            client = Client(ClientConfig(thrift_host=server.host, port=server.port))
+    """
+    def __init__(self, handler=None,  # type: Union[None, MemoryHandler]
+                 host='127.0.0.1',  # type: str
+                 port=0,  # type: int
+                 transport_type=TRANSPORT_DEFAULT,  # type: TransportType
+                 protocol_type=PROTOCOL_DEFAULT,  # type: ProtocolType
+                 ):
+        self.handler = handler if handler is not None else MemoryHandler()
+        self.host = host
+        self.port = port
+        self._transport_type = THRIFT_TRANSPORTS[transport_type]
+        self._protocol_type = THRIFT_PROTOCOLS[protocol_type]
+        self._processor = THBaseService.Processor(self.handler)
+        self._socket = None
+        self._thread = None
+        self._stopped = threading.Event()
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        # type: () -> LocalServer
+        """
+        Start listening and serving in background threads.
+        Returns: the server itself.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The server is already started.")
+        self._socket = TSocket.TServerSocket(host=self.host, port=self.port)
+        self._socket.listen()
+        self._socket.handle.settimeout(ACCEPT_TIMEOUT)
+        self.port = self._socket.handle.getsockname()[1]
+        if not self.handler.servers:
+            self.handler.servers = [(self.host, self.port)]
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._serve, name='thbase-local-server-{}'.format(self.port))
+        self._thread.daemon = True
+        self._thread.start()
+        logger.info("In-memory thrift server is serving at {}:{}.".format(self.host, self.port))
+        return self
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                client = self._socket.accept()
+            except socket.timeout:
+                continue
+            except (socket.error, AttributeError):
+                if self._stopped.is_set():
+                    return
+                raise
+            client.handle.settimeout(None)
+            worker = threading.Thread(target=self._handle, args=(client,))
+            worker.daemon = True
+            worker.start()
+
+    def _handle(self, client):
+        # type: (TSocket.TSocket) -> None
+        with self._lock:
+            self._clients.add(client)
+        transport = self._transport_type(client)
+        protocol = self._protocol_type(transport)
+        try:
+            while not self._stopped.is_set():
+                self._processor.process(protocol, protocol)
+        except TTransport.TTransportException:
+            pass
+        except Exception as e:
+            if not self._stopped.is_set():
+                logger.error("The in-memory thrift server failed to serve a connection: {}".format(e))
+        finally:
+            with self._lock:
+                self._clients.discard(client)
+            transport.close()
+
+    def stop(self):
+        """
+        Stop serving and close the connections.
+        Returns: None
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self._socket.close()
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                # unblock the thread reading from the connection.
+                client.handle.shutdown(socket.SHUT_RDWR)
+            except (socket.error, AttributeError):
+                pass
+        logger.info("In-memory thrift server at {}:{} is stopped.".format(self.host, self.port))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run an in-memory HBase thrift2 server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9090)
+    parser.add_argument('--transport', choices=[t.name.lower() for t in TransportType],
+                        default=TRANSPORT_DEFAULT.name.lower())
+    parser.add_argument('--protocol', choices=[p.name.lower() for p in ProtocolType],
+                        default=PROTOCOL_DEFAULT.name.lower())
+    parser.add_argument('--max-versions', type=int, default=MAX_VERSIONS_DEFAULT,
+                        help="versions kept by the column families created on demand")
+    parser.add_argument('--latency', type=float, nargs='+', default=[0],
+                        help="seconds each request takes, or the min and max of a uniform latency")
+    parser.add_argument('--failure-rate', type=float, default=0, help="probability for a request to fail")
+    parser.add_argument('--table', action='append', default=[], metavar='NAME[/FAMILY,...[/SPLIT,...]]',
+                        help="create a table, e.g. t/f1,f2/g,p creates t with families f1, f2 and 3 regions")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if len(args.latency) > 2:
+        parser.error("--latency takes one or two values.")
+    latency = tuple(args.latency) if len(args.latency) == 2 else args.latency[0]
+    handler = MemoryHandler(max_versions=args.max_versions, latency=latency, failure_rate=args.failure_rate,
+                            seed=args.seed)
+    for spec in args.table:
+        parts = spec.split('/')
+        handler.create_table(parts[0], [f for f in parts[1].split(',') if f] if len(parts) > 1 else (),
+                             [s for s in parts[2].split(',') if s] if len(parts) > 2 else ())
+    server = LocalServer(handler, args.host, args.port, TransportType[args.transport.upper()],
+                         ProtocolType[args.protocol.upper()]).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -11,14 +11,26 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from typing import List
-from thbase.thrift2.operation import Get, Put, Delete, Scan
-from thbase.thrift2.cell import Cell
+from collections import deque, namedtuple
+from typing import Callable, Iterator, List, Union
+from thbase.thrift2.operation import Get, Put, Delete, Scan, estimate_size
+from thbase.thrift2.cell import Cell, Row, ResultType
+from thbase.thrift2.resultset import ResultSet
+from thbase.thrift2.batch import BatchResult, OperationStatus
+from thbase.thrift2.mutator import BufferedMutator, MAX_BYTES_DEFAULT, MAX_COUNT_DEFAULT, MAX_LATENCY_DEFAULT
 from thbase.hbase.ttypes import TResult
+from thbase.config import BatchStrategy
 from thbase.util import type_check
-from thbase.util.executor import Executor
-from thbase.util.bytes import to_bytes
+from thbase.util.bytes import to_bytes, to_str
+from thrift.transport.TTransport import TTransportException
+import copy
 import logging
+import threading
+import time
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +45,6 @@ class Table(object):
         self._name = to_bytes(table_name)
         self._client = client
         self.conf = client.conf
-        self.executor = Executor(self.conf.retry_times, self.conf.retry_timeout, master=self._client)
 
     @property
     def name(self):
@@ -51,94 +62,252 @@ class Table(object):
 
         """
         type_check(put, Put)
-        return self.executor.call(lambda: self._client._put_row(table_name=self.name, put=put))
+        return self._client._put_row(table_name=self.name, put=put)
 
-    def put_batch(self, puts):
-        # type: (List[Put]) -> bool
+    def put_batch(self, puts, concurrency=None, detailed=False):
+        # type: (List[Put], Union[None, int], bool) -> Union[bool, BatchResult]
         """
         Send multiple Put requests to the server at one time.
         The requests will be sent batch by batch.
         The logger will log the failed position if one batch of requests failed.
         Args:
             puts: A list of Put objects
+            concurrency: the max number of batches in flight, conf.batch_concurrency by default.
+            More than one needs a connection pool. After a failed batch, the batches already in flight still complete.
+            detailed: if True, return a BatchResult telling the outcome of each Put.
 
-        Returns: True if successes, False otherwise.
+        Returns: True if successes, False otherwise. A BatchResult if detailed is True.
 
         """
         type_check(puts, list)
         for put in puts:
             type_check(put, Put)
-        for i in range(0, len(puts), self.conf.batch_size):
-            result = self._client._put_rows(table_name=self.name, puts=puts[i: i + self.conf.batch_size])
+
+        def send(part):
+            return self._client._put_rows(table_name=self.name, puts=part)
+
+        if detailed:
+            return self._detailed_batch('put', puts, send, concurrency,
+                                        lambda ops: self.put_batch(ops, concurrency, detailed=True))
+        for chunk, result, _ in self._run_batches('put', puts, send, concurrency):
             if not result:
-                logger.error("An error occurs at index {}, the Put requests after {} (inclusive) failed.".format(i, i))
+                logger.error("An error occurs at index {}, the Put requests of this batch and the batches after it "
+                             "are not applied.".format(chunk[0]))
                 return False
         return True
 
-    def get(self, get):
-        # type: (Get) -> List[Cell]
+    def get(self, get, result_type=ResultType.CELL):
+        # type: (Get, ResultType) -> Union[List[Cell], Row, ResultSet, None]
         """
         Send a single Get operation to the thrift server.
         Args:
             get: A customized Get object.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a Row object,
+            ResultType.COLUMNAR to return a ResultSet.
 
-        Returns: If success: a list of cells.
-                 If success but not matched data: an empty list.
-                 If get failed: False.
+        Returns: If success: a list of cells, or a Row with ResultType.ROW, or a ResultSet with ResultType.COLUMNAR.
+                 If success but not matched data: an empty list, or None with ResultType.ROW.
+                 If get failed: an empty list, or None with ResultType.ROW.
 
         """
         type_check(get, Get)
         result = self._client._get_row(table_name=self.name, get=get)
         # if result is False, that means the operation failed after retry N times.
         # if result is [], that means there is no matched cell in hbase.
-        if not result:
+        if result_type == ResultType.ROW:
+            rows = _format_results(self._name, result or [], result_type)
+            return rows[0] if rows else None
+        if not result and result_type == ResultType.CELL:
             return []
-        return self._results_format(result)
+        return _format_results(self._name, result or [], result_type)
 
-    def get_batch(self, gets):
-        # type: (List[Get]) -> List[Cell]
+    def get_batch(self, gets, result_type=ResultType.CELL, concurrency=None, detailed=False):
+        # type: (List[Get], ResultType, Union[None, int], bool) -> Union[List[Cell], List[Row], ResultSet, BatchResult]
         """
         Send multiple Get requests to the server at one time.
         The requests will be sent batch by batch.
         The logger will log the failed position if one batch of requests failed.
         Args:
             gets: A list of Get objects.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a list of Rows,
+            ResultType.COLUMNAR to return a ResultSet. The gets without matched data are skipped in the Rows.
+            concurrency: the max number of batches in flight, conf.batch_concurrency by default.
+            More than one needs a connection pool. The results keep the order of the gets.
+            detailed: if True, return a BatchResult whose results are a list of cells for each Get, or a Row or None
+            with ResultType.ROW. ResultType.COLUMNAR is not supported then.
 
-        Returns: If success: a list of cells.
+        Returns: If success: a list of cells or Rows, or a ResultSet.
                  If success but not matched data: an empty list.
                  If get failed: False.
                  If partly success, a part result will be returned.
+                 A BatchResult if detailed is True.
 
         """
         type_check(gets, (list, tuple))
         for get in gets:
             type_check(get, Get)
-        result_list = []
-        for i in range(0, len(gets), self.conf.batch_size):
-            result = self._client._get_rows(table_name=self.name, gets=gets[i: i + self.conf.batch_size])
+
+        def send(part):
+            return self._client._get_rows(table_name=self.name, gets=part)
+
+        if detailed:
+            if result_type == ResultType.COLUMNAR:
+                raise ValueError("A detailed batch result holds the result of each Get, use ResultType.CELL or "
+                                 "ResultType.ROW.")
+            return self._detailed_batch('get', gets, send, concurrency,
+                                        lambda ops: self.get_batch(ops, result_type, concurrency, detailed=True),
+                                        result_type)
+        # the results are put back in the order of the gets, as the batches may not follow it.
+        slots = [None] * len(gets)
+        for chunk, result, _ in self._run_batches('get', gets, send, concurrency):
             # if result == False, it shows that the operation failed.
             # The task should stop and return the successful part.
             if result is False:
-                return self._results_format(result_list)
-            elif len(result) > 0:
-                result_list += result
-        return self._results_format(result_list)
+                break
+            for i, r in zip(chunk, result):
+                slots[i] = r
+        return _format_results(self._name, [r for r in slots if r is not None], result_type)
 
-    def scan(self, scan):
-        # type: (Scan) -> List[Cell]
+    def scan(self, scan, result_type=ResultType.CELL):
+        # type: (Scan, ResultType) -> Union[List[Cell], List[Row], ResultSet]
         """
         Send a Scan request to the thrift server.
         Args:
             scan: A single Scan object.
+            result_type: ResultType.CELL to return a list of cells, ResultType.ROW to return a list of Rows,
+            ResultType.COLUMNAR to return a ResultSet.
 
-        Returns:If success: a list of cells.
+        Returns:If success: a list of cells or Rows, or a ResultSet.
                  If success but not matched data: an empty list.
                  If the start row do not exists, it will raise an IllegalArgument error.
                  If scan failed: False.
 
         """
         type_check(scan, Scan)
-        return self._results_format(self._client._scan(table_name=self.name, scan=scan))
+        return _format_results(self._name, self._client._scan(table_name=self.name, scan=scan), result_type)
+
+    def scan_iter(self, scan, page_size=None, result_type=ResultType.CELL):
+        # type: (Scan, int, ResultType) -> Iterator[Union[List[Cell], Row]]
+        """
+        Iterate the results of a Scan request row by row.
+        Different from scan(), the rows are fetched page by page through a scanner opened at the thrift server,
+        so only one page of rows is held in memory and the results are not limited by Scan.num_rows.
+        The scanner is always closed when the iteration ends, fails or the generator is closed.
+        Args:
+            scan: A single Scan object.
+            page_size: the number of rows fetched by one request. Use ClientConfig.scan_page_size if it is None.
+            result_type: ResultType.CELL to yield a list of cells for each row, ResultType.ROW to yield Rows.
+
+        Returns: A generator which yields a list of cells or a Row for each row.
+                 If the scanner cannot be opened or a page cannot be fetched, a RuntimeError will be raised.
+
+        """
+        type_check(scan, Scan)
+        if page_size is None:
+            page_size = self.conf.scan_page_size
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("Page size must be a positive integer.")
+        if result_type == ResultType.COLUMNAR:
+            raise ValueError("Iterating a scan yields rows, use scan() to get a ResultSet.")
+        scanner_id = self._client._open_scanner(table_name=self.name, scan=scan)
+        if scanner_id is False:
+            raise RuntimeError("Failed to open a scanner on table {}.".format(to_str(self.name)))
+        try:
+            while True:
+                results = self._client._get_scanner_rows(scanner_id=scanner_id, num_rows=page_size)
+                if results is False:
+                    raise RuntimeError("Failed to fetch rows from scanner {} on table {}."
+                                       .format(scanner_id, to_str(self.name)))
+                if not results:
+                    return
+                for result in results:
+                    yield _format_row(self._name, result, result_type)
+        finally:
+            try:
+                self._client._close_scanner(scanner_id=scanner_id)
+            except Exception as e:
+                # do not hide the exception raised by the iteration itself.
+                logger.warning("Failed to close scanner {} on table {}: {}".format(scanner_id, to_str(self.name), e))
+
+    def parallel_scan(self, scan, workers=None, ordered=False, page_size=None, result_type=ResultType.CELL):
+        # type: (Scan, int, bool, int, ResultType) -> Iterator[Union[List[Cell], Row]]
+        """
+        Iterate the results of a Scan request with one sub-scan per region running in parallel.
+        The range of the scan is split by the region boundaries of the table, and each sub-scan is iterated by
+        scan_iter() on its own pooled connection. Like scan_iter(), the results are not limited by Scan.num_rows.
+        The client must use a connection pool and reversed scans are not supported.
+        Args:
+            scan: A single Scan object.
+            workers: the number of sub-scans running at the same time. Use ClientConfig.pool_max_size if it is None.
+            ordered: if True, the rows are yielded in row key order. Otherwise the rows are yielded as soon as they
+            arrive, which is faster.
+            page_size: the number of rows fetched by one request. Use ClientConfig.scan_page_size if it is None.
+            result_type: ResultType.CELL to yield a list of cells for each row, ResultType.ROW to yield Rows.
+
+        Returns: A generator which yields a list of cells or a Row for each row.
+                 If a sub-scan fails, its exception will be raised and the other sub-scans are stopped.
+
+        """
+        type_check(scan, Scan)
+        if self._client.pool is None:
+            raise RuntimeError("Parallel scan needs a client with connection pool, set use_pool=True in ClientConfig.")
+        if scan.reversed:
+            raise ValueError("Parallel scan does not support reversed scans.")
+        if workers is None:
+            workers = self.conf.pool_max_size
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Workers must be a positive integer.")
+        if page_size is None:
+            page_size = self.conf.scan_page_size
+        locations = self._client.region_locations(self.name)
+        if locations is False:
+            raise RuntimeError("Failed to get the region locations of table {}.".format(to_str(self.name)))
+        ranges = _split_range(scan.row, scan.stop_row,
+                              [(loc.regionInfo.startKey, loc.regionInfo.endKey) for loc in locations])
+        if not ranges:
+            return
+        stop = threading.Event()
+        # bound the rows buffered by each sub-scan to keep the memory flat if the consumer is slow.
+        if ordered:
+            queues = [Queue(maxsize=2 * page_size) for _ in ranges]
+        else:
+            queues = [Queue(maxsize=2 * page_size)] * len(ranges)
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=min(workers, len(ranges)))
+        try:
+            for (start, end), out in zip(ranges, queues):
+                pool.submit(self._scan_range, _sub_scan(scan, start, end), page_size, result_type, out, stop)
+            if ordered:
+                for out in queues:
+                    for row in _drain(out, 1):
+                        yield row
+            else:
+                for row in _drain(queues[0], len(ranges)):
+                    yield row
+        finally:
+            stop.set()
+            pool.shutdown(wait=True)
+
+    def _scan_range(self, scan, page_size, result_type, out, stop):
+        # type: (Scan, int, ResultType, Queue, threading.Event) -> None
+        """
+        Inner util method. Should not be used by user.
+        Iterate a sub-scan of parallel_scan() and put its rows into a queue, followed by a _Done mark.
+        """
+        done = _Done()
+        try:
+            if stop.is_set():
+                return
+            rows = self.scan_iter(scan, page_size, result_type)
+            try:
+                for row in rows:
+                    if not _offer(out, row, stop):
+                        return
+            finally:
+                rows.close()
+        except Exception as e:
+            done.error = e
+        _offer(out, done, stop)
 
     def delete(self, delete):
         # type: (Delete) -> bool
@@ -153,28 +322,216 @@ class Table(object):
         type_check(delete, Delete)
         return self._client._delete_row(table_name=self.name, delete=delete)
 
-    def delete_batch(self, batch):
-        # type: (List[Delete]) -> bool
+    def delete_batch(self, batch, concurrency=None, detailed=False):
+        # type: (List[Delete], Union[None, int], bool) -> Union[bool, BatchResult]
         """
         Send a list of Delete requests to the thrift server.
         The requests will be sent batch by batch.
         The logger will log the failed position if one batch of requests failed.
         Args:
             batch: a list of Delete objects.
+            concurrency: the max number of batches in flight, conf.batch_concurrency by default.
+            More than one needs a connection pool. After a failed batch, the batches already in flight still complete.
+            detailed: if True, return a BatchResult telling the outcome of each Delete.
 
-        Returns: True if successes, False otherwise.
+        Returns: True if successes, False otherwise. A BatchResult if detailed is True.
 
         """
         type_check(batch, (list, tuple))
         for delete in batch:
             type_check(delete, Delete)
-        for i in range(0, len(batch), self.conf.batch_size):
-            if not self._client._delete_batch(table_name=self.name,
-                                              deletes=batch[i: i + self.conf.batch_size]):
-                logger.error("Delete_batch failed at index {}, the delete requests after {} (inclusive) are not sent.".format(i, i))
+
+        def send(part):
+            return self._client._delete_batch(table_name=self.name, deletes=part)
+
+        if detailed:
+            return self._detailed_batch('delete', batch, send, concurrency,
+                                        lambda ops: self.delete_batch(ops, concurrency, detailed=True))
+        for chunk, result, _ in self._run_batches('delete', batch, send, concurrency):
+            # deleteMultiple returns the deletes it failed to apply, an empty list means all of them are applied.
+            if result is False or (isinstance(result, list) and result):
+                logger.error("Delete_batch failed at index {}, the delete requests of this batch and the batches "
+                             "after it are not sent.".format(chunk[0]))
                 return False
         return True
 
+    def _run_batches(self, kind, operations, send, concurrency=None, stop=None):
+        # type: (str, list, Callable[[list], object], Union[None, int], Union[None, threading.Event]) -> Iterator[tuple]
+        """
+        Send a batch of operations request by request, following the batch strategy of the configuration.
+        With BatchStrategy.ADAPTIVE, each request takes as many operations as the current byte budget of this kind of
+        request on the table allows, and its latency tunes the budget. A request rejected with a SIZE_LIMIT error
+        shrinks the budget and is sent again in two halves.
+        With a concurrency above one, up to that number of requests are in flight over the connection pool.
+        Args:
+            kind: the kind of the operations, e.g. 'put'.
+            operations: a list of Put, Get or Delete objects.
+            send: a callable sending a list of operations in one request and returning the result.
+            concurrency: the max number of requests in flight, conf.batch_concurrency by default.
+            stop: if it is given, the exceptions raised by the requests are returned as their errors instead, and no
+            more request is sent once the event is set. The requests in flight are still waited for.
+
+        Returns: a generator of (indexes of the operations of a request, result of the request, error of the request),
+        in the order of the requests. The result is False if the request failed.
+
+        """
+        if concurrency is None:
+            concurrency = self.conf.batch_concurrency
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("Concurrency must be a positive integer.")
+        if concurrency > 1 and self._client.pool is None:
+            raise RuntimeError("Concurrent batches need a connection pool, set use_pool=True in ClientConfig.")
+        sizes = [estimate_size(op) for op in operations]
+        chunks = self._chunks(kind, operations, sizes)
+        capture = stop is not None
+        if concurrency == 1:
+            for chunk in chunks:
+                if capture and stop.is_set():
+                    return
+                for item in self._send_chunk(kind, operations, sizes, chunk, send, capture):
+                    yield item
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque()
+        try:
+            for chunk in chunks:
+                if capture and stop.is_set():
+                    break
+                pending.append(pool.submit(self._send_chunk, kind, operations, sizes, chunk, send, capture))
+                if len(pending) >= concurrency:
+                    for item in pending.popleft().result():
+                        yield item
+            while pending:
+                for item in pending.popleft().result():
+                    yield item
+        finally:
+            # the consumer stopped early, do not send the requests which have not started.
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _chunks(self, kind, operations, sizes):
+        # type: (str, list, List[int]) -> Iterator[List[int]]
+        """
+        Generate the indexes of the operations of each request. With BatchStrategy.ADAPTIVE the budget is read when
+        a request is generated, so it follows the feedback of the former requests.
+        """
+        if self.conf.batch_strategy != BatchStrategy.ADAPTIVE:
+            for chunk in self._split_batch(operations, sizes):
+                yield chunk
+            return
+        batcher, key = self._client.batcher, (self.name, kind)
+        start = 0
+        while start < len(sizes):
+            budget = batcher.budget(key)
+            end, total = start + 1, sizes[start]
+            while end < len(sizes) and total + sizes[end] <= budget:
+                total += sizes[end]
+                end += 1
+            yield list(range(start, end))
+            start = end
+
+    def _send_chunk(self, kind, operations, sizes, chunk, send, capture=False):
+        # type: (str, list, List[int], List[int], Callable[[list], object], bool) -> List[tuple]
+        """
+        Send the operations of a request.
+        If capture is True, an exception raised by the request is returned as its error with a False result.
+        Returns: a list of (indexes, result, error), with more than one item if the request has been split.
+        The error is the last one met by a failed request, None otherwise.
+        """
+        adaptive = self.conf.batch_strategy == BatchStrategy.ADAPTIVE
+        total = sum(sizes[i] for i in chunk)
+        begin = time.time()
+        try:
+            result = send([operations[i] for i in chunk])
+        except Exception as e:
+            if adaptive and isinstance(e, TTransportException) and e.type == TTransportException.SIZE_LIMIT \
+                    and len(chunk) > 1:
+                self._client.batcher.shrink((self.name, kind), total)
+                half = len(chunk) // 2
+                return self._send_chunk(kind, operations, sizes, chunk[:half], send, capture) + \
+                    self._send_chunk(kind, operations, sizes, chunk[half:], send, capture)
+            if not capture:
+                raise
+            return [(chunk, False, e)]
+        if result is False:
+            return [(chunk, False, self._client.last_error)]
+        if adaptive:
+            self._client.batcher.record((self.name, kind), total, time.time() - begin)
+        return [(chunk, result, None)]
+
+    def _detailed_batch(self, kind, operations, send, concurrency, retry, result_type=ResultType.CELL):
+        # type: (str, list, Callable[[list], object], Union[None, int], Callable, ResultType) -> BatchResult
+        """
+        Send a batch of operations and record the outcome of each one.
+        The operations of a failed request are FAILED with its error. No more request is sent after a failure,
+        the operations left are NOT_ATTEMPTED. The requests in flight at the failure still complete and are recorded.
+        Returns: a BatchResult object.
+        """
+        batch = BatchResult(operations, retry=retry)
+        stop = threading.Event()
+        for chunk, result, error in self._run_batches(kind, operations, send, concurrency, stop):
+            if result is False:
+                logger.error("A batch request of {} operations failed at index {}: {}"
+                             .format(len(chunk), chunk[0], error))
+                batch.set(chunk, OperationStatus.FAILED, error)
+                stop.set()
+                continue
+            batch.set(chunk, OperationStatus.SUCCESS)
+            if kind == 'delete' and isinstance(result, list) and result:
+                # deleteMultiple returns the deletes it failed to apply.
+                failed = [i for i in chunk if operations[i].core in result]
+                batch.set(failed, OperationStatus.FAILED)
+            elif kind == 'get':
+                for i, r in zip(chunk, result):
+                    batch.results[i] = _format_row(self._name, r, result_type) if r.row is not None else \
+                        (None if result_type == ResultType.ROW else [])
+        return batch
+
+    def _split_batch(self, operations, sizes):
+        # type: (List[Union[Put, Get, Delete]], List[int]) -> List[List[int]]
+        """
+        Split a batch of operations into the requests to send, following the batch strategy of the configuration.
+        Args:
+            operations: a list of Put, Get or Delete objects.
+            sizes: the estimated sizes of the operations.
+
+        Returns: a list of requests, each one is a list of the indexes of its operations.
+
+        """
+        if self.conf.batch_strategy == BatchStrategy.REGION and operations:
+            if self._client.region_locations(self.name) is not False:
+                groups = {}  # region start key -> indexes, in the order of the first operation of each region
+                for i, op in enumerate(operations):
+                    location = self._client.locate_region(self.name, op.row)
+                    key = location.regionInfo.startKey if location else None
+                    groups.setdefault(key, []).append(i)
+                return [chunk for indexes in groups.values()
+                        for chunk in _split_by_bytes(sizes, indexes, self.conf.batch_bytes)]
+            logger.warning("Failed to get the regions of table {}, split the batch by count."
+                           .format(to_str(self.name)))
+        size = self.conf.batch_size
+        return [list(range(i, min(i + size, len(operations)))) for i in range(0, len(operations), size)]
+
+    def buffered_mutator(self, max_bytes=MAX_BYTES_DEFAULT, max_count=MAX_COUNT_DEFAULT,
+                         max_latency=MAX_LATENCY_DEFAULT, on_error=None):
+        # type: (int, int, Union[int, float], Callable) -> BufferedMutator
+        """
+        Create a BufferedMutator which buffers Put and Delete operations of this table and sends them in batches
+        from a background thread. The mutator should be closed after using, or be used as a context manager.
+        Args:
+            max_bytes: flush when the estimated size of the buffered operations reaches this number of bytes.
+            max_count: flush when this number of operations are buffered.
+            max_latency: flush when the oldest buffered operation has waited this number of seconds.
+            on_error: a callable invoked as on_error(operation, exception) for each failed operation.
+
+        Returns: a BufferedMutator object.
+
+        """
+        return BufferedMutator(self, max_bytes=max_bytes, max_count=max_count, max_latency=max_latency,
+                               on_error=on_error)
+
     def _results_format(self, results):
         # type: (List[TResult]) -> List[Cell]
         """
@@ -187,10 +544,160 @@ class Table(object):
         Returns: an empty list if there is no results or a list of Cell objects.
 
         """
-        result_list = []  # type: List[Cell]
-        if not results or len(results) == 0:
-            return []
-        for result in results:
-            for cv in iter(result.columnValues):
-                result_list.append(Cell(self._name, result.row, cv.family, cv.qualifier, cv.value, cv.timestamp))
-        return result_list
+        return _format_results(self._name, results)
+
+
+def _format_results(table_name, results, result_type=ResultType.CELL):
+    # type: (bytes, List[TResult], ResultType) -> Union[List[Cell], List[Row], ResultSet]
+    """
+    Transform the thrift results to a series of Cell objects, or Row objects with ResultType.ROW,
+    or a ResultSet with ResultType.COLUMNAR.
+    Args:
+        table_name: name of the table the results come from.
+        results: a list of TResult, or of Result of the decoder module.
+        result_type: the type of the returned objects.
+
+    Returns: an empty list if there is no results or a list of Cell or Row objects, or a ResultSet.
+
+    """
+    if result_type == ResultType.COLUMNAR:
+        return ResultSet.from_results(table_name, results)
+    result_list = []  # type: List[Cell]
+    if not results or len(results) == 0:
+        return []
+    if result_type == ResultType.ROW:
+        # a get without matched data returns an empty result.
+        return [Row(table_name, result) for result in results if result.row is not None]
+    for result in results:
+        for cv in iter(result.columnValues):
+            result_list.append(Cell(table_name, result.row, cv.family, cv.qualifier, cv.value, cv.timestamp))
+    return result_list
+
+
+def _format_row(table_name, result, result_type=ResultType.CELL):
+    # type: (bytes, TResult, ResultType) -> Union[List[Cell], Row]
+    """
+    Transform a single thrift result to a list of Cell objects, or a Row object with ResultType.ROW.
+    """
+    if result_type == ResultType.ROW:
+        return Row(table_name, result)
+    return [Cell(table_name, result.row, cv.family, cv.qualifier, cv.value, cv.timestamp)
+            for cv in result.columnValues]
+
+
+class ScannerHandle(namedtuple('ScannerHandle', ['id', 'host', 'port'])):
+    """
+    A scanner opened through a connection pool, with the thrift server it lives on.
+    The scanner only exists at that server, so the following requests of the scanner are sent there.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return '{} at {}:{}'.format(self.id, self.host, self.port)
+
+
+class _Done(object):
+    """
+    The mark put by a sub-scan of parallel_scan() when it ends, carrying the exception if it failed.
+    """
+    def __init__(self):
+        self.error = None
+
+
+def _offer(out, item, stop):
+    # type: (Queue, object, threading.Event) -> bool
+    """
+    Put an item into a bounded queue, giving up if the consumer has stopped.
+    Returns: True if the item is put, False if stopped.
+    """
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _drain(out, producers):
+    # type: (Queue, int) -> Iterator[List[Cell]]
+    """
+    Yield the rows from a queue until all the producers put their _Done marks.
+    Raise the first exception reported by a producer.
+    """
+    while producers > 0:
+        item = out.get()
+        if isinstance(item, _Done):
+            if item.error is not None:
+                raise item.error
+            producers -= 1
+        else:
+            yield item
+
+
+def _split_by_bytes(sizes, indexes, budget):
+    # type: (List[int], List[int], int) -> List[List[int]]
+    """
+    Split the operations at the given indexes into chunks whose estimated sizes are about the budget.
+    A chunk holds at least one operation, even if the operation alone exceeds the budget.
+    Args:
+        sizes: the estimated sizes of all the operations.
+        indexes: the indexes of the operations to split.
+        budget: the bytes of a chunk.
+
+    Returns: a list of chunks, each one is a list of indexes.
+
+    """
+    chunks = []
+    chunk, size = [], 0
+    for i in indexes:
+        op_size = sizes[i]
+        if chunk and size + op_size > budget:
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(i)
+        size += op_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _split_range(start, stop, regions):
+    # type: (Union[None, bytes], Union[None, bytes], List[tuple]) -> List[tuple]
+    """
+    Intersect a scan range with region boundaries.
+    Empty or None keys mean the range is unbounded at that side.
+    Args:
+        start: the inclusive start row of the scan.
+        stop: the exclusive stop row of the scan.
+        regions: a list of (start key, end key) of regions.
+
+    Returns: a list of (start, stop) sub ranges in row key order.
+
+    """
+    start = start or b''
+    stop = stop or b''
+    ranges = []
+    for region_start, region_end in sorted(regions):
+        lo = max(start, region_start or b'')
+        region_end = region_end or b''
+        if stop and region_end:
+            hi = min(stop, region_end)
+        else:
+            hi = stop or region_end
+        if hi and lo >= hi:
+            continue
+        ranges.append((lo, hi))
+    return ranges
+
+
+def _sub_scan(scan, start, stop):
+    # type: (Scan, bytes, bytes) -> Scan
+    """
+    Copy a Scan object with another range.
+    """
+    sub = copy.copy(scan)
+    sub.core = copy.copy(scan.core)
+    sub.row = sub.core.startRow = start or None
+    sub.stop_row = sub.core.stopRow = stop or None
+    return sub
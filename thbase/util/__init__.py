@@ -14,7 +14,7 @@ limitations under the License.
 from thbase.hbase.ttypes import TTableName
 from thbase.util.bytes import to_bytes, to_str
 
-__all__ = ['executor', 'handlers', 'type_check', 'check_none', 'str_to_tablename']
+__all__ = ['executor', 'handlers', 'stubgen', 'type_check', 'check_none', 'str_to_tablename']
 
 DELIMITER = ':'
 
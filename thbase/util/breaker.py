@@ -0,0 +1,164 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from collections import deque
+from enum import Enum
+from thrift.transport.TTransport import TTransportException
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+BreakerState = Enum('BreakerState', ['CLOSED', 'OPEN', 'HALF_OPEN'])
+
+FAILURE_RATE_DEFAULT = 0.5
+WINDOW_SIZE_DEFAULT = 20
+MIN_CALLS_DEFAULT = 5
+COOLDOWN_DEFAULT = 10
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending a request or reconnecting while the circuit breaker is open.
+    """
+    pass
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker guarding the connections to a thrift server.
+    CLOSED: requests pass, the outcomes of the latest window_size connects and requests are recorded.
+    When at least min_calls outcomes are recorded and the rate of failures reaches failure_rate, the breaker opens.
+    OPEN: requests and reconnections fail fast with CircuitOpenError until cooldown seconds have passed.
+    HALF_OPEN: after the cooldown a single thread is let through as a probe. The breaker closes if the probe
+    succeeds, and opens again for another cooldown if it fails. The other threads keep failing fast meanwhile.
+    A breaker is thread-safe and can be shared by all the clients connecting to the same server.
+    Use clone() to get a breaker with the same settings for another server.
+    """
+    def __init__(self, failure_rate=FAILURE_RATE_DEFAULT,  # type: float
+                 window_size=WINDOW_SIZE_DEFAULT,  # type: int
+                 min_calls=MIN_CALLS_DEFAULT,  # type: int
+                 cooldown=COOLDOWN_DEFAULT,  # type: float
+                 ):
+        """
+        Args:
+            failure_rate: the rate of failures in the window at which the breaker opens, in (0, 1].
+            window_size: the number of latest outcomes the failure rate is computed on.
+            min_calls: the min number of outcomes in the window before the breaker can open.
+            cooldown: the seconds the breaker stays open before letting a probe through.
+        """
+        if not isinstance(failure_rate, (int, float)) or not 0 < failure_rate <= 1:
+            raise ValueError("Failure rate must be a number in (0, 1].")
+        if not isinstance(window_size, int) or window_size < 1:
+            raise ValueError("Window size must be a positive integer.")
+        if not isinstance(min_calls, int) or not 1 <= min_calls <= window_size:
+            raise ValueError("Min calls must be an integer in 1~window_size.")
+        if not isinstance(cooldown, (int, float)) or cooldown <= 0:
+            raise ValueError("Cooldown must be a positive number.")
+        self.failure_rate = failure_rate
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state = BreakerState.CLOSED
+        self._window = deque(maxlen=window_size)
+        self._failures = 0
+        self._opened_at = 0
+        self._probe = None
+        self._probe_at = 0
+
+    @property
+    def state(self):
+        # type: () -> BreakerState
+        return self._state
+
+    def clone(self):
+        # type: () -> CircuitBreaker
+        """
+        Create a closed breaker with the same settings, e.g. for another thrift server.
+        """
+        return CircuitBreaker(failure_rate=self.failure_rate, window_size=self.window_size,
+                              min_calls=self.min_calls, cooldown=self.cooldown)
+
+    def check(self):
+        """
+        Check if the current thread can send a request or connect to the server.
+        Raise CircuitOpenError if it cannot.
+        Returns: None
+
+        """
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                return
+            now = time.time()
+            me = threading.current_thread()
+            if self._state == BreakerState.OPEN:
+                if now - self._opened_at < self.cooldown:
+                    raise CircuitOpenError("The circuit breaker is open, the thrift server is considered down.")
+                self._state = BreakerState.HALF_OPEN
+                logger.info("The circuit breaker is half open, probing the thrift server.")
+            elif self._probe is not me and now - self._probe_at < self.cooldown:
+                raise CircuitOpenError("The circuit breaker is half open and the thrift server is being probed.")
+            # a probe which has not reported in cooldown seconds is given up, let another thread probe.
+            if self._probe is not me:
+                self._probe = me
+                self._probe_at = now
+
+    def record_success(self):
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                self._record(False)
+            elif self._probe is threading.current_thread():
+                logger.info("The probe succeeded, the circuit breaker is closed.")
+                self._reset(BreakerState.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                self._record(True)
+                if len(self._window) >= self.min_calls and \
+                        self._failures >= self.failure_rate * len(self._window):
+                    logger.error("{} of the latest {} calls to the thrift server failed, the circuit breaker is open."
+                                 .format(self._failures, len(self._window)))
+                    self._reset(BreakerState.OPEN)
+            elif self._probe is threading.current_thread():
+                logger.error("The probe failed, the circuit breaker is open again.")
+                self._reset(BreakerState.OPEN)
+
+    def record_error(self, error):
+        """
+        Record a failed attempt of a request.
+        A NOT_OPEN error only means the local transport is closed, the reconnection records if the server is
+        reachable. Other transport errors mean a request is lost, while the other errors are answered by the server.
+        """
+        if isinstance(error, TTransportException):
+            if error.type != TTransportException.NOT_OPEN:
+                self.record_failure()
+        else:
+            self.record_success()
+
+    def _record(self, failed):
+        if len(self._window) == self.window_size and self._window[0]:
+            self._failures -= 1
+        self._window.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _reset(self, state):
+        self._state = state
+        self._window.clear()
+        self._failures = 0
+        self._probe = None
+        if state == BreakerState.OPEN:
+            self._opened_at = time.time()
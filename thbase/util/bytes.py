@@ -22,5 +22,7 @@ def to_bytes(origin):
 
 def to_str(origin):
 	if version_info.major == 3:
+		if isinstance(origin, memoryview):
+			return origin.tobytes().decode('utf-8')
 		return origin.decode('utf-8') if isinstance(origin, bytes) else origin
 	return str(origin) if isinstance(origin, bytes) else origin
@@ -14,29 +14,226 @@ limitations under the License.
 from thbase.util.handlers import ExceptionHandler, MessageType
 from thbase.hbase.ttypes import TException
 
+from enum import Enum
+from typing import Union
+import abc
 import logging
+import random
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+Jitter = Enum('Jitter', ['NONE', 'FULL', 'DECORRELATED'])
+
+
+class RetryPolicy(object):
+    """
+    Abstract class deciding if a failed operation should be retried and how long to wait before the retry.
+    A policy object holds no state of a single call, so it can be shared by all the executors and threads.
+    """
+    def __init__(self, max_attempts, deadline=None):
+        """
+        Args:
+            max_attempts: the max number of attempts of an operation, including the first one.
+            deadline: the max number of seconds an operation can spend, including the retries and the waits.
+            None means no deadline.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("Max attempts must be a positive integer.")
+        if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+            raise ValueError("Deadline must be a positive number or None.")
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+
+    @abc.abstractmethod
+    def backoff(self, attempt, last_backoff):
+        """
+        The number of seconds to wait before the next attempt.
+        Args:
+            attempt: the number of attempts done, starting from 1.
+            last_backoff: the seconds waited before the last attempt, 0 before the first retry.
+
+        Returns: the seconds to wait.
+
+        """
+        pass
+
+    def next_backoff(self, attempt, elapsed, last_backoff):
+        """
+        Decide if the operation should be retried after a failed attempt.
+        Args:
+            attempt: the number of attempts done, starting from 1.
+            elapsed: the seconds spent by the operation since its first attempt.
+            last_backoff: the seconds waited before the last attempt, 0 before the first retry.
+
+        Returns: the seconds to wait before the next attempt, or None if the operation should not be retried.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+        backoff = self.backoff(attempt, last_backoff)
+        if self.deadline is not None:
+            remaining = self.deadline - elapsed
+            if remaining <= 0:
+                return None
+            # the retry should still have some time to run after waiting.
+            backoff = min(backoff, remaining / 2.0)
+        return max(backoff, 0)
+
+
+class FixedRetryPolicy(RetryPolicy):
+    """
+    Wait the same interval before every retry.
+    """
+    def __init__(self, max_attempts, interval, deadline=None):
+        """
+        Args:
+            max_attempts: the max number of attempts of an operation, including the first one.
+            interval: the seconds to wait before every retry.
+            deadline: the max number of seconds an operation can spend. None means no deadline.
+        """
+        super(FixedRetryPolicy, self).__init__(max_attempts, deadline)
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise ValueError("Interval must be a non-negative number.")
+        self.interval = interval
+
+    def backoff(self, attempt, last_backoff):
+        return self.interval
+
+
+class ExponentialBackoffRetryPolicy(RetryPolicy):
+    """
+    Wait exponentially longer before each retry, randomized by jitter so that the clients failed at the same time
+    do not retry at the same time.
+    Jitter.NONE: wait min(cap, base * multiplier ^ (attempt - 1)).
+    Jitter.FULL: wait a random time between 0 and the exponential backoff.
+    Jitter.DECORRELATED: wait a random time between base and 3 times the last backoff, capped by cap.
+    """
+    def __init__(self, max_attempts, base=0.05, cap=5, multiplier=2, jitter=Jitter.FULL, deadline=None):
+        """
+        Args:
+            max_attempts: the max number of attempts of an operation, including the first one.
+            base: the seconds to wait before the first retry.
+            cap: the max seconds to wait before a retry.
+            multiplier: the growth factor of the backoff.
+            jitter: a Jitter enum.
+            deadline: the max number of seconds an operation can spend. None means no deadline.
+        """
+        super(ExponentialBackoffRetryPolicy, self).__init__(max_attempts, deadline)
+        if not isinstance(base, (int, float)) or base <= 0:
+            raise ValueError("Base must be a positive number.")
+        if not isinstance(cap, (int, float)) or cap < base:
+            raise ValueError("Cap must be a number not less than base.")
+        if not isinstance(multiplier, (int, float)) or multiplier < 1:
+            raise ValueError("Multiplier must be a number not less than 1.")
+        if not isinstance(jitter, Jitter):
+            raise ValueError("Invalid jitter {}. Use one of the specific enum type {}."
+                             .format(jitter, ', '.join([str(j) for j in Jitter])))
+        self.base = base
+        self.cap = cap
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def backoff(self, attempt, last_backoff):
+        if self.jitter == Jitter.DECORRELATED:
+            return min(self.cap, random.uniform(self.base, max(self.base, last_backoff) * 3))
+        backoff = min(self.cap, self.base * self.multiplier ** (attempt - 1))
+        if self.jitter == Jitter.FULL:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+class AttemptStats(object):
+    """
+    Count the attempts made by the operations of an executor, keyed by the operation name.
+    For each name it keeps the number of calls, the total attempts, the failed calls and the max attempts of a call.
+    The attempts made by the latest operation of the current thread are kept as last_attempts, and the last error
+    it met as last_error.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._local = threading.local()
+
+    def record(self, name, attempts, success, error=None):
+        # type: (str, int, bool, Union[None, Exception]) -> None
+        """
+        Record a finished operation.
+        Args:
+            name: the name of the operation.
+            attempts: the number of attempts made by the operation.
+            success: if the operation succeeded.
+            error: the last error met by a failed operation.
+
+        Returns: None
+
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {'calls': 0, 'attempts': 0, 'failures': 0, 'max_attempts': 0}
+            stats['calls'] += 1
+            stats['attempts'] += attempts
+            stats['max_attempts'] = max(stats['max_attempts'], attempts)
+            if not success:
+                stats['failures'] += 1
+        self._local.last_attempts = attempts
+        self._local.last_error = None if success else error
+
+    @property
+    def last_attempts(self):
+        # type: () -> int
+        return getattr(self._local, 'last_attempts', 0)
+
+    @property
+    def last_error(self):
+        # type: () -> Union[None, Exception]
+        return getattr(self._local, 'last_error', None)
+
+    def snapshot(self):
+        """
+        Returns: a dict mapping the operation names to copies of their counters.
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
 
 class Executor(object):
-    def __init__(self, retry_times, retry_timeout, master):
+    def __init__(self, retry_times, retry_timeout, master, policy=None, breaker=None):
+        """
+        Args:
+            retry_times: the max number of retries, used if policy is None.
+            retry_timeout: the seconds between two retries, used if policy is None.
+            master: the client whose exceptions are handled.
+            policy: a RetryPolicy object. If it is None, a FixedRetryPolicy is built from retry_times and retry_timeout.
+            breaker: a CircuitBreaker object checked before each attempt and fed with the outcome of the attempt.
+        """
         self._retry_times = retry_times
         self._retry_timeout = retry_timeout
         self._master = master
+        self.policy = policy if policy is not None else FixedRetryPolicy(retry_times + 1, retry_timeout)
         self.handler = ExceptionHandler(self._master)
+        self.stats = AttemptStats()
+        self.breaker = breaker
 
-    def call(self, func):
+    def call(self, func, name=None):
         """
         Execute a specific function with given parameters.
         If the system meets an exception the exception handler will try to handle it.
         If the exception is critical and can not be handled, it will be raised and interrupt the system.
         If the exception is acceptable, the system will retry the operation for several times (set in config).
+        The retries are decided by the retry policy.
         After retrying, if the system still cannot get a valid value,
         the function will be marked as failed and return a False.
+        The attempts of the operation are recorded in the stats of the executor.
         Args:
             func: A callable function.
+            name: the name the attempts are recorded with, the name of func by default.
 
         Returns:
             For Put, Delete operations: True if success, False otherwise.
@@ -44,9 +241,19 @@ class Executor(object):
         """
         if not callable(func):
             raise ValueError("A callable function needed here but got {}.".format(type(func)))
-        for i in range(self._retry_times + 1):
+        name = name or getattr(func, '__name__', 'unknown')
+        start = time.time()
+        attempt = 0
+        backoff = 0
+        while True:
+            attempt += 1
             try:
+                if self.breaker is not None:
+                    self.breaker.check()
                 result = func()
+                self.stats.record(name, attempt, True)
+                if self.breaker is not None:
+                    self.breaker.record_success()
                 # if result is None, the func is Put, or Delete, or putMultiple.
                 # so should return a bool to represent if the operation successes.
                 # if reulst is an empty list, the func is deleteMultiple.
@@ -56,13 +263,30 @@ class Executor(object):
                 # Scan operation. so here return the list directly.
                 return result
             except TException as e:
+                self._record_breaker(e)
                 if not self.handler.handle(MessageType.ERROR, value=e):
+                    self.stats.record(name, attempt, False, e)
                     logger.error("There occurs an error that can not be handled. {}. "
                                  "System is shutdown.".format(e.message))
                     raise e
-                else:
-                    logger.warn("An error occurs, {}. Redo the operation after {} seconds.".
-                                format(e.message, self._retry_timeout))
-            time.sleep(self._retry_timeout)
+                if self.breaker is not None:
+                    # fail fast instead of waiting for the next attempt if the breaker is open.
+                    self.breaker.check()
+                backoff = self.policy.next_backoff(attempt, time.time() - start, backoff)
+                if backoff is None:
+                    self.stats.record(name, attempt, False, e)
+                    logger.error("An error occurs, {}. The operation failed after {} attempts.".
+                                 format(e.message, attempt))
+                    break
+                logger.warning("An error occurs, {}. Redo the operation after {} seconds.".
+                               format(e.message, backoff))
+            time.sleep(backoff)
         # this False means the operation failed after retry N times.
         return False
+
+    def _record_breaker(self, error):
+        """
+        Feed the circuit breaker with a failed attempt.
+        """
+        if self.breaker is not None:
+            self.breaker.record_error(error)
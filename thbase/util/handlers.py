@@ -34,6 +34,16 @@ class Observer(object):
 MessageType = Enum('MessageType', ["ERROR"])
 
 
+def is_connection_lost(error):
+    # type: (TTransportException) -> bool
+    """
+    Check if a transport error means the thrift server closed the connection or the socket broke in the middle of a
+    request, e.g. the server died.
+    """
+    return error.type == TTransportException.END_OF_FILE or \
+        (error.type == TTransportException.UNKNOWN and isinstance(getattr(error, 'inner', None), OSError))
+
+
 class ExceptionHandler(Observer):
     """
     This class responses to all exceptions that caught in the client operations,
@@ -75,8 +85,14 @@ class ExceptionHandler(Observer):
                 if value.type == TTransportException.NOT_OPEN or value.type == TTransportException.TIMED_OUT:
                     logger.warning("A transport error occurs, the message is: {}".format(value.message))
                     logger.warning("System will try to rebuild the connection to solve it.")
-                    self.target.connection._reconnect()
-                    self.target._refresh_client()
+                    self.target._reconnect()
+                    return True
+                if is_connection_lost(value) and getattr(self.target, 'balancer', None) is not None:
+                    # with multiple thrift servers, the retry fails over to another one.
+                    logger.warning("The connection to the thrift server is lost, the message is: {}"
+                                   .format(value.message))
+                    logger.warning("System will retry the request on another thrift server.")
+                    self.target._reconnect(lost=True)
                     return True
                 if value.type == TTransportException.ALREADY_OPEN:
                     logger.error("A transport error occurs. The message is: {}".format(value.message))
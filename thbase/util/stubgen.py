@@ -0,0 +1,127 @@
+"""
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Generate the client-only service module thbase/hbase/THBaseClient.py from the thrift generated
+thbase/hbase/THBaseService.py. Rerun it whenever THBaseService.py is regenerated, e.g.
+    python -m thbase.util.stubgen
+"""
+from typing import List, Tuple
+import argparse
+import ast
+import os
+import sys
+
+# the RPCs sent by thbase.thrift2.client and thbase.thrift2.aio.
+CLIENT_METHODS = (
+    'closeScanner', 'createTable', 'deleteMultiple', 'deleteSingle', 'deleteTable', 'disableTable', 'enableTable',
+    'get', 'getAllRegionLocations', 'getMultiple', 'getRegionLocation', 'getScannerResults', 'getScannerRows',
+    'getTableDescriptor', 'getUserPermission', 'grant', 'isTableEnabled', 'modifyColumnFamily', 'modifyTable',
+    'openScanner', 'put', 'putMultiple', 'revoke', 'tableExists', 'truncateTable',
+)
+
+_HBASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hbase')
+SOURCE_DEFAULT = os.path.join(_HBASE_DIR, 'THBaseService.py')
+TARGET_DEFAULT = os.path.join(_HBASE_DIR, 'THBaseClient.py')
+
+_BANNER = """# Generated by python -m thbase.util.stubgen from THBaseService.py, DO NOT EDIT.
+#
+# A client-only subset of THBaseService: the Client class with the RPCs used by thbase and their
+# *_args/*_result structs, without the Iface, the Processor and the structs of the other RPCs.
+#
+"""
+
+
+def _span(lines, node):
+    # type: (List[str], ast.AST) -> List[str]
+    return lines[node.lineno - 1:node.end_lineno]
+
+
+def _subject(node):
+    """
+    The name of the struct a top level statement of the service module is about, e.g. put_args for
+    'class put_args', 'all_structs.append(put_args)' and 'put_args.thrift_spec = (...)'.
+    """
+    if isinstance(node, ast.ClassDef):
+        return node.name
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call) and node.value.args \
+            and isinstance(node.value.args[0], ast.Name):
+        return node.value.args[0].id
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Attribute) \
+            and isinstance(node.targets[0].value, ast.Name):
+        return node.targets[0].value.id
+    return None
+
+
+def generate(source, methods=CLIENT_METHODS):
+    # type: (str, Tuple[str, ...]) -> str
+    """
+    Generate the client-only service module.
+    Args:
+        source: the code of the thrift generated service module.
+        methods: the RPCs to keep.
+
+    Returns: the code of the client-only module.
+
+    """
+    if sys.version_info < (3, 8):
+        raise RuntimeError("Generating the client-only stubs needs python 3.8+.")
+    lines = source.splitlines()
+    tree = ast.parse(source)
+    classes = dict((node.name, node) for node in tree.body if isinstance(node, ast.ClassDef))
+    for name in ('Iface', 'Client'):
+        if name not in classes:
+            raise ValueError("The service module has no {} class.".format(name))
+    client = dict((node.name, node) for node in classes['Client'].body if isinstance(node, ast.FunctionDef))
+    missing = [m for m in methods if m not in client]
+    if missing:
+        raise ValueError("The service has no RPC {}.".format(', '.join(missing)))
+
+    # the imports and the all_structs list before the Iface class, the server side import dropped.
+    header = [line for line in lines[:classes['Iface'].lineno - 1] if 'TProcessor' not in line]
+    comment = header.index('')
+    out = header[:comment] + _BANNER.splitlines() + header[comment:]
+    out.append('METHODS = {!r}'.format(tuple(methods)))
+    out += ['', '', 'class Client(object):']
+    out += _span(lines, client['__init__'])
+    for method in methods:
+        for name in (method, 'send_' + method, 'recv_' + method):
+            if name in client:
+                out.append('')
+                out += _span(lines, client[name])
+    structs = set(m + suffix for m in methods for suffix in ('_args', '_result'))
+    for node in tree.body:
+        if _subject(node) in structs:
+            if isinstance(node, ast.ClassDef):
+                out += ['', '']
+            out += _span(lines, node)
+    out += ['fix_spec(all_structs)', 'del all_structs', '']
+    return '\n'.join(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thbase.util.stubgen',
+                                     description="Generate the client-only thrift service module.")
+    parser.add_argument('--source', default=SOURCE_DEFAULT, help="the thrift generated service module")
+    parser.add_argument('--target', default=TARGET_DEFAULT, help="the client-only module to write")
+    parser.add_argument('--method', nargs='+', default=list(CLIENT_METHODS), help="the RPCs to keep")
+    args = parser.parse_args(argv)
+    with open(args.source) as f:
+        code = generate(f.read(), tuple(args.method))
+    with open(args.target, 'w') as f:
+        f.write(code)
+    print("Wrote {} RPCs to {}.".format(len(args.method), args.target))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())